@@ -0,0 +1,100 @@
+"""Benchmark decode audio
+
+Mengukur waktu decode per file untuk setiap mode decode pada
+`functions.load_audio` dibandingkan dengan mode "default" (librosa.load,
+perilaku sebelumnya).
+
+Contoh:
+    $ python benchmarks/bench_decode.py ./data/music --duration 30
+    $ python benchmarks/bench_decode.py --synthetic 8
+
+Jika tidak ada file audio yang diberikan, file MP3/WAV sintetis (stereo,
+44.1 kHz, 60 detik) dibuat di folder sementara.
+"""
+
+import argparse, json, os, sys, tempfile, time
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from functions import DECODE_MODES, load_audio
+
+AUDIO_EXT = (".mp3", ".wav", ".flac", ".ogg")
+
+def synthetic_files(dirname, n, seconds= 60, sr= 44100):
+    """Buat file audio sintetis (nada + noise, stereo)"""
+    rng = np.random.default_rng(42)
+    t = np.arange(seconds * sr) / sr
+    paths = []
+    for i in range(n):
+        y = .3 * np.sin(2 * np.pi * (220 + 40 * i) * t) + .05 * rng.standard_normal(len(t))
+        y = np.stack([y, np.roll(y, 100)], axis= 1).astype(np.float32)
+        ext = "mp3" if "MP3" in sf.available_formats() and i % 2 == 0 else "wav"
+        path = os.path.join(dirname, f"synthetic_{i}.{ext}")
+        sf.write(path, y, sr)
+        paths.append(path)
+    return paths
+
+def collect(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files += [
+                    os.path.join(root, name) for name in sorted(names)
+                    if name.lower().endswith(AUDIO_EXT)
+                ]
+        else:
+            files.append(path)
+    return files
+
+def bench(files, duration, offset, repeat):
+    result = {}
+    for mode in DECODE_MODES:
+        load_audio(files[0], duration= duration, offset= offset, decode= mode) # warm-up
+        times = []
+        for filepath in files:
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                load_audio(filepath, duration= duration, offset= offset, decode= mode)
+                best = min(best, time.perf_counter() - start)
+            times.append(best)
+        result[mode] = {
+            "mean_ms": float(np.mean(times) * 1000),
+            "median_ms": float(np.median(times) * 1000)
+        }
+
+    base = result["default"]["mean_ms"]
+    for mode in result:
+        result[mode]["speedup"] = base / result[mode]["mean_ms"]
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("paths", nargs= "*", help= "file atau folder audio")
+    parser.add_argument("--duration", type= float, default= 30)
+    parser.add_argument("--offset", type= float, default= 0)
+    parser.add_argument("--repeat", type= int, default= 3)
+    parser.add_argument("--limit", type= int, default= 50, help= "jumlah file maksimum")
+    parser.add_argument("--synthetic", type= int, default= 4, help= "jumlah file sintetis")
+    parser.add_argument("--json", action= "store_true", help= "cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = collect(args.paths)[:args.limit] or synthetic_files(tmp, args.synthetic)
+        result = bench(files, args.duration, args.offset, args.repeat)
+
+    if args.json:
+        print(json.dumps({"files": len(files), "modes": result}, indent= 1))
+        return
+
+    print(f"{len(files)} file, duration={args.duration}s, offset={args.offset}s")
+    print(f"{'mode':<10}{'mean (ms)':>12}{'median (ms)':>14}{'speedup':>10}")
+    for mode, r in result.items():
+        print(f"{mode:<10}{r['mean_ms']:>12.1f}{r['median_ms']:>14.1f}{r['speedup']:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
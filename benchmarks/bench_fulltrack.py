@@ -0,0 +1,84 @@
+"""Benchmark ekstraksi full track dengan memori terbatas
+
+Membuat lagu sintetis (44.1 kHz stereo) dengan beberapa panjang, lalu
+mengukur waktu dan memori puncak (tracemalloc) `_ekstraksi_stream` untuk
+setiap batas memori. Memori puncak seharusnya tidak bertambah dengan
+panjang lagu dan tetap di bawah batas. Untuk lagu terpendek, fitur juga
+dibandingkan dengan ekstraksi seluruh sinyal sekaligus
+(`_ekstraksi_file`).
+
+Contoh:
+    $ python benchmarks/bench_fulltrack.py
+    $ python benchmarks/bench_fulltrack.py --minutes 1 10 30 --limits 16 64 --json
+"""
+
+import argparse, json, os, sys, tempfile, time, tracemalloc
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from bench_suite import _mixed
+from functions import _ekstraksi_file, _ekstraksi_stream
+
+SR = 44100
+STATS = ("mfcc_std", "centroid", "rolloff", "chroma")
+
+def track(path, minutes, block= 30):
+    """Tulis lagu sintetis stereo per blok `block` detik"""
+    rng = np.random.default_rng(0)
+    with sf.SoundFile(path, "w", SR, 2) as f:
+        for _ in range(int(np.ceil(minutes * 60 / block))):
+            y = .4 * _mixed(rng, block * SR)
+            f.write(np.stack([y, np.roll(y, 64)], axis= 1).astype(np.float32))
+    return path
+
+def bench(root, minutes, limits):
+    # import modul (lazy) dan kompilasi numba di luar pengukuran
+    _ekstraksi_stream(track(os.path.join(root, "warmup.wav"), .5), 13, stats= STATS)
+    results = []
+    for length in minutes:
+        path = track(os.path.join(root, f"track_{length:g}m.wav"), length)
+        for limit in limits:
+            tracemalloc.start()
+            start = time.perf_counter()
+            _, seconds = _ekstraksi_stream(path, 13, stats= STATS, memory_limit= limit)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append({
+                "menit": length, "batas_mib": limit, "audio_s": seconds,
+                "waktu_s": elapsed, "puncak_mib": peak / 1024 ** 2
+            })
+
+    path = os.path.join(root, f"track_{min(minutes):g}m.wav")
+    full, _ = _ekstraksi_file(path, 24 * 3600, 13, stats= STATS)
+    stream, _ = _ekstraksi_stream(path, 13, stats= STATS, memory_limit= min(limits))
+    error = float(np.max(np.abs(full - stream) / (np.abs(full) + 1e-3)))
+    return results, error
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("--minutes", type= float, nargs= "+", default= [1, 5, 15], help= "panjang lagu (menit)")
+    parser.add_argument("--limits", type= float, nargs= "+", default= [16, 64], help= "batas memori (MiB)")
+    parser.add_argument("--json", action= "store_true", help= "cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results, error = bench(tmp, args.minutes, args.limits)
+
+    if args.json:
+        print(json.dumps({"results": results, "galat_relatif_maks": error}, indent= 1))
+        return
+    print(f"{'menit':>6}{'batas (MiB)':>13}{'waktu (s)':>11}{'x realtime':>12}{'puncak (MiB)':>14}")
+    for r in results:
+        print(
+            f"{r['menit']:>6g}{r['batas_mib']:>13g}{r['waktu_s']:>11.2f}"
+            f"{r['audio_s'] / r['waktu_s']:>12.0f}{r['puncak_mib']:>14.1f}"
+        )
+    print(f"galat relatif maks. terhadap ekstraksi seluruh sinyal: {error:.2e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark validasi out-of-bag terhadap KFold
+
+Membandingkan waktu dan metrics `basic_model` dan `tuned_model` dengan
+`validation= "kfold"` dan `validation= "oob"` pada matriks fitur
+sintetis (kelas dengan pusat acak dan noise) untuk beberapa jumlah
+sampel. Rasio waktu fit KFold/OOB juga dilaporkan sebagai pembanding
+perkiraan (K - 1) yang ditampilkan di halaman Klasifikasi.
+
+Contoh:
+    $ python benchmarks/bench_oob.py
+    $ python benchmarks/bench_oob.py --samples 500 2000 --K 5 10 --json
+"""
+
+import argparse, json, os, sys, time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from functions import basic_model, tuned_model
+
+GRID = [["gini", "entropy"], [None], [50, 100], ["sqrt"], [2]]
+
+def dataset(n_samples, n_features= 26, n_classes= 10, seed= 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_classes, n_features))
+    y = rng.integers(0, n_classes, n_samples)
+    X = centers[y] + 1.5 * rng.standard_normal((n_samples, n_features))
+    return X.astype(np.float32), np.array([f"g{i}" for i in y], dtype= object)
+
+def bench(samples, Ks):
+    X, y = dataset(64)
+    basic_model.__wrapped__(X, y, K= 2, n_estimators= 10) # import modul (lazy)
+
+    results = []
+    for n in samples:
+        X, y = dataset(n)
+        for K in Ks:
+            for name, func in [
+                ("basic_model", lambda v: basic_model.__wrapped__(X, y, K= K, validation= v)),
+                ("tuned_model", lambda v: tuned_model.__wrapped__(X, y, GRID, K= K, validation= v))
+            ]:
+                row = {"fungsi": name, "n": n, "K": K}
+                for validation in ["kfold", "oob"]:
+                    start = time.perf_counter()
+                    score, _ = func(validation)
+                    row[f"{validation}_s"] = time.perf_counter() - start
+                    row[f"{validation}_fit_s"] = score.attrs["validasi"]["waktu_fit"]
+                    row[f"{validation}_akurasi"] = float(score["akurasi"][0])
+                    row[f"{validation}_f1"] = float(score["f1-score"][0])
+                row["rasio_fit"] = row["kfold_fit_s"] / row["oob_fit_s"]
+                row["percepatan"] = row["kfold_s"] / row["oob_s"]
+                results.append(row)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("--samples", type= int, nargs= "+", default= [500, 2000])
+    parser.add_argument("--K", type= int, nargs= "+", default= [5])
+    parser.add_argument("--json", action= "store_true", help= "cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    results = bench(args.samples, args.K)
+    if args.json:
+        print(json.dumps(results, indent= 1))
+        return
+    print(
+        f"{'fungsi':<13}{'n':>6}{'K':>4}{'kfold (s)':>11}{'oob (s)':>9}"
+        f"{'percepatan':>12}{'rasio fit':>11}{'akurasi kfold/oob':>20}"
+    )
+    for r in results:
+        print(
+            f"{r['fungsi']:<13}{r['n']:>6}{r['K']:>4}{r['kfold_s']:>11.2f}"
+            f"{r['oob_s']:>9.2f}{r['percepatan']:>12.1f}{r['rasio_fit']:>11.1f}"
+            f"{r['kfold_akurasi']:>11.3f}/{r['oob_akurasi']:.3f}"
+        )
+
+if __name__ == "__main__":
+    main()
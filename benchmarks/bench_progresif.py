@@ -0,0 +1,84 @@
+"""Benchmark prediksi progresif (berhenti lebih awal)
+
+Membandingkan latensi dan akurasi `prediksi_progresif` pada beberapa
+ambang probabilitas dengan jalur tetap `prediksi_musik` (decode
+`duration` penuh), lihat `evaluasi_progresif`.
+
+Tanpa `--model`, dataset sintetis dari `bench_suite.py` dibuat, model
+dilatih pada separuh file dan dievaluasi pada separuh lainnya. Dengan
+`--model`, artefak model dievaluasi pada daftar musik `--list` (gunakan
+file yang tidak dipakai saat pelatihan agar akurasi tidak bias).
+
+Contoh:
+    $ python benchmarks/bench_progresif.py
+    $ python benchmarks/bench_progresif.py --model ./data/model/model.joblib --list ./data/dataframe/holdout.csv
+    $ python benchmarks/bench_progresif.py --windows 3 5 10 --thresholds 0.6 0.8 --output progresif.json
+"""
+
+import argparse, json, os, sys, tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from bench_suite import fixtures
+from functions import (
+    _ekstraksi_file, evaluasi_progresif, fitur_columns, get_csv, get_musik,
+    muat_model, simpan_model
+)
+
+def synthetic(root, n_files, duration):
+    """Artefak model dan daftar file uji dari dataset sintetis"""
+    df = get_musik(fixtures(os.path.join(root, "music"), n_files, duration + 2))
+    train, test = df.iloc[::2], df.iloc[1::2]
+    features = np.array([
+        _ekstraksi_file(fp, duration, 13)[0] for fp in train["filepath"]
+    ])
+    schema = {
+        "duration": duration, "coef": 13, "offset": 0.0, "decode": "default",
+        "stats": [], "columns": fitur_columns(13)
+    }
+    artifact = simpan_model(
+        features, train["genre"].to_numpy(dtype= object), {}, schema,
+        path= os.path.join(root, "model.joblib")
+    )
+    return artifact, test
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("--model", default= None, help= "artefak model (.joblib)")
+    parser.add_argument("--list", default= None, help= "daftar musik uji (filepath, filename, genre)")
+    parser.add_argument("--files", type= int, default= 32, help= "jumlah file sintetis")
+    parser.add_argument("--duration", type= float, default= 30, help= "durasi penuh model sintetis (detik)")
+    parser.add_argument("--windows", type= float, nargs= "+", default= [5, 10, 20])
+    parser.add_argument("--thresholds", type= float, nargs= "+", default= [.5, .6, .7, .8, .9])
+    parser.add_argument("--output", default= None, help= "tulis hasil ke file JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.model:
+            artifact = muat_model(args.model)
+            if artifact is None:
+                sys.exit(f"Model tidak ditemukan: {args.model}")
+            test = get_csv(args.list or "./data/dataframe/list-musik.csv")
+        else:
+            artifact, test = synthetic(tmp, args.files, args.duration)
+
+        report = evaluasi_progresif(
+            test["filepath"], test["genre"], artifact,
+            windows= tuple(args.windows), thresholds= tuple(args.thresholds)
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "files": len(test), "duration": artifact["schema"]["duration"],
+                "windows": args.windows, "report": report.to_dict("records")
+            }, f, indent= 1)
+
+    print(f"{len(test)} file, jalur tetap {artifact['schema']['duration']:g} detik")
+    print(report.to_string(index= False, float_format= "{:.3f}".format))
+
+if __name__ == "__main__":
+    main()
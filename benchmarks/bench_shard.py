@@ -0,0 +1,130 @@
+"""Benchmark ekstraksi per shard dengan beberapa proses sebagai node
+
+Membuat dataset sintetis dari `bench_suite.py`, lalu menjalankan
+`cli.py extract-shard` untuk setiap shard sebagai proses terpisah
+(masing-masing dengan nama worker sendiri, seperti mesin berbeda yang
+berbagi filesystem) dan menggabungkan hasilnya dengan
+`cli.py merge-shards`. Hasil gabungan dibandingkan dengan ekstraksi
+satu proses (`ekstraksi_fitur_mfcc`), dan validasi gabungan diuji
+dengan shard yang hilang dan shard ganda.
+
+Contoh:
+    $ python benchmarks/bench_shard.py
+    $ python benchmarks/bench_shard.py --files 64 --shards 4 --duration 10
+
+Program keluar dengan status 1 jika hasil gabungan berbeda dari
+ekstraksi satu proses atau validasi tidak mendeteksi shard yang rusak.
+"""
+
+import argparse, glob, json, os, shutil, subprocess, sys, tempfile, time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from bench_suite import fixtures
+from functions import ekstraksi_fitur_mfcc, gabung_shard, get_musik
+
+CLI = os.path.join(os.path.dirname(__file__), "..", "src", "cli.py")
+
+def cli(*args):
+    out = subprocess.run(
+        [sys.executable, CLI, *map(str, args)], capture_output= True, text= True
+    )
+    return out.returncode, json.loads(out.stdout)
+
+def bench(root, n_files, n_shards, duration):
+    df = get_musik(fixtures(os.path.join(root, "music"), n_files, duration))
+    listing = os.path.join(root, "list-musik.csv")
+    df.to_csv(listing, index= False)
+    shard_dir = os.path.join(root, "shards")
+
+    start = time.perf_counter()
+    single = ekstraksi_fitur_mfcc.__wrapped__(df, duration= duration, coef= 13)
+    single_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    nodes = [
+        subprocess.Popen(
+            [
+                sys.executable, CLI, "extract-shard", "--list", listing,
+                "--duration", str(duration), "--shards", str(n_shards),
+                "--shard", str(i), "--worker", f"node{i}", "--dir", shard_dir
+            ], stdout= subprocess.PIPE, text= True
+        ) for i in range(n_shards)
+    ]
+    shards = [json.loads(node.communicate()[0]) for node in nodes]
+    extract_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    status, merged = cli(
+        "merge-shards", "--list", listing, "--shards", n_shards,
+        "--dir", shard_dir, "--output", os.path.join(root, "merged")
+    )
+    merge_s = time.perf_counter() - start
+    if status:
+        return {"error": merged["error"]}
+
+    features = np.load(os.path.join(root, "merged.npy"))
+    with open(os.path.join(root, "merged.json")) as f:
+        meta = json.load(f)
+    same_order = meta["filenames"] == single["filename"].tolist()
+    diff = float(np.abs(features - single.iloc[:, 1:-1].to_numpy(dtype= np.float32)).max()) \
+        if same_order else None
+
+    # validasi: shard hilang dan shard ganda harus ditolak
+    first = sorted(glob.glob(os.path.join(shard_dir, "shard-0000-*")))
+    for path in first:
+        shutil.copy(path, path.replace(".node0", ".spare"))
+    checks = {}
+    try:
+        gabung_shard(df, n_shards, shard_dir)
+    except ValueError as e:
+        checks["ganda"] = "ganda" in str(e)
+    for path in first:
+        os.remove(path)
+        os.remove(path.replace(".node0", ".spare"))
+    try:
+        gabung_shard(df, n_shards, shard_dir)
+    except ValueError as e:
+        checks["hilang"] = "hilang" in str(e)
+
+    return {
+        "files": len(df), "shards": n_shards,
+        "files_per_shard": [s["files"] for s in shards],
+        "single_s": single_s, "shard_s": extract_s, "merge_s": merge_s,
+        "same_order": same_order, "max_abs_diff": diff,
+        "detected": {name: checks.get(name, False) for name in ["ganda", "hilang"]}
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("--files", type= int, default= 32)
+    parser.add_argument("--shards", type= int, default= 4)
+    parser.add_argument("--duration", type= float, default= 10)
+    parser.add_argument("--json", action= "store_true", help= "cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        result = bench(tmp, args.files, args.shards, args.duration)
+
+    ok = (
+        "error" not in result and result["same_order"]
+        and result["max_abs_diff"] < 1e-4 and all(result["detected"].values())
+    )
+    if args.json:
+        print(json.dumps(result, indent= 1))
+    elif "error" in result:
+        print(result["error"])
+    else:
+        print(f"{result['files']} file, {result['shards']} shard {result['files_per_shard']}")
+        print(f"{'satu proses':<22}{result['single_s']:>8.2f} s")
+        print(f"{'shard (paralel)':<22}{result['shard_s']:>8.2f} s")
+        print(f"{'gabung':<22}{result['merge_s']:>8.2f} s")
+        print(f"urutan sama: {result['same_order']}, selisih maks.: {result['max_abs_diff']}")
+        print(f"validasi terdeteksi: {result['detected']}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
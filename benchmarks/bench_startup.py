@@ -0,0 +1,102 @@
+"""Benchmark waktu startup aplikasi
+
+Mengukur waktu import `functions` dan waktu render pertama halaman
+Beranda (`streamlit.testing.v1.AppTest`) pada proses Python baru,
+seperti cold start container. Modul berat yang sudah ter-import setelah
+startup ikut dilaporkan.
+
+Contoh:
+    $ python benchmarks/bench_startup.py
+    $ python benchmarks/bench_startup.py --repeat 5 --budget 0.5 --render-budget 3 --json
+
+Jika waktu median melebihi `--budget` atau `--render-budget` (detik),
+program keluar dengan status 1.
+"""
+
+import argparse, json, os, statistics, subprocess, sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+HEAVY = ("numpy", "pandas", "scipy", "sklearn", "librosa", "soundfile", "joblib")
+
+IMPORT_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, "src")
+start = time.perf_counter()
+import streamlit
+mid = time.perf_counter()
+import functions
+end = time.perf_counter()
+print(json.dumps({
+    "streamlit": mid - start, "functions": end - mid,
+    "heavy": [m for m in %r if m in sys.modules]
+}))
+"""
+
+RENDER_SCRIPT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(%r, default_timeout= 60)
+start = time.perf_counter()
+at.run()
+end = time.perf_counter()
+print(json.dumps({
+    "render": end - start, "exceptions": [e.value for e in at.exception],
+    "heavy": [m for m in %r if m in sys.modules]
+}))
+"""
+
+def run(script, *args):
+    out = subprocess.run(
+        [sys.executable, "-c", script % (*args, HEAVY)], cwd= ROOT,
+        capture_output= True, text= True, check= True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def bench(repeat):
+    imports = [run(IMPORT_SCRIPT) for _ in range(repeat)]
+    app = os.path.join(ROOT, "src", "app.py")
+    renders = [run(RENDER_SCRIPT, app) for _ in range(repeat)]
+    return {
+        "import_streamlit_s": statistics.median(r["streamlit"] for r in imports),
+        "import_functions_s": statistics.median(r["functions"] for r in imports),
+        "render_beranda_s": statistics.median(r["render"] for r in renders),
+        "heavy_after_import": imports[-1]["heavy"],
+        "heavy_after_render": renders[-1]["heavy"],
+        "exceptions": renders[-1]["exceptions"]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("--repeat", type= int, default= 3)
+    parser.add_argument("--budget", type= float, default= None, help= "batas waktu import functions (detik)")
+    parser.add_argument("--render-budget", type= float, default= None, help= "batas waktu render Beranda (detik)")
+    parser.add_argument("--json", action= "store_true", help= "cetak hasil sebagai JSON")
+    args = parser.parse_args()
+
+    result = bench(args.repeat)
+    over = [
+        name for name, value, budget in [
+            ("import_functions_s", result["import_functions_s"], args.budget),
+            ("render_beranda_s", result["render_beranda_s"], args.render_budget)
+        ] if budget is not None and value > budget
+    ]
+    result["over_budget"] = over
+
+    if args.json:
+        print(json.dumps(result, indent= 1))
+    else:
+        print(f"median dari {args.repeat} proses baru")
+        print(f"{'import streamlit':<20}{result['import_streamlit_s'] * 1000:>10.1f} ms")
+        print(f"{'import functions':<20}{result['import_functions_s'] * 1000:>10.1f} ms")
+        print(f"{'render Beranda':<20}{result['render_beranda_s'] * 1000:>10.1f} ms")
+        print(f"modul berat setelah import: {', '.join(result['heavy_after_import']) or '-'}")
+        print(f"modul berat setelah render: {', '.join(result['heavy_after_render']) or '-'}")
+        if result["exceptions"]:
+            print(f"exception: {result['exceptions']}")
+        if over:
+            print(f"melebihi batas: {', '.join(over)}")
+    sys.exit(1 if over else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Benchmark pipeline dengan fixture audio sintetis
+
+Membuat dataset musik sintetis (nada, noise, ritme) dalam struktur folder
+genre seperti `data/music`, lalu mengukur waktu `get_musik`,
+`ekstraksi_fitur_mfcc` (per file dan keseluruhan), `basic_model`, dan
+`tuned_model` untuk beberapa ukuran dataset dan nilai K. Cache hasil dan
+cache log-mel tidak dipakai agar yang diukur adalah komputasi
+sebenarnya.
+
+Contoh:
+    $ python benchmarks/bench_suite.py --output bench.json
+    $ python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+    $ python benchmarks/bench_suite.py --baseline benchmarks/baseline.json --threshold 0.25
+
+Jika `--baseline` diberikan, program keluar dengan status 1 jika ada
+waktu yang lebih lambat dari baseline melebihi `--threshold` (fraksi).
+"""
+
+import argparse, json, os, platform, sys, tempfile, time
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from functions import (
+    _ekstraksi_file, basic_model, ekstraksi_fitur_mfcc, get_musik, tuned_model
+)
+
+SR = 22050
+GENRES = ["tonal", "noise", "rhythm", "mixed"]
+
+def _tonal(rng, n):
+    t = np.arange(n) / SR
+    root = 110 * 2 ** (rng.integers(0, 12) / 12)
+    y = sum(
+        np.sin(2 * np.pi * root * ratio * h * t) / h
+        for ratio in (1, 1.26, 1.5) for h in (1, 2, 3)
+    )
+    return y * (.6 + .4 * np.sin(2 * np.pi * rng.uniform(.1, .5) * t))
+
+def _noise(rng, n):
+    y = np.cumsum(rng.standard_normal(n)) # brown noise
+    y -= np.convolve(y, np.ones(512) / 512, mode= "same")
+    return y / (np.abs(y).max() + 1e-9)
+
+def _rhythm(rng, n):
+    bpm = rng.uniform(90, 140)
+    step = int(SR * 60 / bpm)
+    kick_t = np.arange(int(.15 * SR)) / SR
+    kick = np.sin(2 * np.pi * 60 * kick_t) * np.exp(-kick_t * 30)
+    hat = rng.standard_normal(int(.03 * SR)) * np.exp(-np.arange(int(.03 * SR)) / 200)
+    y = np.zeros(n)
+    for i, start in enumerate(range(0, n, step // 2)):
+        sound = kick if i % 2 == 0 else .4 * hat
+        end = min(n, start + len(sound))
+        y[start:end] += sound[:end - start]
+    return y
+
+def _mixed(rng, n):
+    return .5 * _tonal(rng, n) + _rhythm(rng, n)
+
+def fixtures(dirname, n_files, duration):
+    """Buat dataset sintetis di `dirname`/<genre>/ (dipakai ulang jika ada)
+
+    File genap disimpan sebagai MP3 (jika didukung libsndfile) dan file
+    ganjil sebagai WAV.
+    """
+    synth = {"tonal": _tonal, "noise": _noise, "rhythm": _rhythm, "mixed": _mixed}
+    mp3 = "MP3" in sf.available_formats()
+    n = int(duration * SR)
+    for i in range(n_files):
+        genre = GENRES[i % len(GENRES)]
+        ext = "mp3" if mp3 and i % 2 == 0 else "wav"
+        path = os.path.join(dirname, genre, f"{genre}_{i:04d}.{ext}")
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok= True)
+        rng = np.random.default_rng(i)
+        y = synth[genre](rng, n) + .02 * rng.standard_normal(n)
+        y = (.5 * y / (np.abs(y).max() + 1e-9)).astype(np.float32)
+        sf.write(path, y, SR)
+    return dirname
+
+def timeit(func, repeat):
+    """Waktu terbaik (detik) dari `repeat` kali pemanggilan dan hasil terakhir"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def warmup(root):
+    """Import modul berat (lazy) sebelum pengukuran pertama"""
+    directory = fixtures(os.path.join(root, "warmup"), 4, 1)
+    df = get_musik(directory)
+    _ekstraksi_file(df["filepath"][0], 1, 13)
+    X = np.random.default_rng(0).standard_normal((8, 13))
+    basic_model.__wrapped__(X, np.array(["a", "b"] * 4, dtype= object), K= 2)
+
+def bench(root, sizes, durations, Ks, repeat, n_jobs):
+    warmup(root)
+    results = {}
+    grid = [["gini", "entropy"], [None], [50, 100], ["sqrt"], [2]]
+    for duration in durations:
+        for size in sizes:
+            directory = fixtures(
+                os.path.join(root, f"d{duration}_n{size}"), size, duration
+            )
+            tag = f"n={size},d={duration}"
+
+            results[f"get_musik/{tag}"], df = timeit(
+                lambda: get_musik(directory), repeat
+            )
+
+            per_file = [
+                timeit(lambda: _ekstraksi_file(fp, duration, 13), repeat)[0]
+                for fp in df["filepath"][:min(size, 8)]
+            ]
+            results[f"ekstraksi_file/{tag}"] = float(np.median(per_file))
+
+            results[f"ekstraksi_fitur_mfcc/{tag}"], features = timeit(
+                lambda: ekstraksi_fitur_mfcc.__wrapped__(
+                    df, duration= duration, coef= 13, n_jobs= n_jobs
+                ), repeat
+            )
+
+            X = features.iloc[:, 1:-1].to_numpy(dtype= np.float32)
+            y = features.iloc[:, -1].to_numpy(dtype= object)
+            for K in Ks:
+                if K > len(y):
+                    continue
+                results[f"basic_model/{tag},K={K}"] = timeit(
+                    lambda: basic_model.__wrapped__(X, y, K= K), repeat
+                )[0]
+                results[f"tuned_model/{tag},K={K}"] = timeit(
+                    lambda: tuned_model.__wrapped__(X, y, grid, K= K, n_jobs= n_jobs),
+                    repeat
+                )[0]
+    return results
+
+def compare(results, baseline, threshold):
+    """Daftar regresi {nama: (baseline, sekarang, rasio)}"""
+    return {
+        name: (baseline[name], value, value / baseline[name])
+        for name, value in results.items()
+        if name in baseline and baseline[name] > 0
+        and value > baseline[name] * (1 + threshold)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description= __doc__.split("\n")[0])
+    parser.add_argument("--sizes", type= int, nargs= "+", default= [16, 48], help= "jumlah file per dataset")
+    parser.add_argument("--durations", type= float, nargs= "+", default= [10, 30], help= "durasi file (detik)")
+    parser.add_argument("--K", type= int, nargs= "+", default= [3, 5], help= "jumlah subset fold")
+    parser.add_argument("--repeat", type= int, default= 3)
+    parser.add_argument("--n-jobs", type= int, default= 1)
+    parser.add_argument("--fixtures", default= None, help= "folder fixture (dipakai ulang), default folder sementara")
+    parser.add_argument("--output", default= None, help= "tulis hasil ke file JSON")
+    parser.add_argument("--baseline", default= None, help= "file JSON baseline untuk deteksi regresi")
+    parser.add_argument("--threshold", type= float, default= .2, help= "batas perlambatan (fraksi)")
+    parser.add_argument("--save-baseline", default= None, help= "simpan hasil sebagai baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.fixtures or tmp
+        start = time.perf_counter()
+        results = bench(root, args.sizes, args.durations, args.K, args.repeat, args.n_jobs)
+        elapsed = time.perf_counter() - start
+
+    report = {
+        "meta": {
+            "python": platform.python_version(), "machine": platform.machine(),
+            "cpu": os.cpu_count(), "n_jobs": args.n_jobs, "repeat": args.repeat,
+            "sizes": args.sizes, "durations": args.durations, "K": args.K,
+            "total_s": elapsed
+        },
+        "results": results
+    }
+
+    regressions = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        report["regressions"] = {
+            name: {"baseline_s": b, "current_s": c, "ratio": r}
+            for name, (b, c, r) in regressions.items()
+        }
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent= 1)
+
+    print(f"{'benchmark':<48}{'waktu (ms)':>12}")
+    for name, value in results.items():
+        flag = "  REGRESI" if name in regressions else ""
+        print(f"{name:<48}{value * 1000:>12.1f}{flag}")
+    if regressions:
+        print(f"{len(regressions)} regresi melebihi {args.threshold:.0%} dari baseline")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
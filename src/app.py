@@ -3,6 +3,7 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
 from streamlit import session_state as ss
+import os, time
 
 from functions import *
 from warnings import simplefilter
@@ -67,10 +68,12 @@ class MyApp():
         self.message = message
         self.pathdata = "./data/music"
         self.menus = [
-            "Beranda", "Dataset", "Ekstraksi Fitur", "Klasifikasi"
+            "Beranda", "Dataset", "Ekstraksi Fitur", "Klasifikasi", "Prediksi",
+            "Lagu Mirip"
         ]
         self.icons = [
-            "house", "music-note-beamed", "soundwave", "bar-chart"
+            "house", "music-note-beamed", "soundwave", "bar-chart", "search",
+            "music-note-list"
         ]
 
     def _navigation(self):
@@ -153,15 +156,115 @@ class MyApp():
             
             ms_40()
             with ml_center():
-                df = get_musik(self.pathdata)
+                index = index_musik(self.pathdata)
+                df, diff = index.snapshot()
+                show_caption(
+                    f"Perubahan terakhir | Ditambahkan: {len(diff['added'])} | "
+                    f"Dihapus: {len(diff['removed'])} | "
+                    f"Berubah: {len(diff['changed'])} | "
+                    f"Watcher: {index.mode}",
+                    size= 5
+                )
                 st.dataframe(df, use_container_width= True, hide_index= True)
-
-                mk_dir("./data/dataframe")
-                df.to_csv("./data/dataframe/list-musik.csv", index= False)
         
         except Exception as e:
             self._exceptionMessage(e)
 
+    def _diagnostik(self, records, path):
+        """Panel diagnostik
+
+        Menampilkan ringkasan waktu (wall dan CPU) dan puncak memori per
+        tahap dalam bagian yang dapat dibuka-tutup.
+
+        Parameters
+        ----------
+        records : list of dict
+            Catatan dari `profiling`.
+
+        path : string
+            Jalur log JSON catatan, lihat `simpan_profil`.
+        """
+        with st.expander("Diagnostik"):
+            show_caption("Ringkasan per tahap", size= 5)
+            st.dataframe(
+                ringkas_profil(records), use_container_width= True,
+                hide_index= True
+            )
+            show_caption("Per file / fold", size= 5)
+            st.dataframe(
+                pd.DataFrame(records), use_container_width= True,
+                hide_index= True
+            )
+            show_caption(f"Log: `{path}`", size= 5)
+
+    def _jobProgress(self, job_id):
+        """Progress job yang mengantri atau berjalan
+
+        Dijalankan sebagai fragment yang diperbarui setiap detik tanpa
+        menjalankan ulang seluruh halaman. Halaman dijalankan ulang saat
+        job selesai agar hasilnya ditampilkan.
+        """
+        jobs = job_queue()
+        job = jobs.get(job_id)
+        if job is None or not job.active:
+            st.rerun()
+
+        if job.status == "queued":
+            st.info(f"Job #{job.id} menunggu antrian...")
+        else:
+            text = f"Job #{job.id} | {job.elapsed:.0f} detik"
+            if job.total:
+                # langkah dari checkpoint tidak dihitung dalam kecepatan
+                rate = (job.done - job.resumed) / max(job.elapsed, 1e-9)
+                eta = (job.total - job.done) / rate if rate else 0
+                text += (
+                    f" | {job.done}/{job.total} {job.text} | "
+                    f"{rate:.2f} {job.text}/detik | "
+                    f"ETA {int(eta // 60)}:{int(eta % 60):02d}"
+                )
+            elif job.text:
+                text += f" | {job.text}"
+            st.progress(job.done / job.total if job.total else 0.0, text= text)
+
+        if st.button("Batalkan", key= f"Button batalkan job {job.id}"):
+            jobs.cancel(job.id)
+            st.rerun()
+
+    def _jobStatus(self, job, name):
+        """Status job pada halaman
+
+        Parameters
+        ----------
+        job : Job or None
+            Job yang diikuti halaman.
+
+        name : string
+            Nama proses, misal "Ekstraksi".
+
+        Returns
+        -------
+        done : bool
+            True jika job selesai dan hasilnya dapat ditampilkan.
+        """
+        if job is None:
+            return False
+        if job.active:
+            st.fragment(self._jobProgress, run_every= 1)(job.id)
+        elif job.status == "failed":
+            st.error(f"{name} (job #{job.id}) gagal: {job.error}")
+        elif job.status == "cancelled":
+            st.warning(
+                f"{name} (job #{job.id}) dibatalkan, tekan Submit untuk "
+                "menjalankan ulang"
+            )
+        else:
+            show_caption(
+                f"Job #{job.id} selesai dalam {job.elapsed:.1f} detik "
+                f"({time.strftime('%H:%M:%S', time.localtime(job.finished))})",
+                size= 5
+            )
+        return job.status == "done"
+
     def _pageEkstraksiFitur(self):
         """Ekstraksi Fitur MFCC
 
@@ -177,14 +280,55 @@ class MyApp():
             left, right = ml_right()
             with left:
                 ms_20()
+                full_track = st.checkbox(
+                    "Full track (per blok, memori terbatas)",
+                    key= "Checkbox untuk ekstraksi full track"
+                )
                 duration = st.number_input(
                     "Durasi Musik (detik)", min_value= 1, value= 30, step= 1,
+                    disabled= full_track,
                     key= "Number input untuk nilai durasi musik"
                 )
                 coef = st.number_input(
                     "Koefisien MFCC", min_value= 1, value= 13, step= 1,
                     key= "Number input untuk nilai koefisien"
                 )
+                offset = st.number_input(
+                    "Offset Musik (detik)", min_value= 0, value= 0, step= 1,
+                    key= "Number input untuk nilai offset musik"
+                )
+                decode = st.selectbox(
+                    "Mode Decode", DECODE_MODES,
+                    key= "Selectbox untuk mode decode audio"
+                )
+                stats = st.multiselect(
+                    "Statistik Tambahan", [
+                        name for name in EXTRA_STATS
+                        if not (full_track and name.startswith("delta"))
+                    ],
+                    placeholder= "Pilih opsi",
+                    key= "Multiselect statistik fitur tambahan"
+                )
+                if full_track:
+                    memory_limit = st.number_input(
+                        "Batas Memori per Proses (MiB)", min_value= 4,
+                        value= MEMORY_LIMIT, step= 8,
+                        key= "Number input untuk batas memori full track"
+                    )
+                n_jobs = st.number_input(
+                    "Jumlah Proses (CPU)", min_value= 1,
+                    max_value= n_workers(-1), value= n_workers(-1), step= 1,
+                    key= "Number input untuk jumlah proses ekstraksi"
+                )
+                vectorized = st.checkbox(
+                    "MFCC per batch (vektorisasi)", value= True,
+                    disabled= full_track,
+                    key= "Checkbox untuk ekstraksi MFCC per batch"
+                )
+                diagnostics = st.checkbox(
+                    "Diagnostik (waktu & memori per tahap)",
+                    key= "Checkbox untuk diagnostik ekstraksi"
+                )
                 
                 ms_40()
                 btn_extract = st.button(
@@ -192,19 +336,44 @@ class MyApp():
                     use_container_width= True
                 )
             with right:
-                if btn_extract or ss.fit_extract:
-                    ss.fit_extract = True
-
-                    show_caption("Fitur MFCC", size= 2)
-
-                    with st.spinner("Extraction features is running..."):
-                        df = ekstraksi_fitur_mfcc(
-                            get_csv("./data/dataframe/list-musik.csv"),
-                            duration= duration, coef= coef
+                show_caption("Fitur MFCC", size= 2)
+
+                jobs = job_queue()
+                if btn_extract:
+                    params = {
+                        "duration": None if full_track else duration,
+                        "coef": coef, "offset": offset, "decode": decode,
+                        "stats": [name for name in EXTRA_STATS if name in stats]
+                    }
+                    df_musik = get_csv(LIST_PATH)
+                    key = fingerprint([
+                        "ekstraksi", params, vectorized, diagnostics,
+                        fingerprint_musik(df_musik)
+                    ])
+                    ss.job_ekstraksi = jobs.submit(
+                        "ekstraksi", tugas_ekstraksi, params, key= key,
+                        n_jobs= n_jobs, vectorized= vectorized,
+                        diagnostics= diagnostics,
+                        memory_limit= memory_limit if full_track else MEMORY_LIMIT
+                    ).id
+
+                job = jobs.get(ss.get("job_ekstraksi")) or jobs.latest("ekstraksi")
+                if self._jobStatus(job, "Ekstraksi"):
+                    result = job.result
+                    if result["errors"]:
+                        st.warning(
+                            f"{len(result['errors'])} file gagal diekstrak:\n\n" +
+                            "\n".join(
+                                f"- `{fp}`: {err}"
+                                for fp, err in result["errors"].items()
+                            )
                         )
 
-                    df.to_csv("./data/dataframe/mfcc_features.csv", index= False)
-                    st.dataframe(df, use_container_width= True, hide_index= True)
+                    st.dataframe(
+                        result["df"], use_container_width= True, hide_index= True
+                    )
+                    if result["records"]:
+                        self._diagnostik(result["records"], result["log"])
         
         except Exception as e:
             self._exceptionMessage(e)
@@ -228,8 +397,15 @@ class MyApp():
 
             left, right = ml_right()
             with left:
+                validation = st.radio(
+                    "Validasi", ["KFold", "Out-of-Bag"], horizontal= True,
+                    key= "Radio button untuk jenis validasi"
+                )
+                validation = {"KFold": "kfold", "Out-of-Bag": "oob"}[validation]
                 K = st.selectbox(
-                    "Jumlah subset Fold", [4, 5, 10], index= 1,
+                    "Jumlah subset Fold" + (
+                        " (pembanding)" if validation == "oob" else ""
+                    ), [4, 5, 10], index= 1,
                     key= "Selectbox untuk jumlah subset Fold"
                 )
 
@@ -266,6 +442,32 @@ class MyApp():
                     )
                 
                 elif set_params == "Tune":
+                    n_jobs = st.number_input(
+                        "Jumlah Proses (CPU)", min_value= 1,
+                        max_value= n_workers(-1), value= n_workers(-1), step= 1,
+                        key= "Number input untuk jumlah proses tuning"
+                    )
+                    search = st.radio(
+                        "Metode Tuning", ["Grid", "Successive Halving"]
+                        if validation == "kfold" else ["Grid"],
+                        horizontal= True, key= "Radio button untuk metode tuning"
+                    )
+                    if search == "Successive Halving":
+                        factor = st.selectbox(
+                            "Faktor eliminasi", [2, 3, 4], index= 1,
+                            key= "Selectbox faktor successive halving"
+                        )
+                        time_budget = st.number_input(
+                            "Batas Waktu (detik, 0 = tanpa batas)", min_value= 0,
+                            value= 0, step= 10,
+                            key= "Number input batas waktu tuning"
+                        )
+                        max_fits = st.number_input(
+                            "Batas Fit (0 = tanpa batas)", min_value= 0,
+                            value= 0, step= 10,
+                            key= "Number input batas fit tuning"
+                        )
+
                     st.markdown("---")
                     criterion = st.multiselect(
                         "criterion", list_criterion,
@@ -300,83 +502,380 @@ class MyApp():
                 elif set_params == "Default":
                     pass
 
-                ms_40()
+                ms_20()
+                save_model = st.checkbox(
+                    "Simpan model", value= True,
+                    key= "Checkbox untuk simpan model"
+                )
+                diagnostics = st.checkbox(
+                    "Diagnostik (waktu & memori per tahap)",
+                    key= "Checkbox untuk diagnostik pelatihan"
+                )
+
+                ms_20()
                 btn_train = st.button(
                     "Submit", use_container_width= True,
                     key= "Button untuk training model"
                 )
             with right:
-                df = get_csv("./data/dataframe/mfcc_features.csv")
-                features = df.iloc[:, 1:14].values
-                labels = df.iloc[:, -1].values
+                features, meta = baca_fitur()
+                if features is None:
+                    st.warning(
+                        "Fitur belum tersedia, lakukan ekstraksi fitur "
+                        "terlebih dahulu!"
+                    )
+                    return
+                labels = meta["labels"]
 
                 ms_20()
-                st.code(
-                    f"Jumlah Data Train = {int(len(labels) / K * (K - 1))} data\n"
-                    f"Jumlah Data Test = {int(len(labels) / K * 1)} data"
-                )
+                if validation == "oob":
+                    st.code(
+                        f"Jumlah Fitur = {len(meta['columns'])} kolom\n"
+                        f"Jumlah Data Train = {len(labels)} data\n"
+                        f"Data Test = sampel out-of-bag setiap tree (±37%)"
+                    )
+                else:
+                    st.code(
+                        f"Jumlah Fitur = {len(meta['columns'])} kolom\n"
+                        f"Jumlah Data Train = {int(len(labels) / K * (K - 1))} data\n"
+                        f"Jumlah Data Test = {int(len(labels) / K * 1)} data"
+                    )
 
+                jobs = job_queue()
                 if btn_train:
-                    with st.spinner("Pelatihan model sedang berlangsung..."):
-                        if set_params == "Set":
-                            score, params = basic_model(
-                                features, labels, K= K, criterion= criterion,
-                                max_depth= max_depth, n_estimators= n_estimators,
-                                max_features= max_features,
-                                min_samples_split= min_samples_split
+                    options = {}
+                    if set_params == "Set":
+                        options["params"] = {
+                            "criterion": criterion, "max_depth": max_depth,
+                            "n_estimators": n_estimators,
+                            "max_features": max_features,
+                            "min_samples_split": min_samples_split
+                        }
+                    elif set_params == "Tune":
+                        options["params"] = [
+                            criterion, max_depth, n_estimators, max_features,
+                            min_samples_split
+                        ]
+                        options["search"] = search
+                        options["n_jobs"] = n_jobs
+                        if search == "Successive Halving":
+                            options["factor"] = factor
+                            options["max_fits"] = max_fits or None
+                            options["time_budget"] = time_budget or None
+
+                    if set_params == "Tune" and not all(options["params"]):
+                        ms_40()
+                        st.warning("Setiap nilai parameter harus terisi minimal 1!")
+                    else:
+                        store = os.stat(f"{FEATURE_STORE}.npy")
+                        key = fingerprint([
+                            "klasifikasi", set_params, K, validation, save_model,
+                            diagnostics, {**options, "n_jobs": None},
+                            store.st_size, store.st_mtime_ns
+                        ])
+                        ss.job_klasifikasi = jobs.submit(
+                            "klasifikasi", tugas_klasifikasi, set_params,
+                            key= key, K= K, save_model= save_model,
+                            diagnostics= diagnostics, validation= validation,
+                            **options
+                        ).id
+
+                job = jobs.get(ss.get("job_klasifikasi")) or jobs.latest("klasifikasi")
+                if self._jobStatus(job, "Pelatihan"):
+                    result = job.result
+                    score, params, info = result["score"], result["params"], result["info"]
+
+                    ms_20()
+                    show_caption(f"Jenis parameter yang digunakan: `{result['mode']}`")
+                    validasi = result.get("validasi") or {}
+                    if info is not None:
+                        saved = info["fits_grid"] - info["fits_setara"]
+                        st.success(
+                            f"{info['fits']} fit dijalankan terhadap "
+                            f"{info['fits_grid']} fit grid lengkap; biaya "
+                            f"setara {info['fits_setara']:.1f} fit data penuh, "
+                            f"hemat {saved:.1f} fit "
+                            f"({saved / info['fits_grid'] * 100:.0f}%) "
+                            f"dalam {info['waktu']:.1f} detik"
+                        )
+                        if info["fits"] > info["fits_grid"]:
+                            show_caption(
+                                f"Jumlah fit {info['fits'] - info['fits_grid']} "
+                                "lebih banyak dari grid lengkap karena tahap "
+                                "pertama mengevaluasi semua kombinasi pada "
+                                "subsampel data; penghematan berasal dari "
+                                "ukuran data dan trees yang lebih kecil"
                             )
-
-                            ms_20()
-                            show_caption("Jenis parameter yang digunakan: `Set`")
-                            text = ""
-                            for cols in params.columns:
-                                text += f"{cols} : {params[cols][0]}\n"
-                            st.code(text)
-
-                            show_caption("Evaluasi Score")
-                            for cols in score.columns:
-                                st.info(f"{cols}: {score[cols][0] * 100:.2f}%")
-                        elif set_params == "Tune":
-                            if len(criterion) != 0 and len(max_depth) != 0 and len(n_estimators) != 0 \
-                            and len(max_features) != 0 and len(min_samples_split) != 0:
-                                metrics_params = {
-                                    "criterion": criterion, "max_depth": max_depth,
-                                    "n_estimators": n_estimators, "max_features": max_features,
-                                    "min_samples_split": min_samples_split
-                                }
-                                params = [metrics_params[key] for key in metrics_params]
-                                score, params = tuned_model(features, labels, params, K= K)
-
-                                ms_20()
-                                show_caption("Jenis parameter yang digunakan: `Tune`")
-                                text = ""
-                                for cols in params.columns:
-                                    text += f"{cols} : {params[cols][0]}\n"
-                                st.code(text)
-
-                                show_caption("Evaluasi Score")
-                                for cols in score.columns:
-                                    st.info(f"{cols}: {score[cols][0] * 100:.2f}%")
-                            else:
-                                ms_40()
-                                st.warning("Setiap nilai parameter harus terisi minimal 1!")
-                        elif set_params == "Default":
-                            score, params = basic_model(features, labels, K= K)
-                            
-                            ms_20()
-                            show_caption("Jenis parameter yang digunakan: `Default`")
-                            text = ""
-                            for cols in params.columns:
-                                text += f"{cols} : {params[cols][0]}\n"
-                            st.code(text)
-
-                            show_caption("Evaluasi Score")
-                            for cols in score.columns:
-                                st.info(f"{cols}: {score[cols][0] * 100:.2f}%")
+                        st.dataframe(
+                            pd.DataFrame(info["rungs"]),
+                            use_container_width= True, hide_index= True
+                        )
+                    elif validasi.get("mode") == "oob":
+                        fits, k = validasi["fits"], validasi["K"]
+                        fit_time = validasi["waktu_fit"]
+                        st.success(
+                            f"Validasi out-of-bag: {fits} fit forest "
+                            f"({fit_time:.2f} detik fit) menggantikan "
+                            f"{fits * k} fit KFold (K={k}, perkiraan "
+                            f"{fit_time * (k - 1):.2f} detik fit), hemat "
+                            f"{fits * (k - 1)} fit "
+                            f"(±{(1 - 1 / (k - 1)) * 100:.0f}% waktu fit)"
+                        )
+                    elif validasi.get("mode") == "kfold":
+                        show_caption(
+                            f"Validasi KFold: {validasi['fits']} fit forest "
+                            f"({validasi['waktu_fit']:.2f} detik fit)"
+                        )
+                    text = ""
+                    for cols in params.columns:
+                        text += f"{cols} : {params[cols][0]}\n"
+                    st.code(text)
+
+                    show_caption("Evaluasi Score")
+                    for cols in score.columns:
+                        st.info(f"{cols}: {score[cols][0] * 100:.2f}%")
+
+                    if result["created"] is not None:
+                        st.success(
+                            f"Model disimpan ({result['created']}), "
+                            "gunakan halaman Prediksi untuk klasifikasi lagu baru"
+                        )
+                    if result["records"]:
+                        self._diagnostik(result["records"], result["log"])
         
         except Exception as e:
             self._exceptionMessage(e)
 
+    def _pagePrediksi(self):
+        """Prediksi genre musik
+
+        Halaman untuk klasifikasi satu lagu baru menggunakan model yang
+        disimpan dari halaman Klasifikasi. Model dibaca sekali per proses
+        dan fitur diekstrak dengan parameter yang sama seperti saat
+        pelatihan.
+        """
+        try:
+            ms_20()
+            show_text("Prediksi Genre", underline= True)
+
+            artifact = muat_model()
+            if artifact is None:
+                ms_40()
+                st.warning(
+                    "Model belum tersedia, latih dan simpan model pada "
+                    "halaman Klasifikasi terlebih dahulu!"
+                )
+                return
+
+            left, right = ml_right()
+            with left:
+                schema = artifact["schema"]
+                text = f"dibuat : {artifact['created']}\n"
+                text += f"jumlah data : {artifact['n_samples']}\n"
+                for key, value in artifact["params"].items():
+                    text += f"{key} : {value}\n"
+                for key in ["duration", "coef", "offset", "decode", "stats"]:
+                    text += f"{key} : {schema[key]}\n"
+                show_caption("Model tersimpan")
+                st.code(text)
+
+            with right:
+                upload = st.file_uploader(
+                    "Upload file musik", type= ["mp3", "wav", "ogg", "flac"],
+                    key= "File uploader untuk prediksi genre"
+                )
+
+                progressive = st.toggle(
+                    "Prediksi progresif (berhenti lebih awal)", value= True,
+                    key= "Toggle untuk prediksi progresif"
+                )
+                if progressive:
+                    threshold = st.slider(
+                        "Ambang probabilitas", min_value= 0.5, max_value= 1.0,
+                        value= 0.8, step= 0.05,
+                        key= "Slider ambang prediksi progresif"
+                    )
+
+                if upload is not None:
+                    st.audio(upload)
+
+                    start = time.perf_counter()
+                    filepath = f"./data/model/upload-{os.getpid()}-{upload.name}"
+                    with open(filepath, "wb") as f:
+                        f.write(upload.getbuffer())
+                    try:
+                        if progressive:
+                            genre, proba, window = prediksi_progresif(
+                                filepath, artifact, threshold= threshold
+                            )
+                        else:
+                            genre, proba = prediksi_musik(filepath, artifact)
+                            window = schema["duration"]
+                    finally:
+                        os.remove(filepath)
+
+                    ms_20()
+                    st.success(f"Genre: **{genre}**")
+                    show_caption(
+                        f"Waktu prediksi {time.perf_counter() - start:.2f} detik "
+                        f"dari {f'{window:g} detik' if window else 'seluruh'} audio"
+                    )
+                    st.dataframe(
+                        proba.style.format({"probabilitas": "{:.2%}"}),
+                        use_container_width= True, hide_index= True
+                    )
+
+            ms_40()
+            show_text("Prediksi Folder", underline= True)
+            left, right = ml_right()
+            with left:
+                directory = st.text_input(
+                    "Folder musik", value= self.pathdata,
+                    key= "Text input folder prediksi"
+                )
+                n_jobs = st.number_input(
+                    "Jumlah Proses (CPU)", min_value= 1,
+                    max_value= n_workers(-1), value= n_workers(-1), step= 1,
+                    key= "Number input untuk jumlah proses prediksi"
+                )
+
+                ms_20()
+                btn_predict = st.button(
+                    "Submit", use_container_width= True,
+                    key= "Button untuk prediksi folder"
+                )
+
+            with right:
+                output = "./data/dataframe/prediksi.csv"
+                if btn_predict:
+                    filepaths = cari_musik(directory)
+                    total, done, errors = len(filepaths), 0, {}
+                    bar = st.progress(0.0, text= f"0/{total} file")
+
+                    start = time.perf_counter()
+                    for filepath, _, _, err in iter_prediksi(
+                        filepaths, artifact, output= output, root= directory,
+                        n_jobs= n_jobs
+                    ):
+                        done += 1
+                        if err:
+                            errors[filepath] = err
+                        rate = done / (time.perf_counter() - start)
+                        bar.progress(
+                            done / total,
+                            text= f"{done}/{total} file | {rate:.2f} file/detik"
+                        )
+                    elapsed = time.perf_counter() - start
+
+                    bar.empty()
+                    st.success(
+                        f"{total - len(errors)} file diprediksi dalam "
+                        f"{elapsed:.1f} detik "
+                        f"({total / max(elapsed, 1e-9):.2f} file/detik)"
+                    )
+                    if errors:
+                        st.warning(
+                            f"{len(errors)} file gagal diprediksi:\n\n" +
+                            "\n".join(
+                                f"- `{fp}`: {err}" for fp, err in errors.items()
+                            )
+                        )
+
+                if os.path.exists(output):
+                    st.dataframe(
+                        get_csv(output), use_container_width= True,
+                        hide_index= True
+                    )
+
+        except Exception as e:
+            self._exceptionMessage(e)
+
+    def _pageMirip(self):
+        """Pencarian lagu mirip
+
+        Halaman untuk mencari lagu dalam dataset yang paling mirip dengan
+        lagu dari dataset atau file yang di-upload, berdasarkan jarak
+        fitur MFCC yang dinormalisasi pada indeks tetangga terdekat.
+        """
+        try:
+            ms_20()
+            show_text("Lagu Mirip", underline= True)
+
+            index = index_mirip()
+            if index is None:
+                ms_40()
+                st.warning(
+                    "Fitur belum tersedia, lakukan ekstraksi fitur "
+                    "terlebih dahulu!"
+                )
+                return
+            features, meta = baca_fitur()
+
+            left, right = ml_right()
+            with left:
+                source = st.radio(
+                    "Sumber lagu", ["Dataset", "Upload"], horizontal= True,
+                    key= "Radio button untuk sumber lagu mirip"
+                )
+                if source == "Dataset":
+                    choice = st.selectbox(
+                        "Lagu", range(len(meta["filenames"])),
+                        format_func= lambda i: (
+                            f"{meta['labels'][i]} / {meta['filenames'][i]}"
+                        ),
+                        key= "Selectbox lagu untuk lagu mirip"
+                    )
+                else:
+                    upload = st.file_uploader(
+                        "Upload file musik", type= ["mp3", "wav", "ogg", "flac"],
+                        key= "File uploader untuk lagu mirip"
+                    )
+                k = st.number_input(
+                    "Jumlah lagu mirip", min_value= 1, max_value= 50, value= 5,
+                    step= 1, key= "Number input untuk jumlah lagu mirip"
+                )
+
+                ms_20()
+                st.code(
+                    f"Jumlah Lagu = {len(index)} lagu\n"
+                    f"Jumlah Fitur = {len(index.columns)} kolom\n"
+                    f"Indeks = {index.algorithm}"
+                )
+
+            with right:
+                vector = exclude = None
+                if source == "Dataset":
+                    vector = np.asarray(features[choice])
+                    exclude = (meta["filenames"][choice], meta["labels"][choice])
+                elif upload is not None:
+                    st.audio(upload)
+                    filepath = f"./data/model/upload-{os.getpid()}-{upload.name}"
+                    mk_dir(os.path.dirname(filepath))
+                    with open(filepath, "wb") as f:
+                        f.write(upload.getbuffer())
+                    try:
+                        vector = fitur_file(filepath, meta)
+                    finally:
+                        os.remove(filepath)
+
+                if vector is not None:
+                    start = time.perf_counter()
+                    neighbors = index.query(vector, k= k, exclude= exclude)
+                    elapsed = time.perf_counter() - start
+
+                    ms_20()
+                    show_caption(
+                        f"Waktu query {elapsed * 1000:.2f} ms dari "
+                        f"{len(index)} lagu"
+                    )
+                    st.dataframe(
+                        neighbors.style.format({"jarak": "{:.3f}"}),
+                        use_container_width= True, hide_index= True
+                    )
+
+        except Exception as e:
+            self._exceptionMessage(e)
+
     def main(self):
         """Main Program
 
@@ -386,9 +885,6 @@ class MyApp():
         with st.container():
             selected = self._navigation() # sidebar navigation
 
-            if "fit_extract" not in ss:
-                ss.fit_extract = False
-            
             if selected == self.menus[0]:
                 self._pageBeranda()
             elif selected == self.menus[1]:
@@ -397,6 +893,10 @@ class MyApp():
                 self._pageEkstraksiFitur()
             elif selected == self.menus[3]:
                 self._pageKlasifikasi()
+            elif selected == self.menus[4]:
+                self._pagePrediksi()
+            elif selected == self.menus[5]:
+                self._pageMirip()
 
 if __name__ == "__main__":
     app = MyApp(message= True)
@@ -0,0 +1,334 @@
+"""CLI pipeline klasifikasi genre musik
+
+Menjalankan setiap tahap pipeline tanpa Streamlit, misal untuk job
+terjadwal. Hasil setiap perintah ditulis ke stdout sebagai JSON. Jalur
+default sama seperti aplikasi web sehingga hasilnya dapat langsung
+dipakai oleh halaman aplikasi.
+
+Contoh:
+    $ python src/cli.py scan ./data/music
+    $ python src/cli.py extract --duration 30 --coef 13 --n-jobs -1
+    $ python src/cli.py extract --full-track --memory-limit 32 --stats mfcc_std
+    $ python src/cli.py extract-shard --shards 4 --shard 0 --n-jobs -1
+    $ python src/cli.py merge-shards --shards 4
+    $ python src/cli.py train --criterion entropy --n-estimators 150 --save-model
+    $ python src/cli.py tune --n-estimators 50 100 150 --max-depth 32 64 --n-jobs -1
+    $ python src/cli.py tune --n-estimators 50 100 150 --validation oob
+    $ python src/cli.py predict ./data/new --output ./data/dataframe/prediksi.csv
+    $ python src/cli.py cache
+"""
+
+import argparse, json, os, sys, time
+
+import numpy as np
+
+from functions import (
+    DECODE_MODES, EXTRA_STATS, FEATURE_STORE, LIST_PATH, LOGMEL_CACHE_DIR,
+    MANIFEST_PATH, MEMORY_LIMIT, MODEL_PATH, RESULT_CACHE_DIR, SHARD_DIR,
+    VALIDATION_MODES, ResultCache, baca_fitur, basic_model, cari_musik, ekstraksi_fitur_mfcc,
+    ekstraksi_shard, gabung_shard, get_csv, get_json, halving_model,
+    iter_prediksi, mk_dir, muat_model, scan_musik, simpan_fitur,
+    simpan_model, tuned_model
+)
+
+def _read_features(path):
+    features, meta = baca_fitur(path)
+    if features is None:
+        raise FileNotFoundError(f"Feature store tidak ditemukan: {path}")
+    return features, meta
+
+def _save_model(args, features, meta, score, params):
+    schema = {
+        key: meta[key] for key in
+        ["duration", "coef", "offset", "decode", "stats", "columns"]
+    }
+    artifact = simpan_model(
+        features, meta["labels"], params.iloc[0].to_dict(), schema,
+        metrics= score.iloc[0].to_dict(), path= args.model
+    )
+    return {"path": args.model, "created": artifact["created"]}
+
+def cmd_scan(args):
+    """Scan folder musik dan tulis daftar musik"""
+    df, diff = scan_musik(args.directory, manifest_path= args.manifest)
+    if any(diff.values()) or not os.path.exists(args.output):
+        mk_dir(os.path.dirname(args.output))
+        df.to_csv(args.output, index= False)
+    return {
+        "output": args.output, "files": len(df),
+        "genres": df["genre"].value_counts().to_dict(),
+        **{key: len(value) for key, value in diff.items()}
+    }
+
+def _extract_params(args):
+    return {
+        "duration": None if args.full_track else args.duration,
+        "coef": args.coef, "offset": args.offset,
+        "decode": args.decode,
+        "stats": [name for name in EXTRA_STATS if name in args.stats]
+    }
+
+def _manifest_hashes(path):
+    return {
+        fp: v["hash"] for fp, v in get_json(path, {}).get("files", {}).items()
+    }
+
+def cmd_extract(args):
+    """Ekstraksi fitur MFCC dari daftar musik"""
+    params = _extract_params(args)
+    df_musik = get_csv(args.list)
+
+    start = time.perf_counter()
+    df = ekstraksi_fitur_mfcc(
+        df_musik, n_jobs= args.n_jobs,
+        cache_dir= None if args.no_cache else LOGMEL_CACHE_DIR,
+        vectorized= args.vectorized, memory_limit= args.memory_limit, **params
+    )
+    elapsed = time.perf_counter() - start
+
+    hashes = _manifest_hashes(args.manifest)
+    simpan_fitur(df, {
+        **params,
+        "files": {fp: hashes.get(fp) for fp in df_musik.iloc[:, 0]}
+    }, path= args.output)
+    return {
+        "output": args.output, **params, "files": len(df_musik),
+        "extracted": len(df), "errors": df.attrs.get("errors", {}),
+        "waktu": elapsed, "file_per_detik": len(df_musik) / max(elapsed, 1e-9)
+    }
+
+def cmd_extract_shard(args):
+    """Ekstraksi fitur MFCC untuk satu shard daftar musik (satu worker)"""
+    params = _extract_params(args)
+    start = time.perf_counter()
+    result = ekstraksi_shard(
+        get_csv(args.list), params, args.shards, args.shard,
+        worker= args.worker, directory= args.dir, n_jobs= args.n_jobs,
+        vectorized= args.vectorized, memory_limit= args.memory_limit
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        "shard": args.shard, "shards": args.shards, **params, **result,
+        "waktu": elapsed, "file_per_detik": result["files"] / max(elapsed, 1e-9)
+    }
+
+def cmd_merge_shards(args):
+    """Validasi dan gabungkan hasil seluruh shard ke feature store"""
+    df_musik = get_csv(args.list)
+    df, params = gabung_shard(df_musik, n_shards= args.shards, directory= args.dir)
+
+    hashes = _manifest_hashes(args.manifest)
+    simpan_fitur(df, {
+        **params,
+        "files": {fp: hashes.get(fp) for fp in df_musik.iloc[:, 0]}
+    }, path= args.output)
+    return {
+        "output": args.output, **params, "files": len(df_musik),
+        "extracted": len(df), "errors": df.attrs["errors"]
+    }
+
+def cmd_train(args):
+    """Train model dengan satu set parameter dan validasi KFold"""
+    features, meta = _read_features(args.features)
+    score, params = basic_model(
+        features, meta["labels"], K= args.K, criterion= args.criterion,
+        max_depth= args.max_depth, n_estimators= args.n_estimators,
+        max_features= args.max_features,
+        min_samples_split= args.min_samples_split, validation= args.validation
+    )
+    result = {
+        "score": score.iloc[0].to_dict(), "params": params.iloc[0].to_dict(),
+        "validasi": score.attrs.get("validasi")
+    }
+    if args.save_model:
+        result["model"] = _save_model(args, features, meta, score, params)
+    return result
+
+def cmd_tune(args):
+    """Tuning parameter dengan grid search atau successive halving"""
+    features, meta = _read_features(args.features)
+    labels = meta["labels"]
+    grid = [
+        args.criterion, args.max_depth, args.n_estimators, args.max_features,
+        args.min_samples_split
+    ]
+
+    start = time.perf_counter()
+    result = {}
+    if args.method == "halving":
+        if args.validation != "kfold":
+            raise ValueError("Successive halving hanya mendukung validasi KFold")
+        score, params, info = halving_model(
+            features, labels, grid, K= args.K, factor= args.factor,
+            max_fits= args.max_fits, time_budget= args.time_budget,
+            n_jobs= args.n_jobs
+        )
+        result["halving"] = info
+    else:
+        score, params = tuned_model(
+            features, labels, grid, K= args.K, n_jobs= args.n_jobs,
+            validation= args.validation
+        )
+        result["validasi"] = score.attrs.get("validasi")
+    result = {
+        "score": score.iloc[0].to_dict(), "params": params.iloc[0].to_dict(),
+        "waktu": time.perf_counter() - start, **result
+    }
+    if args.save_model:
+        result["model"] = _save_model(args, features, meta, score, params)
+    return result
+
+def cmd_predict(args):
+    """Prediksi genre seluruh file musik dalam folder"""
+    artifact = muat_model(args.model)
+    if artifact is None:
+        raise FileNotFoundError(f"Model tidak ditemukan: {args.model}")
+
+    filepaths = cari_musik(args.directory)
+    start = time.perf_counter()
+    errors = {
+        fp: err for fp, _, _, err in iter_prediksi(
+            filepaths, artifact, output= args.output, root= args.directory,
+            n_jobs= args.n_jobs, batch_size= args.batch_size
+        ) if err
+    }
+    elapsed = time.perf_counter() - start
+    return {
+        "output": args.output, "files": len(filepaths),
+        "predicted": len(filepaths) - len(errors), "errors": errors,
+        "waktu": elapsed, "file_per_detik": len(filepaths) / max(elapsed, 1e-9)
+    }
+
+def cmd_cache(args):
+    """Statistik cache hasil (hit, miss, ukuran)"""
+    return ResultCache(args.dir).stats()
+
+def _max_depth(value):
+    return None if value.lower() == "none" else int(value)
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description= "Pipeline klasifikasi genre musik tanpa Streamlit"
+    )
+    sub = parser.add_subparsers(dest= "command", required= True)
+
+    p = sub.add_parser("scan", help= cmd_scan.__doc__)
+    p.add_argument("directory", nargs= "?", default= "./data/music")
+    p.add_argument("--output", default= LIST_PATH)
+    p.add_argument("--manifest", default= MANIFEST_PATH)
+    p.set_defaults(func= cmd_scan)
+
+    for name, func in [("extract", cmd_extract), ("extract-shard", cmd_extract_shard)]:
+        p = sub.add_parser(name, help= func.__doc__)
+        p.add_argument("--list", default= LIST_PATH)
+        p.add_argument("--duration", type= float, default= 30)
+        p.add_argument(
+            "--full-track", action= "store_true",
+            help= "ekstrak seluruh lagu per blok (mengabaikan --duration)"
+        )
+        p.add_argument(
+            "--memory-limit", type= float, default= MEMORY_LIMIT,
+            help= "anggaran memori buffer per proses pada --full-track (MiB, batas lunak)"
+        )
+        p.add_argument("--coef", type= int, default= 13)
+        p.add_argument("--offset", type= float, default= 0.0)
+        p.add_argument("--decode", choices= DECODE_MODES, default= "default")
+        p.add_argument("--stats", nargs= "*", choices= list(EXTRA_STATS), default= [])
+        p.add_argument("--n-jobs", type= int, default= 1)
+        p.add_argument("--vectorized", action= "store_true")
+        p.set_defaults(func= func)
+    p.add_argument("--shards", type= int, required= True, help= "jumlah shard")
+    p.add_argument("--shard", type= int, required= True, help= "nomor shard (0 .. shards - 1)")
+    p.add_argument(
+        "--worker", default= None,
+        help= "nama worker pada nama file shard, default nama host"
+    )
+    p.add_argument("--dir", default= SHARD_DIR, help= "folder hasil shard (filesystem bersama)")
+
+    p = sub.choices["extract"]
+    p.add_argument(
+        "--output", default= FEATURE_STORE,
+        help= "jalur feature store tanpa ekstensi (.npy, .json, .csv)"
+    )
+    p.add_argument("--manifest", default= MANIFEST_PATH)
+    p.add_argument("--no-cache", action= "store_true")
+
+    p = sub.add_parser("merge-shards", help= cmd_merge_shards.__doc__)
+    p.add_argument("--list", default= LIST_PATH)
+    p.add_argument("--shards", type= int, default= None, help= "jumlah shard yang diharapkan")
+    p.add_argument("--dir", default= SHARD_DIR)
+    p.add_argument("--output", default= FEATURE_STORE)
+    p.add_argument("--manifest", default= MANIFEST_PATH)
+    p.set_defaults(func= cmd_merge_shards)
+
+    for name, func, nargs in [("train", cmd_train, None), ("tune", cmd_tune, "+")]:
+        p = sub.add_parser(name, help= func.__doc__)
+        p.add_argument(
+            "--features", default= FEATURE_STORE,
+            help= "jalur feature store tanpa ekstensi"
+        )
+        p.add_argument("--K", type= int, default= 5)
+        p.add_argument(
+            "--validation", choices= VALIDATION_MODES, default= "kfold",
+            help= "oob: satu fit per kombinasi, metrics dari prediksi out-of-bag"
+        )
+        p.add_argument(
+            "--criterion", nargs= nargs, choices= ["gini", "entropy", "log_loss"],
+            default= "gini" if nargs is None else ["gini"]
+        )
+        p.add_argument(
+            "--max-depth", nargs= nargs, type= _max_depth,
+            default= None if nargs is None else [None]
+        )
+        p.add_argument(
+            "--n-estimators", nargs= nargs, type= int,
+            default= 100 if nargs is None else [100]
+        )
+        p.add_argument(
+            "--max-features", nargs= nargs, choices= ["sqrt", "log2"],
+            default= "sqrt" if nargs is None else ["sqrt"]
+        )
+        p.add_argument(
+            "--min-samples-split", nargs= nargs, type= int,
+            default= 2 if nargs is None else [2]
+        )
+        p.add_argument("--save-model", action= "store_true")
+        p.add_argument("--model", default= MODEL_PATH)
+        p.set_defaults(func= func)
+    p.add_argument("--method", choices= ["grid", "halving"], default= "grid")
+    p.add_argument("--n-jobs", type= int, default= 1)
+    p.add_argument("--factor", type= int, default= 3)
+    p.add_argument("--max-fits", type= int, default= None)
+    p.add_argument("--time-budget", type= float, default= None)
+
+    p = sub.add_parser("predict", help= cmd_predict.__doc__)
+    p.add_argument("directory")
+    p.add_argument("--output", default= "./data/dataframe/prediksi.csv")
+    p.add_argument("--model", default= MODEL_PATH)
+    p.add_argument("--n-jobs", type= int, default= 1)
+    p.add_argument("--batch-size", type= int, default= 64)
+    p.set_defaults(func= cmd_predict)
+
+    p = sub.add_parser("cache", help= cmd_cache.__doc__)
+    p.add_argument("--dir", default= RESULT_CACHE_DIR)
+    p.set_defaults(func= cmd_cache)
+    return parser
+
+def main(argv= None):
+    args = build_parser().parse_args(argv)
+    try:
+        result = {"command": args.command, **args.func(args)}
+        status = 0
+    except Exception as e:
+        result = {"command": args.command, "error": f"{type(e).__name__}: {e}"}
+        status = 1
+    print(json.dumps(result, indent= 1, default= _json_default))
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
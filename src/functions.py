@@ -1,21 +1,68 @@
 # LIBRARY / MODULE / PUSTAKA
 
-import streamlit as st
-import pandas as pd
-import numpy as np
-import librosa, os
+import os, sys, atexit, copy, glob, hashlib, importlib, inspect, json, pickle
+import platform, tempfile, threading, time, tracemalloc
 
-from itertools import product
-from sklearn.model_selection import KFold
-from sklearn.ensemble import RandomForestClassifier
-
-from sklearn.metrics import accuracy_score, precision_score
-from sklearn.metrics import recall_score, f1_score
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
+from itertools import product, islice, chain
+from math import ceil, floor, log
 
 from warnings import simplefilter
 
 simplefilter(action= "ignore", category= FutureWarning)
 
+"""Import tertunda
+
+Modul berat (librosa, scikit-learn, scipy, pandas, numpy) baru di-import
+saat pertama kali dipakai, sehingga halaman yang tidak membutuhkannya
+(misal Beranda) tidak menunggu import modul tersebut.
+"""
+
+class _LazyModule():
+    """Modul yang baru di-import saat atributnya pertama kali diakses"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        value = getattr(self._module, attr)
+        setattr(self, attr, value) # akses berikutnya tanpa __getattr__
+        return value
+
+def _lazy_attr(module, name):
+    """Fungsi atau kelas `name` dari `module` yang di-import saat dipanggil"""
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module), name)(*args, **kwargs)
+    call.__name__ = call.__qualname__ = name
+    return call
+
+pd = _LazyModule("pandas")
+np = _LazyModule("numpy")
+sf = _LazyModule("soundfile")
+librosa = _LazyModule("librosa")
+joblib = _LazyModule("joblib")
+
+dct = _lazy_attr("scipy.fft", "dct")
+rfft = _lazy_attr("scipy.fft", "rfft")
+KFold = _lazy_attr("sklearn.model_selection", "KFold")
+RandomForestClassifier = _lazy_attr("sklearn.ensemble", "RandomForestClassifier")
+KDTree = _lazy_attr("sklearn.neighbors", "KDTree")
+BallTree = _lazy_attr("sklearn.neighbors", "BallTree")
+
+accuracy_score = _lazy_attr("sklearn.metrics", "accuracy_score")
+precision_score = _lazy_attr("sklearn.metrics", "precision_score")
+recall_score = _lazy_attr("sklearn.metrics", "recall_score")
+f1_score = _lazy_attr("sklearn.metrics", "f1_score")
+
+# streamlit hanya di-import jika dipakai, sehingga CLI berjalan tanpa streamlit
+st = sys.modules.get("streamlit") or _LazyModule("streamlit")
+
 # DEFAULT FUNCTIONS
 
 """Buat jarak di Webpage
@@ -109,7 +156,8 @@ def show_paragraf(text):
 """Baca file menggunakan Pandas
 
 Fungsi-fungsi untuk membaca file menggunakan Pandas dengan format file
-yang diharapkan berupa file.csv, file.xlsx, dan sejenisnya.
+yang diharapkan berupa file.csv, file.xlsx, dan sejenisnya. File .json
+(manifest dan metadata) dibaca dan ditulis dengan modul json.
 """
 
 def get_csv(filepath):
@@ -118,6 +166,18 @@ def get_csv(filepath):
 def get_excel(filepath):
     return pd.read_excel(filepath)
 
+def get_json(filepath, default= None):
+    if not os.path.exists(filepath):
+        return default
+    with open(filepath, "r") as f:
+        return json.load(f)
+
+def put_json(filepath, data):
+    tmp = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent= 1)
+    os.replace(tmp, filepath) # tulis atomik
+
 def mk_dir(dirname):
     """Buat folder pada direktori lokal
 
@@ -132,258 +192,4096 @@ def mk_dir(dirname):
     if not os.path.exists(dirname):
         os.makedirs(dirname)
 
-# CUSTOM FUNCTIONS
-        
-def get_musik(directory):
-    """Baca file musik
+def n_workers(n_jobs):
+    """Jumlah proses worker
 
-    File musik yang telah dibagi per folder (per genre) akan dibaca
-    disini. Penjelajahan file dilakukan dengan os yang nantinya akan
-    mendapatkan 3 elemen dari data: filepath, filename, dan genre
-    musik.
+    Konversi nilai `n_jobs` menjadi jumlah proses yang digunakan,
+    mengikuti konvensi scikit-learn.
 
     Parameters
     ----------
-    directory : string
-        Jalur utama tempat file musik akan diakses.
+    n_jobs : int or None
+        Jumlah proses. None atau 1 berarti tanpa paralelisasi, -1 berarti
+        semua core CPU, -2 berarti semua core kecuali satu, dan
+        seterusnya. Core CPU dihitung dari affinity proses (misal
+        dibatasi taskset, cgroup cpuset atau container) jika tersedia,
+        bukan jumlah core mesin.
 
     Returns
     -------
-    df : object DataFrame or TextFileReader
-        File csv (comma-separated values) dikembalikan sebagai
-        struktur data dua dimensi dengan sumbu yang diberi label.
+    n : int
+        Jumlah proses worker, minimal 1.
     """
-    temp_filepath, temp_genre, temp_filename = [], [], []
-    for _dir in os.listdir(directory): # main directory
-        folderpath = os.path.join(directory, _dir)
-        if os.path.isdir(folderpath):
-            for filename in os.listdir(folderpath): # genre directory
-                filepath = os.path.join(folderpath, filename)
+    if hasattr(os, "sched_getaffinity"):
+        cpu = len(os.sched_getaffinity(0))
+    else: # Windows, macOS
+        cpu = os.cpu_count() or 1
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpu + 1 + n_jobs)
+    return min(n_jobs, cpu)
 
-                temp_filepath.append(filepath)
-                temp_filename.append(filename)
-                temp_genre.append(_dir)
-        else:
-            temp_filepath.append(folderpath)
-            temp_filename.append(_dir)
-            temp_genre.append(directory)
-
-    df = pd.DataFrame({
-        "filepath": temp_filepath,
-        "filename": temp_filename,
-        "genre": temp_genre
-    })
-    return df
+def file_hash(filepath, chunk_size= 1 << 20):
+    """Hash isi file
 
-@st.cache_data(ttl= 3600, show_spinner= "Fetching data...")
-def ekstraksi_fitur_mfcc(df, duration= 30, coef= 13):
-    """Ekstraksi Fitur MFCC
+    Hash SHA-1 dari isi file dibaca per blok sehingga file berukuran
+    besar tidak perlu dimuat seluruhnya ke memori.
 
-    Fitur audio MFCC didasarkan pada persepsi pendengaran
-    manusia. Ekstraksi MFCC dilakukan dengan menggunakan Librosa
-    yang menyediakan pemrosesan audio.
+    Parameters
+    ----------
+    filepath : string
+        Jalur file yang akan di-hash.
+
+    chunk_size : int, default=1048576
+        Ukuran blok pembacaan dalam byte.
+
+    Returns
+    -------
+    digest : string
+        Hash SHA-1 dalam format heksadesimal.
+    """
+    h = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+# CUSTOM FUNCTIONS
+
+"""Instrumentasi
+
+Waktu (wall dan CPU) dan puncak memori setiap tahap ekstraksi dan
+pelatihan dicatat hanya di dalam blok `profiling`. Di luar blok tersebut
+`stage` mengembalikan context manager kosong sehingga biayanya hanya
+satu pemanggilan fungsi. Catatan bersifat per thread, sehingga sesi
+Streamlit yang berjalan bersamaan tidak saling mencampur catatan.
+"""
+
+LOG_DIR = "./data/logs"
+
+_PROFILE = threading.local()
+_NO_STAGE = nullcontext()
+
+class _Stage():
+    """Satu tahap yang sedang diukur, lihat `stage`"""
+
+    __slots__ = ("name", "tags", "wall", "cpu", "peak")
+
+    def __init__(self, name, tags):
+        self.name = name
+        self.tags = tags
+
+    def __enter__(self):
+        stack = _PROFILE.stack
+        if _PROFILE.memory:
+            if stack: # simpan puncak induk sebelum direset
+                parent = stack[-1]
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self.peak = 0
+        stack.append(self)
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        stack = _PROFILE.stack
+        stack.pop()
+
+        peak = None
+        if _PROFILE.memory:
+            peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+
+        _PROFILE.records.append({
+            "stage": self.name, **self.tags, "wall_s": wall, "cpu_s": cpu,
+            "peak_mb": None if peak is None else peak / 1024 ** 2,
+            "depth": len(stack), "pid": os.getpid()
+        })
+        return False
+
+def stage(name, **tags):
+    """Ukur satu tahap (context manager)
 
     Parameters
     ----------
-    df : object DataFrame
-        Object DataFrame tempat semua file musik (path file) tersimpan.
+    name : string
+        Nama tahap, misal "decode" atau "fit".
 
-    duration : int or float
-        Durasi musik yang di ekstrak.
-        
-    coef : int
-        Jumlah koefisien MFCC yang ingin dihitung.
+    **tags
+        Keterangan tambahan yang dicatat, misal `file` atau `fold`.
+    """
+    if getattr(_PROFILE, "records", None) is None:
+        return _NO_STAGE
+    return _Stage(name, tags)
+
+@contextmanager
+def profiling(memory= True):
+    """Aktifkan instrumentasi pada thread ini
+
+    Parameters
+    ----------
+    memory : bool, default=True
+        Ukur puncak memori setiap tahap dengan `tracemalloc`. Alokasi
+        memori menjadi lebih lambat selama pengukuran.
+
+    Yields
+    ------
+    records : list of dict
+        Catatan setiap tahap (stage, tag, wall_s, cpu_s, peak_mb, depth,
+        pid), diisi saat tahap selesai. Tahap di proses worker
+        (`imap_workers`) ikut dikumpulkan.
+    """
+    records = []
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    _PROFILE.records, _PROFILE.stack, _PROFILE.memory = records, [], memory
+    try:
+        yield records
+    finally:
+        _PROFILE.records = None
+        if started:
+            tracemalloc.stop()
+
+def _profiled_task(func, memory, *args):
+    """Jalankan `func` di proses worker dengan instrumentasi aktif"""
+    with profiling(memory) as records:
+        result = func(*args)
+    return result, records
+
+def ringkas_profil(records):
+    """Ringkasan catatan instrumentasi per tahap
 
     Returns
     -------
-    res : object DataFrame
-        DataFrame dari data musik dengan fitur dan label yang dicatat.
+    summary : object DataFrame
+        Jumlah, total dan rata-rata wall time, total CPU time, dan puncak
+        memori untuk setiap tahap, urut dari total wall time terbesar.
     """
-    mfcc_feature = []
-    for _dir in df.iloc[:, 0]:
-        y, sr = librosa.load(_dir, duration= duration)
-        mfcc = librosa.feature.mfcc(y= y, sr= sr, n_mfcc= coef)
-        
-        feature = np.mean(mfcc, axis= 1)
-        mfcc_feature.append(feature)
-    
-    res = pd.DataFrame({
-        "filename": df.iloc[:, 1],
-        **{f"mfcc_{i + 1}": [x[i] for x in mfcc_feature] for i in range(coef)},
-        "genre": df.iloc[:, -1]
-    })
-    return res
+    df = pd.DataFrame(records, columns= ["stage", "wall_s", "cpu_s", "peak_mb"])
+    return df.groupby("stage").agg(
+        jumlah= ("wall_s", "size"), wall_total_s= ("wall_s", "sum"),
+        wall_rata_s= ("wall_s", "mean"), cpu_total_s= ("cpu_s", "sum"),
+        peak_mb= ("peak_mb", "max")
+    ).sort_values("wall_total_s", ascending= False).reset_index()
 
-@st.cache_data(ttl= 3600, show_spinner= "Train model...")
-def tuned_model(features, labels, params, K= 5):
-    """Train model tuned
+def simpan_profil(records, name, log_dir= LOG_DIR, **meta):
+    """Simpan catatan instrumentasi sebagai log JSON (satu objek per baris)
 
-    Pelatihan model menggunakan Random Forest dengan hypertuning parameter
-    dan validasi KFold.
+    Parameters
+    ----------
+    records : list of dict
+        Catatan dari `profiling`.
+
+    name : string
+        Nama proses yang diukur, misal "ekstraksi" atau "klasifikasi".
+
+    log_dir : string, default=LOG_DIR
+        Folder log.
+
+    **meta
+        Keterangan yang ditambahkan ke setiap baris, misal parameter.
+
+    Returns
+    -------
+    path : string
+        Jalur file log.
+    """
+    mk_dir(log_dir)
+    run = time.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(log_dir, f"{name}-{run}-{os.getpid()}.jsonl")
+    with open(path, "w") as f:
+        for record in records:
+            f.write(json.dumps(
+                {"run": run, "name": name, **meta, **record}, default= str
+            ) + "\n")
+    return path
+
+LOGMEL_CACHE_DIR = "./data/cache/logmel"
+
+class LogMelCache():
+    """Cache log-mel spectrogram pada disk
+
+    Menyimpan log-mel spectrogram hasil decode file musik sehingga
+    MFCC dengan jumlah koefisien berapa pun dapat dihitung ulang hanya
+    dengan langkah DCT, tanpa decode audio. Cache dikunci oleh hash isi
+    file, sample rate, durasi, offset, dan mode decode. Jika ukuran total melebihi batas,
+    entri yang paling lama tidak diakses akan dihapus (LRU).
 
     Parameters
     ----------
-    features : ndarray or shape (n_samples, n_features)
-        Sampel OOB (Out-of-Bag).
+    cache_dir : string, default=LOGMEL_CACHE_DIR
+        Folder tempat cache disimpan.
 
-    labels : ndarray or shape (n_samples, 1, n_outputs)
-        Label sampel OOB.
+    max_bytes : int, default=2 GiB
+        Batas ukuran total cache dalam byte.
+    """
 
-    K : int
-        Jumlah subset Fold.
+    def __init__(self, cache_dir= LOGMEL_CACHE_DIR, max_bytes= 2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
 
-    params : object Array
-        Nilai parameter yang digunakan untuk hypertuning
-        parameter model Random Forest.
+    def key(self, filepath, sr, duration, offset= 0.0, decode= "default"):
+        key = f"{file_hash(filepath)}_{sr}_{duration}"
+        if offset or decode != "default":
+            key += f"_{offset}_{decode}"
+        return key
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def get(self, key):
+        """Ambil log-mel dari cache, None jika tidak ada"""
+        path = self._path(key)
+        try:
+            S = np.load(path)
+        except (OSError, ValueError):
+            return None
+        os.utime(path) # tandai sebagai baru diakses (LRU)
+        return S
+
+    def put(self, key, S):
+        """Simpan log-mel ke cache secara atomik"""
+        mk_dir(self.cache_dir)
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, S.astype(np.float32))
+        os.replace(tmp, path)
+
+    def evict(self):
+        """Hapus entri terlama hingga ukuran cache di bawah batas"""
+        return _evict_lru(self.cache_dir, ".npy", self.max_bytes)
+
+def _evict_lru(cache_dir, suffix, max_bytes):
+    """Hapus file cache terlama (mtime) hingga ukuran total di bawah batas
 
     Returns
     -------
-    score : object DataFrame
-        Hasil pelatihan yang menyimpan nilai metrics evaluasi.
-    
-    params : object DataFrame
-        Nilai parameter yang digunakan dalam pelatihan model.
+    n_removed : int
+        Jumlah file yang dihapus.
     """
-    kfold = KFold(n_splits= K, shuffle= True, random_state= 42)
-    
-    metrics_eval = {
-        "akurasi": 0, "presisi": 0, "recall": 0, "f1-score": 0
-    }
-    param_values = {}
-    temp_ = 0
+    if not os.path.isdir(cache_dir):
+        return 0
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(suffix):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        total -= size
+    return removed
 
-    for pair in product(*params):
-        model = RandomForestClassifier(
-            criterion= pair[0], max_depth= pair[1],
-            n_estimators= pair[2], max_features= pair[3],
-            min_samples_split= pair[4]
-        )
+@contextmanager
+def _file_lock(path):
+    """Lock eksklusif antar proses memakai file `path`"""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
 
-        for tr_index, ts_index in kfold.split(features):
-            X_train, X_test = features[tr_index], features[ts_index]
-            y_train, y_test = labels[tr_index], labels[ts_index]
+RESULT_CACHE_DIR = "./data/cache/result"
 
-            model.fit(X_train, y_train)
-            y_pred = model.predict(X_test)
+_CACHE_COUNTERS = ("hits", "misses", "stores", "evictions", "saved_s")
 
-            score_ = accuracy_score(y_test, y_pred)
+class ResultCache():
+    """Cache hasil fungsi pada disk
 
-            if temp_ < score_:
-                temp_ = score_
+    Hasil ekstraksi dan pelatihan disimpan sebagai file pickle yang
+    dikunci oleh nama fungsi dan sidik jari argumennya (lihat
+    `cached_result`), sehingga tetap tersedia setelah aplikasi restart
+    dan dapat dipakai bersama oleh semua sesi dan proses. Jika ukuran
+    total melebihi batas, entri yang paling lama tidak diakses akan
+    dihapus (LRU).
 
-                metrics_eval["akurasi"] = score_
-                metrics_eval["presisi"] = precision_score(y_test, y_pred, average= "macro")
-                metrics_eval["recall"] = recall_score(y_test, y_pred, average= "macro")
-                metrics_eval["f1-score"] = f1_score(y_test, y_pred, average= "macro")
+    Jumlah hit, miss, store, dan eviksi dicatat di memori dan
+    ditambahkan ke `stats.json` di folder cache (di bawah lock antar
+    proses) dengan `flush`, sekali per pemanggilan `cached_result` dan
+    saat proses berakhir, lihat `stats`.
 
-                param_values["criterion"] = pair[0]
-                param_values["max_depth"] = pair[1]
-                param_values["n_estimators"] = pair[2]
-                param_values["max_features"] = pair[3]
-                param_values["min_samples_split"] = pair[4]
+    Parameters
+    ----------
+    cache_dir : string, default=RESULT_CACHE_DIR
+        Folder tempat cache disimpan.
 
-    score = pd.DataFrame(metrics_eval, index= [0])
-    params = pd.DataFrame(param_values, index= [0])
-    return score, params
+    max_bytes : int, default=512 MiB
+        Batas ukuran total cache dalam byte.
+    """
 
-@st.cache_data(ttl= 3600, show_spinner= "Train model...")
-def basic_model(
-    features, labels, K= 5, criterion= "gini", max_depth= None,
-    n_estimators= 100, max_features= "sqrt", min_samples_split= 2
+    _pending = {} # {cache_dir: counter} milik proses ini yang belum ditulis
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir= RESULT_CACHE_DIR, max_bytes= 512 * 1024 ** 2):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _count(self, **counts):
+        with self._lock:
+            counter = self._pending.setdefault(
+                self.cache_dir, dict.fromkeys(_CACHE_COUNTERS, 0)
+            )
+            for name, n in counts.items():
+                counter[name] += n
+
+    def flush(self):
+        """Tambahkan counter proses ini ke `stats.json`
+
+        File `stats-<pid>.json` dari versi sebelumnya ikut digabung lalu
+        dihapus.
+        """
+        with self._lock:
+            counter = self._pending.pop(self.cache_dir, None)
+        legacy = glob.glob(os.path.join(self.cache_dir, "stats-*.json"))
+        if not counter and not legacy:
+            return
+        mk_dir(self.cache_dir)
+        path = os.path.join(self.cache_dir, "stats.json")
+        with _file_lock(os.path.join(self.cache_dir, "stats.lock")):
+            total = dict.fromkeys(_CACHE_COUNTERS, 0)
+            for counts in [get_json(path, {}), counter] + [
+                get_json(old, {}) for old in legacy
+            ]:
+                for name, n in (counts or {}).items():
+                    if name in total:
+                        total[name] += n
+            put_json(path, total)
+            for old in legacy:
+                os.remove(old)
+
+    @classmethod
+    def flush_all(cls):
+        """Tulis counter semua folder cache milik proses ini"""
+        for cache_dir in list(cls._pending):
+            cls(cache_dir).flush()
+
+    def get(self, key):
+        """Ambil hasil dari cache
+
+        Returns
+        -------
+        hit : bool
+            True jika hasil ada di cache.
+
+        value : object
+            Hasil yang disimpan, None jika tidak ada.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                elapsed, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self._count(misses= 1)
+            return False, None
+        os.utime(path) # tandai sebagai baru diakses (LRU)
+        self._count(hits= 1, saved_s= elapsed)
+        return True, value
+
+    def put(self, key, value, elapsed= 0.0):
+        """Simpan hasil ke cache secara atomik
+
+        `elapsed` adalah waktu komputasi hasil (detik), dijumlahkan ke
+        `saved_s` setiap kali hasil diambil dari cache.
+        """
+        mk_dir(self.cache_dir)
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((elapsed, value), f, protocol= pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._count(stores= 1)
+
+    def evict(self):
+        """Hapus entri terlama hingga ukuran cache di bawah batas"""
+        removed = _evict_lru(self.cache_dir, ".pkl", self.max_bytes)
+        if removed:
+            self._count(evictions= removed)
+        return removed
+
+    def stats(self):
+        """Statistik cache dari semua proses
+
+        Returns
+        -------
+        stats : dict
+            Jumlah hits, misses, stores, evictions, waktu komputasi yang
+            dihemat (saved_s), hit_rate, serta jumlah entri dan ukuran
+            cache saat ini.
+        """
+        self.flush()
+        total = dict.fromkeys(_CACHE_COUNTERS, 0)
+        total.update(get_json(os.path.join(self.cache_dir, "stats.json"), {}))
+
+        sizes = [
+            entry.stat().st_size for entry in os.scandir(self.cache_dir)
+            if entry.name.endswith(".pkl")
+        ] if os.path.isdir(self.cache_dir) else []
+        lookups = total["hits"] + total["misses"]
+        return {
+            **total, "hit_rate": total["hits"] / lookups if lookups else 0.0,
+            "entries": len(sizes), "bytes": sum(sizes),
+            "max_bytes": self.max_bytes
+        }
+
+atexit.register(ResultCache.flush_all) # counter yang belum ditulis
+
+def fingerprint(value):
+    """Sidik jari murah dari argumen fungsi
+
+    Array numerik di-hash langsung dari buffer memorinya, DataFrame dari
+    hash per baris pandas, dan nilai lain dari representasi JSON.
+
+    Returns
+    -------
+    digest : string
+        SHA-1 hex digest.
+    """
+    h = hashlib.sha1()
+    if isinstance(value, np.ndarray):
+        h.update(f"{value.dtype.str}{value.shape}".encode())
+        if value.dtype == object:
+            h.update("\0".join(map(str, value.ravel())).encode())
+        else:
+            h.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        names = value.columns if isinstance(value, pd.DataFrame) else value.name
+        h.update(repr(names).encode())
+        h.update(pd.util.hash_pandas_object(value, index= True).to_numpy().data)
+    else:
+        h.update(json.dumps(value, sort_keys= True, default= repr).encode())
+    return h.hexdigest()
+
+def fingerprint_musik(df):
+    """Sidik jari daftar musik beserta ukuran dan mtime setiap file
+
+    Hasil ekstraksi ikut berubah jika isi file musik berubah meskipun
+    daftar musik sama, sehingga `os.stat` setiap file dimasukkan ke
+    dalam sidik jari.
+    """
+    h = hashlib.sha1(fingerprint(df).encode())
+    for filepath in df.iloc[:, 0]:
+        try:
+            stat = os.stat(filepath)
+            h.update(f"{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        except OSError:
+            h.update(b"-\n")
+    return h.hexdigest()
+
+def cached_result(
+    version= 1, fingerprints= None, ignore= (), cache_dir= RESULT_CACHE_DIR,
+    max_bytes= 512 * 1024 ** 2
 ):
-    """Train model basic
+    """Decorator cache hasil fungsi pada disk
 
-    Pelatihan model menggunakan Random Forest dengan beberapa
-    persiapan seperti setting parameter dan validasi KFold.
+    Kunci cache adalah nama fungsi, `version`, dan sidik jari setiap
+    argumen (setelah nilai default diterapkan). Naikkan `version` jika
+    hasil fungsi berubah untuk argumen yang sama.
 
     Parameters
     ----------
-    features : ndarray or shape (n_samples, n_features)
-        Sampel OOB (Out-of-Bag).
+    version : int, default=1
+        Versi hasil fungsi.
 
-    labels : ndarray or shape (n_samples, 1, n_outputs)
-        Label sampel OOB.
+    fingerprints : dict, default=None
+        Fungsi sidik jari khusus untuk argumen tertentu, {nama argumen:
+        fungsi}. Argumen lain memakai `fingerprint`.
 
-    K : int
-        Jumlah subset Fold.
+    ignore : tuple of string, default=()
+        Argumen yang tidak memengaruhi hasil (misal `n_jobs`) dan tidak
+        dimasukkan ke dalam kunci.
 
-    criterion : {"gini", "entropy", "log_loss"}, default="gini"
-        Fungsi untuk mengatur kualitas dari pembagian. Kriteria
-        yang didukung adalah "gini" untuk Gini impurity dan
-        "log_loss" dan "entropy" keduanya untuk Shannon
-        information gain.
+    cache_dir, max_bytes
+        Lihat `ResultCache`.
+    """
+    fingerprints = fingerprints or {}
 
-    max_depth : int, default=None
-        Kedalaman maksimum pohon. Jika None, maka node
-        diperluas hingga semua daun murni (pure) atau hingga
-        semua daun berisi kurang dari min_samples_split sampel.
+    def decorator(func):
+        signature = inspect.signature(func)
 
-    n_estimators : int, default=100
-        Jumlah trees dalam forest.
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            parts = [f"{func.__qualname__}:{version}"] + [
+                f"{name}={fingerprints.get(name, fingerprint)(value)}"
+                for name, value in bound.arguments.items() if name not in ignore
+            ]
+            key = hashlib.sha1("\n".join(parts).encode()).hexdigest()
 
-    max_features : {"sqrt", "log2", None}, int or float, default="sqrt"
-        Jumlah fitur yang perlu dipertimbangkan saat mencari pemisahan terbaik:
+            cache = ResultCache(cache_dir, max_bytes)
+            if getattr(_PROFILE, "records", None) is None: # ukur komputasi asli
+                hit, value = cache.get(key)
+                if hit:
+                    cache.flush()
+                    return value
 
-        - Jika int, mempertimbangkan fitur `max_features` di setiap pemisahan.
-        - Jika float, maka `max_features` adalah pecahan dan fitur
-          `max(1, int(max_features * n_features_in_))` dipertimbangkan di
-          setiap pemisahan.
-        - Jika "sqrt", maka `max_features=sqrt(n_features)`.
-        - Jika "log2", maka `max_features=log2(n_features)`.
-        - Jika None, maka `max_features=n_features`.
+            start = time.perf_counter()
+            value = func(*args, **kwargs)
+            cache.put(key, value, elapsed= time.perf_counter() - start)
+            cache.evict()
+            cache.flush()
+            return value
+        return wrapper
+    return decorator
 
-    min_samples_split : int or float, default=2
-        Jumlah minimum sampel yang diperlukan untuk memisahkan node internal:
+MANIFEST_PATH = "./data/dataframe/manifest.json"
 
-        - Jika int, maka `min_samples_split` dianggap sebagai nilai minimum.
-        - Jika float, maka `min_samples_split` adalah pecahan dan
-          `ceil(min_samples_split * n_samples)` adalah minimumnya jumlah
-          sampel untuk setiap pemisahan.
+def _scan_musik(directory):
+    """Jelajahi file musik dengan os.scandir
+
+    Menghasilkan tuple (filepath, filename, genre, stat) untuk setiap
+    file. Struktur folder sama seperti `get_musik`: subfolder pertama
+    adalah genre, file yang langsung berada di `directory` diberi genre
+    `directory`. Entri diurutkan berdasarkan nama agar hasil selalu
+    sama di setiap platform.
+    """
+    with os.scandir(directory) as it:
+        entries = sorted(it, key= lambda entry: entry.name)
+
+    for entry in entries: # main directory
+        if entry.is_dir():
+            with os.scandir(entry.path) as it:
+                files = sorted(it, key= lambda e: e.name)
+            for file in files: # genre directory
+                yield file.path, file.name, entry.name, file.stat()
+        else:
+            yield entry.path, entry.name, directory, entry.stat()
+
+def get_musik(directory):
+    """Baca file musik
+
+    File musik yang telah dibagi per folder (per genre) akan dibaca
+    disini. Penjelajahan file dilakukan dengan os yang nantinya akan
+    mendapatkan 3 elemen dari data: filepath, filename, dan genre
+    musik.
+
+    Parameters
+    ----------
+    directory : string
+        Jalur utama tempat file musik akan diakses.
 
     Returns
     -------
-    score : object DataFrame
-        Hasil pelatihan yang menyimpan nilai metrics evaluasi.
-    
-    params : object DataFrame
-        Nilai parameter yang digunakan dalam pelatihan model.
+    df : object DataFrame or TextFileReader
+        File csv (comma-separated values) dikembalikan sebagai
+        struktur data dua dimensi dengan sumbu yang diberi label.
     """
-    kfold = KFold(n_splits= K, shuffle= True, random_state= 42)
+    rows = [row[:3] for row in _scan_musik(directory)]
+    return pd.DataFrame(rows, columns= ["filepath", "filename", "genre"])
 
-    metrics_eval = {
-        "akurasi": 0, "presisi": 0, "recall": 0, "f1-score": 0
+def diff_manifest(old, new):
+    """Bandingkan dua manifest
+
+    Parameters
+    ----------
+    old, new : dict
+        Pemetaan {filepath: hash isi file}.
+
+    Returns
+    -------
+    diff : dict
+        Daftar filepath "added", "removed", dan "changed".
+    """
+    return {
+        "added": [fp for fp in new if fp not in old],
+        "removed": [fp for fp in old if fp not in new],
+        "changed": [fp for fp in new if fp in old and old[fp] != new[fp]]
     }
-    param_values = {}
 
-    for tr_index, ts_index in kfold.split(features):
-        X_train, X_test = features[tr_index], features[ts_index]
-        y_train, y_test = labels[tr_index], labels[ts_index]
+def scan_musik(directory, manifest_path= MANIFEST_PATH):
+    """Scan inkremental file musik dengan manifest
 
-        model = RandomForestClassifier(
-            criterion= criterion, max_depth= max_depth,
-            n_estimators= n_estimators, max_features= max_features,
-            min_samples_split= min_samples_split, random_state= 42
-        )
+    Manifest menyimpan ukuran, mtime, dan hash isi setiap file. Hash
+    hanya dihitung ulang untuk file yang ukuran atau mtime-nya berubah,
+    sehingga scan berikutnya hanya membaca metadata file. Manifest
+    ditulis ulang hanya jika ada perubahan.
 
-        model.fit(X_train, y_train)
-        y_pred = model.predict(X_test)
+    Parameters
+    ----------
+    directory : string
+        Jalur utama tempat file musik akan diakses.
 
-        metrics_eval["akurasi"] += accuracy_score(y_test, y_pred)
-        metrics_eval["presisi"] += precision_score(y_test, y_pred, average= "macro")
-        metrics_eval["recall"] += recall_score(y_test, y_pred, average= "macro")
-        metrics_eval["f1-score"] += f1_score(y_test, y_pred, average= "macro")
+    manifest_path : string, default=MANIFEST_PATH
+        Jalur file manifest (.json).
 
-    metrics_eval["akurasi"] /= K
-    metrics_eval["presisi"] /= K
-    metrics_eval["recall"] /= K
-    metrics_eval["f1-score"] /= K
-    
-    param_values["criterion"] = criterion
-    param_values["max_depth"] = max_depth
-    param_values["n_estimators"] = n_estimators
-    param_values["max_features"] = max_features
-    param_values["min_samples_split"] = min_samples_split
+    Returns
+    -------
+    df : object DataFrame
+        Daftar musik dengan kolom filepath, filename, dan genre seperti
+        pada `get_musik`.
 
-    score = pd.DataFrame(metrics_eval, index= [0])
-    params = pd.DataFrame(param_values, index= [0])
-    return score, params
\ No newline at end of file
+    diff : dict
+        Daftar filepath yang ditambahkan ("added"), dihapus ("removed"),
+        dan berubah isinya ("changed") sejak scan sebelumnya.
+    """
+    old = get_json(manifest_path, {}).get("files", {})
+    new, rows = {}, []
+    for filepath, filename, genre, stat in _scan_musik(directory):
+        prev = old.get(filepath)
+        if prev and prev["size"] == stat.st_size and prev["mtime"] == stat.st_mtime:
+            digest = prev["hash"]
+        else:
+            digest = file_hash(filepath)
+
+        new[filepath] = {
+            "filename": filename, "genre": genre, "size": stat.st_size,
+            "mtime": stat.st_mtime, "hash": digest
+        }
+        rows.append((filepath, filename, genre))
+
+    diff = diff_manifest(
+        {fp: v["hash"] for fp, v in old.items()},
+        {fp: v["hash"] for fp, v in new.items()}
+    )
+    if new != old:
+        mk_dir(os.path.dirname(manifest_path))
+        put_json(manifest_path, {"directory": directory, "files": new})
+
+    df = pd.DataFrame(rows, columns= ["filepath", "filename", "genre"])
+    return df, diff
+
+LIST_PATH = "./data/dataframe/list-musik.csv"
+
+class IndexMusik():
+    """Indeks daftar musik di memori yang diperbarui oleh file watcher
+
+    Folder musik di-scan sekali saat `start`, lalu hanya di-scan ulang
+    (`scan_musik`, inkremental) jika watcher melaporkan perubahan.
+    Watcher menggunakan watchdog (inotify di Linux) dan kembali ke
+    polling metadata file jika watchdog tidak tersedia atau gagal. File
+    daftar musik (.csv) hanya ditulis ulang jika indeks berubah.
+
+    Parameters
+    ----------
+    directory : string
+        Jalur utama tempat file musik akan diakses.
+
+    manifest_path : string, default=MANIFEST_PATH
+        Jalur file manifest, lihat `scan_musik`.
+
+    list_path : string, default=LIST_PATH
+        Jalur file daftar musik (.csv).
+
+    mode : {"auto", "watchdog", "polling"}, default="auto"
+        Jenis watcher. Gunakan "polling" untuk folder pada network
+        share yang tidak mengirim event inotify.
+
+    interval : float, default=5.0
+        Jeda polling (detik).
+
+    debounce : float, default=0.5
+        Jeda sebelum scan ulang agar banyak event beruntun (misal salin
+        banyak file) cukup diproses dengan satu scan.
+
+    Attributes
+    ----------
+    mode : string
+        Watcher yang aktif ("watchdog" atau "polling").
+
+    version : int
+        Bertambah setiap kali indeks berubah.
+    """
+
+    def __init__(
+        self, directory, manifest_path= MANIFEST_PATH, list_path= LIST_PATH,
+        mode= "auto", interval= 5.0, debounce= 0.5
+    ):
+        self.directory = directory
+        self.manifest_path = manifest_path
+        self.list_path = list_path
+        self.mode = mode
+        self.interval = interval
+        self.debounce = debounce
+        self.version = 0
+        self._df = None
+        self._diff = {"added": [], "removed": [], "changed": []}
+        self._signature = None
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._observer = None
+        self._thread = None
+
+    def _stat_signature(self):
+        return [
+            (fp, stat.st_size, stat.st_mtime)
+            for fp, _, _, stat in _scan_musik(self.directory)
+        ]
+
+    def refresh(self):
+        """Scan ulang folder dan perbarui indeks jika ada perubahan
+
+        Returns
+        -------
+        changed : bool
+            True jika indeks berubah.
+        """
+        with self._lock:
+            signature = self._stat_signature()
+            if signature == self._signature:
+                return False
+            df, diff = scan_musik(self.directory, self.manifest_path)
+            self._signature = signature
+
+            changed = self._df is None or any(diff.values())
+            if any(diff.values()) or not os.path.exists(self.list_path):
+                mk_dir(os.path.dirname(self.list_path) or ".")
+                df.to_csv(self.list_path, index= False)
+            if changed:
+                self._df, self._diff = df, diff
+                self.version += 1
+            return changed
+
+    def snapshot(self):
+        """Daftar musik terkini
+
+        Returns
+        -------
+        df : object DataFrame
+            Daftar musik (filepath, filename, genre).
+
+        diff : dict
+            Perubahan terakhir pada indeks, lihat `diff_manifest`.
+        """
+        with self._lock:
+            return self._df, self._diff
+
+    def start(self):
+        """Scan awal dan jalankan watcher di background thread"""
+        self.refresh()
+        if self.mode in ("auto", "watchdog"):
+            try:
+                self._observer = self._watchdog()
+                self.mode = "watchdog"
+            except (ImportError, OSError):
+                if self.mode == "watchdog":
+                    raise
+                self._observer = None
+        if self._observer is None:
+            self.mode = "polling"
+
+        self._thread = threading.Thread(
+            target= self._run, name= f"IndexMusik({self.directory})",
+            daemon= True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Hentikan watcher"""
+        self._stop.set()
+        self._dirty.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _watchdog(self):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        dirty = self._dirty
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type not in ("opened", "closed_no_write"):
+                    dirty.set()
+
+        observer = Observer()
+        observer.schedule(Handler(), self.directory, recursive= True)
+        observer.start()
+        return observer
+
+    def _run(self):
+        while not self._stop.is_set():
+            timeout = None if self._observer is not None else self.interval
+            if self._dirty.wait(timeout):
+                time.sleep(self.debounce)
+                self._dirty.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.refresh()
+            except OSError: # folder sedang berubah, coba lagi pada event berikutnya
+                pass
+
+_INDEX_MUSIK = {}
+_INDEX_LOCK = threading.Lock()
+
+def index_musik(directory, **kwargs):
+    """Indeks daftar musik bersama untuk satu folder
+
+    Satu `IndexMusik` dibuat dan dijalankan per folder per proses,
+    sehingga dipakai bersama oleh semua sesi aplikasi.
+
+    Parameters
+    ----------
+    directory : string
+        Jalur utama tempat file musik akan diakses.
+
+    **kwargs
+        Argumen untuk `IndexMusik` saat indeks pertama kali dibuat.
+    """
+    with _INDEX_LOCK:
+        index = _INDEX_MUSIK.get(directory)
+        if index is None:
+            index = _INDEX_MUSIK[directory] = IndexMusik(directory, **kwargs).start()
+    return index
+
+DECODE_MODES = ["default", "fast", "native"]
+
+def _sf_load(filepath, offset= 0.0, duration= None, block= 65536):
+    """Decode sebagian file audio dengan soundfile
+
+    Hanya frame pada jendela [offset, offset + duration) yang dibaca, dan
+    downmix ke mono dilakukan per blok saat decode sehingga sinyal stereo
+    utuh tidak pernah disimpan di memori.
+
+    Returns
+    -------
+    y : ndarray of shape (n_samples,)
+        Sinyal mono float32.
+
+    sr : int
+        Sample rate asli file.
+    """
+    with sf.SoundFile(filepath) as f:
+        sr = f.samplerate
+        start = min(int(round(offset * sr)), f.frames)
+        if start:
+            f.seek(start)
+
+        frames = f.frames - start
+        if duration is not None:
+            frames = min(frames, int(round(duration * sr)))
+
+        y = np.empty(frames, dtype= np.float32)
+        pos = 0
+        while pos < frames:
+            data = f.read(min(block, frames - pos), dtype= "float32", always_2d= True)
+            if not len(data):
+                break
+            y[pos:pos + len(data)] = data.mean(axis= 1)
+            pos += len(data)
+    return y[:pos], sr
+
+def load_audio(filepath, sr= 22050, duration= None, offset= 0.0, decode= "default"):
+    """Baca file audio
+
+    Parameters
+    ----------
+    filepath : string
+        Jalur file audio.
+
+    sr : int, default=22050
+        Sample rate tujuan. Diabaikan pada mode "native".
+
+    duration : int or float, default=None
+        Panjang jendela audio yang dibaca (detik). Jika None, baca
+        hingga akhir file.
+
+    offset : int or float, default=0.0
+        Awal jendela audio (detik).
+
+    decode : {"default", "fast", "native"}, default="default"
+        Mode decode:
+
+        - "default": `librosa.load` dengan resampler kualitas tinggi
+          (soxr_hq), sama seperti sebelumnya.
+        - "fast": decode sebagian dengan soundfile, downmix mono saat
+          decode, lalu resample dengan resampler cepat (soxr_qq).
+        - "native": seperti "fast" tetapi tanpa resample, sinyal
+          dikembalikan dengan sample rate asli file.
+
+        Jika soundfile tidak dapat membaca file (misal MP3 pada
+        libsndfile < 1.1), mode "fast" dan "native" kembali ke
+        `librosa.load` dengan resampler cepat.
+
+    Returns
+    -------
+    y : ndarray of shape (n_samples,)
+        Sinyal mono float32.
+
+    sr : int
+        Sample rate dari `y`.
+    """
+    if decode == "default":
+        with stage("decode", file= filepath): # termasuk resample
+            return librosa.load(filepath, sr= sr, offset= offset, duration= duration)
+    if decode not in DECODE_MODES:
+        raise ValueError(f"Mode decode tidak dikenal: {decode}")
+
+    with stage("decode", file= filepath):
+        try:
+            y, native_sr = _sf_load(filepath, offset= offset, duration= duration)
+        except RuntimeError: # soundfile tidak dapat membaca format file
+            return librosa.load(
+                filepath, sr= None if decode == "native" else sr, offset= offset,
+                duration= duration, res_type= "soxr_qq"
+            )
+
+    if decode == "native" or native_sr == sr:
+        return y, native_sr
+    with stage("resample", file= filepath):
+        return librosa.resample(
+            y, orig_sr= native_sr, target_sr= sr, res_type= "soxr_qq"
+        ), sr
+
+def _logmel(
+    filepath, duration, cache= None, offset= 0.0, decode= "default",
+    linear= False
+):
+    """Log-mel spectrogram satu file musik, dari cache jika tersedia
+
+    Jika `linear`, magnitude spectrogram (STFT) juga dikembalikan. STFT
+    hanya dihitung sekali dan log-mel diturunkan dari STFT yang sama.
+    Karena magnitude spectrogram tidak disimpan di cache, audio selalu
+    di-decode pada mode ini.
+
+    Returns
+    -------
+    S : ndarray of shape (n_mels, n_frames)
+        Log-mel spectrogram (dB).
+
+    D : ndarray of shape (1 + n_fft / 2, n_frames) or None
+        Magnitude spectrogram, None jika `linear` False.
+
+    sr : int or None
+        Sample rate audio, None jika `S` diambil dari cache.
+    """
+    sr = 22050 # sample rate default librosa.load
+    if cache is not None:
+        key = cache.key(
+            filepath, "native" if decode == "native" else sr, duration,
+            offset= offset, decode= decode
+        )
+        S = None if linear else cache.get(key)
+        if S is not None:
+            return S, None, None
+
+    y, sr = load_audio(
+        filepath, sr= sr, duration= duration, offset= offset, decode= decode
+    )
+    S, D = _spektrum(y, sr, filepath)
+    if cache is not None:
+        cache.put(key, S)
+    return S, (D if linear else None), sr
+
+def _spektrum(y, sr, filepath= None):
+    """Log-mel spectrogram (dB) dan magnitude spectrogram dari sinyal"""
+    with stage("stft", file= filepath):
+        D = np.abs(librosa.stft(y))
+    with stage("logmel", file= filepath):
+        S = librosa.power_to_db(librosa.feature.melspectrogram(S= D ** 2, sr= sr))
+    return S, D
+
+"""Statistik fitur tambahan
+
+Statistik yang dapat dihitung bersama rata-rata MFCC. Nilai dict adalah
+jumlah kolom (None berarti sama dengan jumlah koefisien MFCC) dan apakah
+statistik membutuhkan magnitude spectrogram (STFT) selain log-mel.
+"""
+
+EXTRA_STATS = {
+    "mfcc_std": (None, False),
+    "delta_mean": (None, False),
+    "delta_std": (None, False),
+    "centroid": (1, True),
+    "rolloff": (1, True),
+    "chroma": (12, True)
+}
+
+def fitur_columns(coef, stats= ()):
+    """Nama kolom fitur
+
+    Parameters
+    ----------
+    coef : int
+        Jumlah koefisien MFCC.
+
+    stats : list of string, default=()
+        Statistik tambahan, lihat `EXTRA_STATS`.
+
+    Returns
+    -------
+    columns : list of string
+        Kolom `mfcc_1..N` diikuti kolom statistik tambahan dengan urutan
+        sesuai `EXTRA_STATS`.
+    """
+    columns = [f"mfcc_{i + 1}" for i in range(coef)]
+    for name, (n, _) in EXTRA_STATS.items():
+        if name in stats:
+            n = coef if n is None else n
+            columns += [name] if n == 1 else [f"{name}_{i + 1}" for i in range(n)]
+    return columns
+
+def _ekstraksi_file(
+    filepath, duration, coef, cache= None, offset= 0.0, decode= "default",
+    stats= (), memory_limit= None
+):
+    """Ekstraksi MFCC untuk satu file musik
+
+    Dijalankan baik secara serial maupun di dalam proses worker. Error
+    tidak dilempar agar satu file yang rusak tidak menghentikan seluruh
+    proses ekstraksi. MFCC dihitung dari log-mel spectrogram sehingga
+    hasilnya sama dengan `librosa.feature.mfcc(y= y, sr= sr)`. Statistik
+    tambahan diturunkan dari MFCC dan STFT yang sama, tanpa STFT ulang.
+    Jika `duration` None, seluruh lagu diekstrak per blok dengan batas
+    memori `memory_limit` (MiB), lihat `_ekstraksi_stream`.
+
+    Returns
+    -------
+    feature : ndarray of shape (n_features,) or None
+        Rata-rata MFCC per koefisien diikuti statistik tambahan (lihat
+        `fitur_columns`), None jika ekstraksi gagal.
+
+    error : string or None
+        Pesan error jika ekstraksi gagal.
+    """
+    try:
+        with stage("file", file= filepath):
+            if duration is None:
+                return _ekstraksi_stream(
+                    filepath, coef, offset= offset, decode= decode,
+                    stats= stats, memory_limit= memory_limit or MEMORY_LIMIT
+                )[0], None
+            linear = any(EXTRA_STATS[name][1] for name in stats)
+            S, D, sr = _logmel(
+                filepath, duration, cache= cache, offset= offset, decode= decode,
+                linear= linear
+            )
+            return _fitur_spektrum(S, D, sr, coef, stats, filepath), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}".rstrip(": ")
+
+def _fitur_spektrum(S, D, sr, coef, stats= (), filepath= None):
+    """Rata-rata MFCC dan statistik tambahan dari spectrogram
+
+    Parameters
+    ----------
+    S : ndarray of shape (n_mels, n_frames)
+        Log-mel spectrogram (dB).
+
+    D : ndarray of shape (1 + n_fft / 2, n_frames) or None
+        Magnitude spectrogram, hanya dibutuhkan statistik spektral.
+
+    sr : int
+        Sample rate audio.
+
+    coef, stats
+        Lihat `fitur_columns`.
+
+    Returns
+    -------
+    feature : ndarray of shape (n_features,)
+    """
+    with stage("mfcc", file= filepath):
+        mfcc = librosa.feature.mfcc(S= S, n_mfcc= coef)
+        feature = [np.mean(mfcc, axis= 1)]
+
+    with stage("stats", file= filepath) if stats else _NO_STAGE:
+        if "mfcc_std" in stats:
+            feature.append(np.std(mfcc, axis= 1))
+        if "delta_mean" in stats or "delta_std" in stats:
+            delta = librosa.feature.delta(mfcc)
+            if "delta_mean" in stats:
+                feature.append(np.mean(delta, axis= 1))
+            if "delta_std" in stats:
+                feature.append(np.std(delta, axis= 1))
+        if "centroid" in stats:
+            centroid = librosa.feature.spectral_centroid(S= D, sr= sr)
+            feature.append(np.mean(centroid, axis= 1))
+        if "rolloff" in stats:
+            rolloff = librosa.feature.spectral_rolloff(S= D, sr= sr)
+            feature.append(np.mean(rolloff, axis= 1))
+        if "chroma" in stats:
+            # tuning=0: estimasi tuning (piptrack) lebih mahal dari chroma itu sendiri
+            chroma = librosa.feature.chroma_stft(S= D ** 2, sr= sr, tuning= 0.0)
+            feature.append(np.mean(chroma, axis= 1))
+    return np.concatenate(feature)
+
+"""MFCC tervektorisasi
+
+Fungsi-fungsi untuk menghitung MFCC banyak klip sekaligus. Klip dengan
+panjang sama ditumpuk menjadi array 2-D dan STFT, proyeksi mel, log, DCT,
+dan rata-rata dijalankan sebagai operasi matriks per batch. Parameter
+STFT dan mel mengikuti default `librosa.feature.mfcc`.
+"""
+
+@lru_cache(maxsize= 8)
+def _mel_basis(sr, n_fft= 2048, n_mels= 128):
+    return librosa.filters.mel(sr= sr, n_fft= n_fft, n_mels= n_mels).T
+
+@lru_cache(maxsize= 8)
+def _dct_basis(n_mels, coef):
+    return dct(np.eye(n_mels, dtype= np.float32), type= 2, norm= "ortho", axis= 0)[:coef].T
+
+def logmel_batch(Y, sr, n_fft= 2048, hop_length= 512, n_mels= 128, frame_block= 2048):
+    """Log-mel spectrogram untuk banyak klip sekaligus
+
+    Parameters
+    ----------
+    Y : ndarray of shape (n_clips, n_samples)
+        Klip audio mono dengan panjang sama.
+
+    sr : int
+        Sample rate seluruh klip.
+
+    frame_block : int, default=2048
+        Jumlah frame (seluruh klip) yang diproses per blok FFT, untuk
+        membatasi memori sementara.
+
+    Returns
+    -------
+    S : ndarray of shape (n_clips, n_mels, n_frames)
+        Log-mel spectrogram (dB), sama dengan
+        `librosa.power_to_db(librosa.feature.melspectrogram(y= y, sr= sr))`
+        untuk setiap klip.
+    """
+    n_clips = Y.shape[0]
+    window = librosa.filters.get_window("hann", n_fft, fftbins= True).astype(np.float32)
+    mel_basis = _mel_basis(sr, n_fft, n_mels)
+
+    Y = np.pad(Y, ((0, 0), (n_fft // 2, n_fft // 2))) # center=True, pad konstan
+    frames = np.lib.stride_tricks.sliding_window_view(Y, n_fft, axis= -1)[:, ::hop_length]
+    n_frames = frames.shape[1]
+
+    S = np.empty((n_clips, n_frames, n_mels), dtype= np.float32)
+    step = max(1, frame_block // max(n_clips, 1))
+    for start in range(0, n_frames, step):
+        spec = rfft(frames[:, start:start + step] * window, axis= -1)
+        power = spec.real ** 2 + spec.imag ** 2
+        np.matmul(power, mel_basis, out= S[:, start:start + step])
+
+    # power_to_db(ref=1.0, amin=1e-10, top_db=80) per klip
+    S = 10.0 * np.log10(np.maximum(S, 1e-10))
+    np.maximum(S, S.max(axis= (1, 2), keepdims= True) - 80.0, out= S)
+    return S.transpose(0, 2, 1)
+
+def mfcc_mean_batch(S, coef, out= None):
+    """Rata-rata MFCC dari log-mel banyak klip
+
+    Karena DCT linear, rata-rata MFCC sama dengan DCT dari rata-rata
+    log-mel sehingga DCT cukup dihitung sekali per klip.
+
+    Parameters
+    ----------
+    S : ndarray of shape (n_clips, n_mels, n_frames)
+        Log-mel spectrogram, lihat `logmel_batch`.
+
+    coef : int
+        Jumlah koefisien MFCC.
+
+    out : ndarray of shape (n_clips, coef), default=None
+        Buffer hasil yang sudah dialokasikan.
+
+    Returns
+    -------
+    out : ndarray of shape (n_clips, coef)
+        Rata-rata MFCC setiap klip.
+    """
+    return np.matmul(S.mean(axis= 2), _dct_basis(S.shape[1], coef), out= out)
+
+def _ekstraksi_batch(
+    filepaths, duration, coef, cache= None, offset= 0.0, decode= "default"
+):
+    """Ekstraksi MFCC tervektorisasi untuk satu batch file musik
+
+    Setiap file di-decode, lalu klip dengan panjang dan sample rate sama
+    dihitung bersama dengan `logmel_batch` dan `mfcc_mean_batch` ke dalam
+    buffer hasil yang sudah dialokasikan. Log-mel dari cache tidak
+    di-decode ulang.
+
+    Returns
+    -------
+    results : list of tuple
+        (feature, error) untuk setiap file, seperti `_ekstraksi_file`.
+    """
+    out = np.empty((len(filepaths), coef), dtype= np.float32)
+    errors = [None] * len(filepaths)
+    groups, keys = {}, {}
+
+    for i, filepath in enumerate(filepaths):
+        try:
+            if cache is not None:
+                keys[i] = cache.key(
+                    filepath, "native" if decode == "native" else 22050,
+                    duration, offset= offset, decode= decode
+                )
+                S = cache.get(keys[i])
+                if S is not None:
+                    mfcc_mean_batch(S[None], coef, out= out[i:i + 1])
+                    continue
+
+            y, sr = load_audio(
+                filepath, duration= duration, offset= offset, decode= decode
+            )
+            groups.setdefault((len(y), sr), []).append((i, y))
+        except Exception as e:
+            errors[i] = f"{type(e).__name__}: {e}".rstrip(": ")
+
+    for (length, sr), clips in groups.items():
+        index = [i for i, _ in clips]
+        Y = np.empty((len(clips), length), dtype= np.float32)
+        for row, (_, y) in enumerate(clips):
+            Y[row] = y
+
+        with stage("mfcc_batch", files= len(clips)):
+            S = logmel_batch(Y, sr)
+            out[index] = mfcc_mean_batch(S, coef)
+        if cache is not None:
+            for row, i in enumerate(index):
+                cache.put(keys[i], S[row])
+
+    return [
+        (out[i] if errors[i] is None else None, errors[i])
+        for i in range(len(filepaths))
+    ]
+
+"""Ekstraksi full track dengan memori terbatas
+
+Jika `duration` None, seluruh lagu (mulai `offset`) diekstrak per blok
+frame dengan buffer yang dialokasikan sekali, sehingga memori puncak
+tidak bergantung pada panjang lagu. Audio di-decode per blok dengan
+soundfile dan di-resample secara streaming (soxr). Karena `power_to_db`
+memotong nilai di bawah (maksimum global - 80 dB), mel power setiap
+frame ditulis ke file sementara dan MFCC dihitung pada lintasan kedua
+setelah maksimum global diketahui. Rata-rata dan simpangan baku
+diakumulasi per blok, sehingga hasilnya sama dengan ekstraksi seluruh
+sinyal sekaligus dalam toleransi float.
+"""
+
+MEMORY_LIMIT = 64 # MiB per proses, anggaran buffer (bukan batas keras)
+
+def _stream_frames(memory_limit, n_fft, hop_length, n_mels, ratio, channels, linear):
+    """Jumlah frame per blok agar buffer ekstraksi tidak melebihi batas"""
+    n_bins = 1 + n_fft // 2
+    per_frame = (
+        hop_length * 4 * (1 + ratio * (channels + 1)) # decode, mono, resample
+        + n_fft * 4 * 2 # frame berjendela
+        + n_bins * 8 * 2 # rfft (complex64) dan power
+        + n_mels * 4 * 4 # mel, log-mel, MFCC
+        + (n_bins * 4 * 2 if linear else 0) # magnitude dan statistik spektral
+    )
+    fixed = n_fft * 4 * 4 + n_bins * n_mels * 4 # buffer awal dan basis mel
+    frames = int((memory_limit * 1024 ** 2 - fixed) / (per_frame * 1.5))
+    if frames < 1:
+        raise ValueError(
+            f"Batas memori {memory_limit} MiB terlalu kecil untuk ekstraksi "
+            "full track"
+        )
+    return frames
+
+def _ekstraksi_stream(
+    filepath, coef, offset= 0.0, decode= "default", stats= (),
+    memory_limit= MEMORY_LIMIT, sr= 22050, n_fft= 2048, hop_length= 512,
+    n_mels= 128
+):
+    """Ekstraksi fitur seluruh lagu per blok dengan memori terbatas
+
+    Parameters
+    ----------
+    filepath : string
+        Jalur file musik (format yang dapat dibaca soundfile).
+
+    coef, offset, decode, stats
+        Lihat `_ekstraksi_file`. Statistik delta tidak didukung karena
+        membutuhkan frame tetangga di antara blok.
+
+    memory_limit : int or float, default=MEMORY_LIMIT
+        Anggaran memori buffer ekstraksi per proses (MiB). Ukuran blok
+        dipilih dari perkiraan ukuran buffer decode, resample, STFT, dan
+        mel per frame (dengan margin 1.5x) agar tidak melebihi anggaran.
+        Ini batas lunak: pemakaian puncak tidak diukur atau dipaksakan,
+        dan memori interpreter, library, serta alokasi sementara
+        library di luar perkiraan tidak termasuk.
+
+    Returns
+    -------
+    feature : ndarray of shape (n_features,)
+        Fitur seperti `_ekstraksi_file` untuk seluruh sinyal.
+
+    seconds : float
+        Panjang audio yang diekstrak (detik).
+    """
+    unsupported = [name for name in stats if name.startswith("delta")]
+    if unsupported:
+        raise ValueError(
+            f"Statistik {', '.join(unsupported)} tidak didukung pada mode full track"
+        )
+    linear = any(EXTRA_STATS[name][1] for name in stats)
+
+    with sf.SoundFile(filepath) as f, tempfile.TemporaryFile() as spill:
+        native_sr, channels = f.samplerate, f.channels
+        if decode == "native":
+            sr = native_sr
+        start = min(int(round(offset * native_sr)), f.frames)
+        if start:
+            f.seek(start)
+
+        ratio = native_sr / sr
+        frames = _stream_frames(
+            memory_limit, n_fft, hop_length, n_mels, ratio, channels, linear
+        )
+        resampler = None
+        if native_sr != sr:
+            import soxr
+            resampler = soxr.ResampleStream(
+                native_sr, sr, 1, dtype= "float32",
+                quality= "HQ" if decode == "default" else "QQ"
+            )
+
+        window = librosa.filters.get_window("hann", n_fft, fftbins= True).astype(np.float32)
+        mel_basis = _mel_basis(sr, n_fft, n_mels)
+        span = (frames - 1) * hop_length + n_fft
+        block = int(np.ceil(frames * hop_length * ratio))
+        raw = np.empty((block, channels), dtype= np.float32)
+        mono = np.empty(block, dtype= np.float32)
+        buf = np.zeros(span + 2 * block + n_fft, dtype= np.float32)
+        mel = np.empty((frames, n_mels), dtype= np.float32)
+
+        filled = n_fft // 2 # center=True: pad nol di awal sinyal
+        n_samples, n_frames, mel_max = 0, 0, 0.0
+        spectral = {name: 0.0 for name in stats if EXTRA_STATS[name][1]}
+
+        def process(count):
+            """Hitung `count` frame dari awal buffer lalu geser buffer"""
+            nonlocal filled, n_frames, mel_max
+            view = np.lib.stride_tricks.sliding_window_view(
+                buf[:(count - 1) * hop_length + n_fft], n_fft
+            )[::hop_length]
+            with stage("stft", file= filepath):
+                spec = rfft(view * window, axis= -1)
+                power = spec.real ** 2 + spec.imag ** 2
+            with stage("logmel", file= filepath):
+                np.matmul(power, mel_basis, out= mel[:count])
+                mel_max = max(mel_max, float(mel[:count].max()))
+                mel[:count].tofile(spill)
+            if linear:
+                D = np.sqrt(power).T
+                if "centroid" in spectral:
+                    spectral["centroid"] += librosa.feature.spectral_centroid(S= D, sr= sr).sum(axis= 1)
+                if "rolloff" in spectral:
+                    spectral["rolloff"] += librosa.feature.spectral_rolloff(S= D, sr= sr).sum(axis= 1)
+                if "chroma" in spectral:
+                    spectral["chroma"] += librosa.feature.chroma_stft(
+                        S= D ** 2, sr= sr, tuning= 0.0
+                    ).sum(axis= 1)
+            shift = count * hop_length
+            buf[:filled - shift] = buf[shift:filled]
+            filled -= shift
+            n_frames += count
+
+        def push(y):
+            nonlocal filled, n_samples
+            n_samples += len(y)
+            while len(y):
+                take = min(len(y), len(buf) - filled)
+                buf[filled:filled + take] = y[:take]
+                filled += take
+                y = y[take:]
+                while filled >= span:
+                    process(frames)
+
+        while True:
+            with stage("decode", file= filepath):
+                n = f.read(block, dtype= "float32", always_2d= True, out= raw)
+                n = len(n)
+                np.mean(raw[:n], axis= 1, out= mono[:n])
+            last = n < block
+            if resampler is not None:
+                with stage("resample", file= filepath):
+                    push(resampler.resample_chunk(mono[:n], last= last))
+            else:
+                push(mono[:n])
+            if last:
+                break
+
+        # center=True: pad nol di akhir sinyal, total 1 + n_samples // hop frame
+        push(np.zeros(n_fft // 2, dtype= np.float32))
+        n_samples -= n_fft // 2
+        remaining = 1 + n_samples // hop_length - n_frames
+        if remaining > 0:
+            process(remaining)
+
+        # lintasan kedua: power_to_db(ref=1.0, amin=1e-10, top_db=80) dan MFCC
+        floor = 10.0 * np.log10(max(mel_max, 1e-10)) - 80.0
+        dct_basis = _dct_basis(n_mels, coef)
+        count, mean, m2 = 0, np.zeros(coef), np.zeros(coef)
+        spill.seek(0)
+        with stage("mfcc", file= filepath):
+            while True:
+                S = np.fromfile(spill, dtype= np.float32, count= frames * n_mels)
+                if not len(S):
+                    break
+                S = S.reshape(-1, n_mels)
+                S = 10.0 * np.log10(np.maximum(S, 1e-10))
+                np.maximum(S, floor, out= S)
+                mfcc = (S @ dct_basis).astype(np.float64)
+
+                # gabungkan rata-rata dan varians per blok (Chan et al.)
+                k = len(mfcc)
+                block_mean = mfcc.mean(axis= 0)
+                block_m2 = ((mfcc - block_mean) ** 2).sum(axis= 0)
+                delta = block_mean - mean
+                total = count + k
+                mean = mean + delta * k / total
+                m2 = m2 + block_m2 + delta ** 2 * count * k / total
+                count = total
+
+    feature = [mean]
+    if "mfcc_std" in stats:
+        feature.append(np.sqrt(m2 / max(count, 1)))
+    for name in ["centroid", "rolloff", "chroma"]:
+        if name in spectral:
+            feature.append(np.atleast_1d(spectral[name] / max(n_frames, 1)))
+    return np.concatenate(feature).astype(np.float32), n_samples / sr
+
+def imap_workers(
+    func, args_list, n_jobs= 1, window= None, initializer= None, initargs= ()
+):
+    """Map berurutan pada proses worker
+
+    Seperti `executor.map`, tetapi tugas dikirim bertahap sehingga hanya
+    `window` tugas yang aktif sekaligus dan hasil langsung dihasilkan
+    (yield) begitu tersedia, berurutan sesuai `args_list`.
+
+    Parameters
+    ----------
+    func : callable
+        Fungsi level modul (dapat di-pickle) yang dijalankan.
+
+    args_list : iterable of tuple
+        Argumen untuk setiap pemanggilan `func`.
+
+    n_jobs : int, default=1
+        Jumlah proses worker, lihat `n_workers`. Jika 1, `func`
+        dijalankan secara serial pada proses ini.
+
+    window : int, default=None
+        Jumlah maksimum tugas aktif. Jika None, 4 kali jumlah worker.
+
+    initializer : callable, default=None
+        Fungsi yang dipanggil sekali di setiap worker (atau di proses ini
+        jika serial) sebelum tugas dijalankan, misal untuk mengirim data
+        besar sekali saja.
+
+    initargs : tuple, default=()
+        Argumen untuk `initializer`.
+    """
+    workers = n_workers(n_jobs)
+    if workers == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for args in args_list:
+            yield func(*args)
+        return
+
+    records = getattr(_PROFILE, "records", None)
+    if records is not None: # kumpulkan catatan instrumentasi dari worker
+        task, memory = func, _PROFILE.memory
+        args_list = ((task, memory, *args) for args in args_list)
+        func = _profiled_task
+
+    args_iter = iter(args_list)
+    executor = ProcessPoolExecutor(
+        max_workers= workers, initializer= initializer, initargs= initargs
+    )
+    try:
+        pending = deque(
+            executor.submit(func, *args)
+            for args in islice(args_iter, window or workers * 4)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for args in islice(args_iter, 1):
+                pending.append(executor.submit(func, *args))
+            if records is not None:
+                result, worker_records = result
+                records.extend(worker_records)
+            yield result
+    finally:
+        executor.shutdown(cancel_futures= True)
+
+def _fitur_frame(df, results, columns):
+    """Susun hasil ekstraksi menjadi DataFrame fitur
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik (filepath, filename, genre).
+
+    results : dict
+        Pemetaan {filepath: (feature, error)}. File yang tidak ada dalam
+        `results` atau gagal diekstrak tidak dimasukkan ke dalam hasil.
+
+    columns : list of string
+        Nama kolom fitur, lihat `fitur_columns`.
+    """
+    filepaths = df.iloc[:, 0].tolist()
+    errors = {
+        fp: results[fp][1] for fp in filepaths
+        if fp in results and results[fp][1]
+    }
+    valid = np.array(
+        [fp in results and results[fp][1] is None for fp in filepaths],
+        dtype= bool
+    )
+    mfcc_feature = np.array(
+        [results[fp][0] for fp in np.array(filepaths, dtype= object)[valid]],
+        dtype= np.float32
+    ).reshape(-1, len(columns))
+
+    res = pd.DataFrame({
+        "filename": df.iloc[valid, 1].values,
+        **{col: mfcc_feature[:, i] for i, col in enumerate(columns)},
+        "genre": df.iloc[valid, -1].values
+    })
+    res.attrs["errors"] = errors
+    return res
+
+def iter_fitur_mfcc(
+    df, duration= 30, coef= 13, n_jobs= 1, cache_dir= None,
+    cache_size= 2 * 1024 ** 3, offset= 0.0, decode= "default", stats= (),
+    vectorized= False, checkpoint= None, batch_size= 16,
+    memory_limit= MEMORY_LIMIT
+):
+    """Ekstraksi fitur MFCC secara streaming
+
+    Generator yang menghasilkan fitur setiap file begitu selesai
+    dihitung, berurutan sesuai `df`. Jika `checkpoint` diberikan, hasil
+    ditambahkan ke file checkpoint (.csv) per `batch_size` baris dan file
+    yang sudah tercatat di checkpoint dilewati, sehingga ekstraksi yang
+    terhenti dapat dilanjutkan. Setiap baris menyimpan ukuran dan mtime
+    file saat diekstrak; file yang berubah sejak dicatat diekstrak ulang.
+    File yang gagal tidak dicatat dan akan dicoba kembali saat
+    dilanjutkan.
+
+    Parameters
+    ----------
+    df, duration, coef, n_jobs, cache_dir, cache_size, offset, decode, stats,
+    memory_limit
+        Lihat `ekstraksi_fitur_mfcc`.
+
+    vectorized : bool, default=False
+        Jika True dan tanpa `stats`, MFCC dihitung per batch berisi
+        `batch_size` file dengan `_ekstraksi_batch`. Diabaikan pada mode
+        full track (`duration` None).
+
+    checkpoint : string, default=None
+        Jalur file checkpoint. Checkpoint hanya valid untuk parameter
+        ekstraksi yang sama.
+
+    batch_size : int, default=16
+        Jumlah baris yang ditampung sebelum ditulis ke checkpoint.
+
+    Yields
+    ------
+    filepath : string
+        Jalur file musik.
+
+    feature : ndarray of shape (n_features,) or None
+        Fitur file (lihat `fitur_columns`), None jika ekstraksi gagal.
+
+    error : string or None
+        Pesan error jika ekstraksi gagal.
+    """
+    done = set()
+    if checkpoint and os.path.exists(checkpoint):
+        if "mtime" not in pd.read_csv(checkpoint, nrows= 0).columns:
+            os.remove(checkpoint) # format lama tanpa ukuran dan mtime
+        else:
+            done = set(_checkpoint_rows(checkpoint)["filepath"])
+
+    rows = [
+        row for row in df.iloc[:, :3].itertuples(index= False)
+        if row[0] not in done
+    ]
+    # dicatat sebelum ekstraksi agar perubahan selama ekstraksi terdeteksi
+    signatures = {
+        row[0]: _file_signature(row[0]) for row in rows
+    } if checkpoint else {}
+    cache = LogMelCache(cache_dir, cache_size) if cache_dir else None
+    buffer = []
+
+    def flush():
+        if not checkpoint or not buffer:
+            return
+        mk_dir(os.path.dirname(checkpoint) or ".")
+        exists = os.path.exists(checkpoint)
+        pd.DataFrame(buffer, columns= [
+            "filepath", "filename", *fitur_columns(coef, stats), "genre",
+            "size", "mtime"
+        ]).to_csv(checkpoint, mode= "a", header= not exists, index= False)
+        buffer.clear()
+
+    try:
+        if vectorized and not stats and duration is not None:
+            results = chain.from_iterable(imap_workers(
+                _ekstraksi_batch,
+                (
+                    (
+                        [row[0] for row in rows[i:i + batch_size]], duration,
+                        coef, cache, offset, decode
+                    )
+                    for i in range(0, len(rows), batch_size)
+                ),
+                n_jobs= n_jobs
+            ))
+        else:
+            results = imap_workers(
+                _ekstraksi_file,
+                (
+                    (
+                        row[0], duration, coef, cache, offset, decode, stats,
+                        memory_limit
+                    )
+                    for row in rows
+                ),
+                n_jobs= n_jobs
+            )
+        for (filepath, filename, genre), (feature, err) in zip(rows, results):
+            if err is None and signatures.get(filepath):
+                buffer.append((
+                    filepath, filename, *feature, genre, *signatures[filepath]
+                ))
+                if len(buffer) >= batch_size:
+                    flush()
+            yield filepath, feature, err
+    finally:
+        flush() # simpan sisa baris meskipun ekstraksi terhenti
+        if cache is not None:
+            cache.evict()
+
+def _file_signature(filepath):
+    """Ukuran dan mtime (ns) file, None jika file tidak dapat dibaca"""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def _checkpoint_rows(checkpoint):
+    """Baris checkpoint yang masih sesuai dengan isi file musik
+
+    Baris terakhir setiap filepath dipakai jika ukuran dan mtime file
+    saat ini sama dengan yang tercatat. Baris file yang berubah, sudah
+    tidak ada, atau dari checkpoint tanpa kolom tersebut diabaikan
+    sehingga file diekstrak ulang.
+    """
+    saved = get_csv(checkpoint)
+    if not {"size", "mtime"} <= set(saved.columns):
+        return saved.iloc[:0]
+    saved = saved.drop_duplicates(subset= "filepath", keep= "last")
+    valid = [
+        _file_signature(filepath) == (size, mtime) for filepath, size, mtime
+        in zip(saved["filepath"], saved["size"], saved["mtime"])
+    ]
+    return saved[valid]
+
+def baca_checkpoint(df, checkpoint, columns):
+    """Baca hasil ekstraksi dari file checkpoint
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik (filepath, filename, genre) yang menentukan baris
+        dan urutan hasil.
+
+    checkpoint : string
+        Jalur file checkpoint dari `iter_fitur_mfcc`.
+
+    columns : list of string
+        Nama kolom fitur, lihat `fitur_columns`.
+
+    Returns
+    -------
+    res : object DataFrame
+        Fitur MFCC dengan layout yang sama seperti `ekstraksi_fitur_mfcc`.
+        Jika file checkpoint belum ada, hasilnya DataFrame kosong. Baris
+        file yang berubah sejak dicatat tidak diikutkan.
+    """
+    if not os.path.exists(checkpoint):
+        return _fitur_frame(df, {}, columns)
+
+    saved = _checkpoint_rows(checkpoint)
+    results = {
+        row[0]: (np.asarray(row[2:-3], dtype= np.float32), None)
+        for row in saved.itertuples(index= False)
+    }
+    return _fitur_frame(df, results, columns)
+
+@cached_result(
+    fingerprints= {"df": fingerprint_musik},
+    ignore= ("n_jobs", "cache_dir", "cache_size", "memory_limit")
+)
+def ekstraksi_fitur_mfcc(
+    df, duration= 30, coef= 13, n_jobs= 1, cache_dir= None,
+    cache_size= 2 * 1024 ** 3, offset= 0.0, decode= "default", stats= (),
+    vectorized= False, memory_limit= MEMORY_LIMIT
+):
+    """Ekstraksi Fitur MFCC
+
+    Fitur audio MFCC didasarkan pada persepsi pendengaran
+    manusia. Ekstraksi MFCC dilakukan dengan menggunakan Librosa
+    yang menyediakan pemrosesan audio.
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Object DataFrame tempat semua file musik (path file) tersimpan.
+
+    duration : int or float or None
+        Durasi musik yang di ekstrak. Jika None, seluruh lagu diekstrak
+        per blok dengan memori terbatas (mode full track), cache log-mel
+        tidak digunakan.
+        
+    coef : int
+        Jumlah koefisien MFCC yang ingin dihitung.
+
+    n_jobs : int, default=1
+        Jumlah proses worker yang digunakan untuk ekstraksi. Jika 1,
+        ekstraksi dilakukan secara serial. Jika -1, gunakan semua core
+        CPU. Urutan baris hasil selalu mengikuti urutan `df`.
+
+    cache_dir : string, default=None
+        Folder cache log-mel spectrogram (lihat `LogMelCache`). Jika
+        None, cache tidak digunakan dan setiap file selalu di-decode.
+
+    cache_size : int, default=2 GiB
+        Batas ukuran cache dalam byte.
+
+    offset : int or float, default=0.0
+        Awal bagian musik yang di ekstrak (detik).
+
+    decode : {"default", "fast", "native"}, default="default"
+        Mode decode audio, lihat `load_audio`.
+
+    stats : list of string, default=()
+        Statistik tambahan yang dihitung dari STFT yang sama dan
+        disimpan sebagai kolom setelah `mfcc_*`, lihat `EXTRA_STATS`.
+
+    vectorized : bool, default=False
+        Jika True, MFCC dihitung per batch file dengan operasi matriks
+        (lihat `logmel_batch`). Hasil sama dengan mode per file dalam
+        toleransi float. Diabaikan jika `stats` diberikan.
+
+    memory_limit : int or float, default=MEMORY_LIMIT
+        Anggaran memori buffer ekstraksi per proses (MiB) pada mode full
+        track, lihat `_ekstraksi_stream` (batas lunak). Total memori
+        buffer kira-kira `n_jobs` kali anggaran ini.
+
+    Returns
+    -------
+    res : object DataFrame
+        DataFrame dari data musik dengan fitur dan label yang dicatat.
+        File yang gagal diekstrak tidak dimasukkan ke dalam baris hasil,
+        melainkan dicatat dalam `res.attrs["errors"]` sebagai dict
+        {filepath: pesan error}.
+    """
+    results = {
+        fp: (feature, err) for fp, feature, err in iter_fitur_mfcc(
+            df, duration= duration, coef= coef, n_jobs= n_jobs,
+            cache_dir= cache_dir, cache_size= cache_size, offset= offset,
+            decode= decode, stats= stats, vectorized= vectorized,
+            memory_limit= memory_limit
+        )
+    }
+    return _fitur_frame(df, results, fitur_columns(coef, stats))
+
+def fitur_todo(df, features, diff):
+    """Daftar musik yang perlu diekstrak ulang
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik terbaru (filepath, filename, genre).
+
+    features : object DataFrame
+        Hasil `ekstraksi_fitur_mfcc` sebelumnya.
+
+    diff : dict
+        Perubahan daftar musik, lihat `diff_manifest`.
+
+    Returns
+    -------
+    todo : object DataFrame
+        Baris `df` untuk file yang ditambahkan, berubah, atau belum
+        memiliki fitur.
+    """
+    stale = set(diff["added"]) | set(diff["changed"])
+    known = set(zip(features.iloc[:, 0], features.iloc[:, -1]))
+    mask = [
+        fp in stale or key not in known for fp, key in
+        zip(df.iloc[:, 0], zip(df.iloc[:, 1], df.iloc[:, -1]))
+    ]
+    return df[mask]
+
+def merge_fitur(df, features, new):
+    """Gabungkan fitur lama dengan fitur hasil ekstraksi ulang
+
+    Baris `new` menggantikan baris `features` untuk file yang sama, dan
+    file yang tidak lagi ada di `df` dibuang.
+
+    Returns
+    -------
+    res : object DataFrame
+        Fitur MFCC seluruh file dalam urutan `df`.
+    """
+    keys = list(zip(df.iloc[:, 1], df.iloc[:, -1]))
+    new_keys = set(zip(new.iloc[:, 0], new.iloc[:, -1]))
+    kept = features[[
+        key not in new_keys
+        for key in zip(features.iloc[:, 0], features.iloc[:, -1])
+    ]]
+
+    combined = pd.concat([kept, new]).set_index(["filename", "genre"])
+    order = [key for key in keys if key in combined.index]
+    res = combined.loc[order].reset_index()
+    res = res[["filename", *combined.columns, "genre"]]
+    res.attrs["errors"] = new.attrs.get("errors", {})
+    return res
+
+def update_fitur_mfcc(
+    df, features, diff, duration= 30, coef= 13, n_jobs= 1, cache_dir= None,
+    cache_size= 2 * 1024 ** 3, offset= 0.0, decode= "default", stats= (),
+    vectorized= False
+):
+    """Ekstraksi fitur MFCC inkremental
+
+    Hanya file yang ditambahkan atau berubah (menurut `diff`), serta file
+    yang belum memiliki baris pada `features`, yang diekstrak ulang. Baris
+    file yang dihapus dari daftar musik dibuang. Fitur lama harus berasal
+    dari ekstraksi dengan parameter yang sama.
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik terbaru (filepath, filename, genre).
+
+    features : object DataFrame
+        Hasil `ekstraksi_fitur_mfcc` sebelumnya.
+
+    diff : dict
+        Perubahan daftar musik, lihat `diff_manifest`.
+
+    duration, coef, n_jobs, cache_dir, cache_size, offset, decode, stats,
+    vectorized
+        Lihat `ekstraksi_fitur_mfcc`.
+
+    Returns
+    -------
+    res : object DataFrame
+        Fitur MFCC seluruh file dalam urutan `df`, dengan layout yang
+        sama seperti `ekstraksi_fitur_mfcc`.
+    """
+    new = ekstraksi_fitur_mfcc(
+        fitur_todo(df, features, diff), duration= duration, coef= coef,
+        n_jobs= n_jobs, cache_dir= cache_dir, cache_size= cache_size,
+        offset= offset, decode= decode, stats= stats, vectorized= vectorized
+    )
+    return merge_fitur(df, features, new)
+
+"""Penyimpanan fitur
+
+Fitur disimpan sebagai matriks float32 (.npy) yang dibaca dengan
+memory-map tanpa parsing teks, dan metadata (parameter ekstraksi, nama
+kolom, filename, dan label) disimpan pada file JSON sidecar. Salinan CSV
+tetap ditulis untuk dibaca di luar aplikasi.
+"""
+
+FEATURE_STORE = "./data/dataframe/mfcc_features"
+
+_FEATURES = {}
+
+def simpan_fitur(df, meta, path= FEATURE_STORE):
+    """Simpan fitur ke feature store
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Fitur dengan layout `ekstraksi_fitur_mfcc` (filename, kolom
+        fitur, genre).
+
+    meta : dict
+        Parameter ekstraksi (duration, coef, offset, decode, stats) dan
+        hash file ("files").
+
+    path : string, default=FEATURE_STORE
+        Jalur feature store tanpa ekstensi. File yang ditulis adalah
+        `path`.npy, `path`.json, dan `path`.csv.
+    """
+    mk_dir(os.path.dirname(path) or ".")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, df.iloc[:, 1:-1].to_numpy(dtype= np.float32))
+    _FEATURES.pop(path, None) # lepaskan memory-map lama sebelum diganti
+    os.replace(tmp, f"{path}.npy") # tulis atomik
+
+    put_json(f"{path}.json", {
+        **meta,
+        "columns": list(df.columns[1:-1]),
+        "filenames": df.iloc[:, 0].tolist(),
+        "labels": df.iloc[:, -1].tolist()
+    })
+    df.to_csv(f"{path}.csv", index= False)
+
+def baca_fitur(path= FEATURE_STORE):
+    """Baca fitur dari feature store
+
+    Matriks fitur dibaca dengan memory-map (tanpa salinan), dan hasil
+    dibaca ulang hanya jika file feature store berubah. Jika hanya file
+    CSV yang tersedia (versi sebelumnya), feature store dibuat sekali
+    dari CSV tersebut.
+
+    Parameters
+    ----------
+    path : string, default=FEATURE_STORE
+        Jalur feature store tanpa ekstensi.
+
+    Returns
+    -------
+    features : ndarray of shape (n_samples, n_features) or None
+        Matriks fitur float32 (read-only), None jika belum ada fitur.
+
+    meta : dict or None
+        Metadata sidecar. `meta["labels"]` berupa array object dan
+        `meta["columns"]` adalah nama kolom `features`.
+    """
+    if not os.path.exists(f"{path}.npy"):
+        if not os.path.exists(f"{path}.csv"):
+            return None, None
+        df = get_csv(f"{path}.csv")
+        columns = list(df.columns[1:-1])
+        meta = {
+            "duration": 30, "coef": sum(col.startswith("mfcc_") for col in columns),
+            "offset": 0, "decode": "default", "stats": [],
+            **get_json(f"{path}.json", {})
+        }
+        meta["stats"] = meta["stats"] or [
+            name for name in EXTRA_STATS
+            if any(col == name or col.startswith(f"{name}_") for col in columns)
+        ]
+        simpan_fitur(df, meta, path)
+
+    mtime = tuple(
+        os.stat(f"{path}{ext}").st_mtime_ns for ext in (".npy", ".json")
+    )
+    cached = _FEATURES.get(path)
+    if cached is None or cached[0] != mtime:
+        features = np.load(f"{path}.npy", mmap_mode= "r")
+        meta = get_json(f"{path}.json")
+        meta["labels"] = np.asarray(meta["labels"], dtype= object)
+        if len(meta["labels"]) != len(features) or \
+        len(meta["columns"]) != features.shape[1]:
+            raise ValueError(f"Metadata tidak sesuai dengan matriks fitur: {path}")
+        cached = _FEATURES[path] = (mtime, features, meta)
+    return cached[1], cached[2]
+
+def fitur_frame(features, meta):
+    """Susun DataFrame fitur (filename, kolom fitur, genre) dari feature store"""
+    return pd.DataFrame({
+        "filename": meta["filenames"],
+        **{col: features[:, i] for i, col in enumerate(meta["columns"])},
+        "genre": meta["labels"]
+    })
+
+"""Ekstraksi per shard
+
+Ekstraksi ulang seluruh katalog dapat dibagi ke beberapa worker (proses
+atau mesin yang berbagi filesystem). Daftar musik dibagi menjadi N shard
+dengan hash stabil dari genre/filename, sehingga setiap worker
+menentukan bagiannya sendiri tanpa koordinasi dan pembagian tidak
+berubah antar mesin atau urutan daftar musik. Setiap worker menulis
+feature store shard miliknya, lalu `gabung_shard` memvalidasi kelengkapan
+seluruh shard dan menyusun tabel fitur final dalam urutan daftar musik.
+"""
+
+SHARD_DIR = "./data/dataframe/shards"
+
+def shard_id(filename, genre, n_shards):
+    """Nomor shard sebuah file musik (0 .. n_shards - 1)
+
+    Hash diambil dari "genre/filename", bukan filepath, agar shard tetap
+    sama meskipun folder musik di-mount pada jalur berbeda di setiap
+    mesin.
+    """
+    digest = hashlib.sha1(f"{genre}/{filename}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % n_shards
+
+def shard_musik(df, n_shards, shard):
+    """Baris daftar musik yang termasuk dalam `shard`
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik (filepath, filename, genre).
+
+    n_shards : int
+        Jumlah shard.
+
+    shard : int
+        Nomor shard, 0 .. `n_shards` - 1.
+
+    Returns
+    -------
+    df : object DataFrame
+        Baris `df` milik `shard`, dengan urutan tetap seperti `df`.
+    """
+    if not 0 <= shard < n_shards:
+        raise ValueError(f"Nomor shard {shard} di luar 0..{n_shards - 1}")
+    mask = [
+        shard_id(filename, genre, n_shards) == shard
+        for filename, genre in zip(df.iloc[:, 1], df.iloc[:, -1])
+    ]
+    return df[mask]
+
+def _listing_fingerprint(df):
+    """Sidik jari daftar musik (filename, genre) tanpa jalur folder"""
+    return fingerprint(df.iloc[:, [1, -1]].reset_index(drop= True))
+
+def shard_path(n_shards, shard, worker= None, directory= SHARD_DIR):
+    """Jalur feature store sebuah shard (tanpa ekstensi)
+
+    `worker` (default: nama host) ikut dalam nama file, sehingga dua
+    worker yang mengerjakan shard yang sama tidak saling menimpa dan
+    terdeteksi sebagai shard ganda oleh `gabung_shard`.
+    """
+    worker = worker or platform.node() or "local"
+    return os.path.join(
+        directory, f"shard-{shard:04d}-of-{n_shards:04d}.{worker}"
+    )
+
+def ekstraksi_shard(
+    df, params, n_shards, shard, worker= None, directory= SHARD_DIR,
+    n_jobs= 1, vectorized= False, memory_limit= MEMORY_LIMIT
+):
+    """Ekstraksi fitur MFCC untuk satu shard daftar musik
+
+    Hasil ditulis ke feature store shard (lihat `shard_path`) bersama
+    metadata shard: nomor dan jumlah shard, sidik jari daftar musik, dan
+    file yang gagal diekstrak. Hasil disimpan per batch ke checkpoint,
+    sehingga worker yang terhenti dilanjutkan saat dijalankan lagi.
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik lengkap (filepath, filename, genre), sama untuk
+        seluruh worker.
+
+    params : dict
+        Parameter ekstraksi (duration, coef, offset, decode, stats).
+
+    n_shards, shard
+        Lihat `shard_musik`.
+
+    worker, directory
+        Lihat `shard_path`.
+
+    n_jobs, vectorized, memory_limit
+        Lihat `iter_fitur_mfcc`.
+
+    Returns
+    -------
+    result : dict
+        Jalur feature store shard (path), jumlah file shard (files),
+        jumlah fitur yang tersimpan (extracted), dan file yang gagal
+        (errors).
+    """
+    path = shard_path(n_shards, shard, worker, directory)
+    todo = shard_musik(df, n_shards, shard)
+    columns = fitur_columns(params["coef"], params["stats"])
+    checkpoint = f"{path}.checkpoint.csv"
+
+    errors = {}
+    for filepath, _, err in iter_fitur_mfcc(
+        todo, vectorized= vectorized, checkpoint= checkpoint, n_jobs= n_jobs,
+        memory_limit= memory_limit, **params
+    ):
+        if err:
+            errors[filepath] = err
+
+    features = baca_checkpoint(todo, checkpoint, columns)
+    simpan_fitur(features, {
+        **params,
+        "shard": {
+            "index": shard, "count": n_shards, "worker": os.path.basename(path),
+            "listing": _listing_fingerprint(df), "files": len(todo),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S")
+        },
+        "errors": {
+            f"{genre}/{filename}": errors[fp]
+            for fp, filename, genre in todo.iloc[:, :3].itertuples(index= False)
+            if fp in errors
+        }
+    }, path= path)
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return {
+        "path": path, "files": len(todo), "extracted": len(features),
+        "errors": errors
+    }
+
+def gabung_shard(df, n_shards= None, directory= SHARD_DIR):
+    """Gabungkan feature store seluruh shard
+
+    Sebelum digabung, seluruh shard divalidasi: jumlah shard dan
+    parameter ekstraksi harus sama, shard harus dibuat dari daftar musik
+    yang sama dengan `df`, tidak ada shard yang hilang atau ganda, dan
+    setiap file shard harus tercatat tepat satu kali (sebagai fitur atau
+    sebagai error) di shard miliknya.
+
+    Parameters
+    ----------
+    df : object DataFrame
+        Daftar musik lengkap (filepath, filename, genre) yang menentukan
+        urutan hasil.
+
+    n_shards : int, default=None
+        Jumlah shard yang diharapkan. Jika None, diambil dari metadata
+        shard.
+
+    directory : string, default=SHARD_DIR
+        Folder feature store shard.
+
+    Returns
+    -------
+    res : object DataFrame
+        Fitur MFCC seluruh file dalam urutan `df`, dengan layout yang
+        sama seperti `ekstraksi_fitur_mfcc`. File yang gagal diekstrak
+        ada di `res.attrs["errors"]`.
+
+    params : dict
+        Parameter ekstraksi shard (duration, coef, offset, decode, stats).
+
+    Raises
+    ------
+    ValueError
+        Jika validasi gagal, pesan berisi daftar seluruh masalah.
+    """
+    shards = []
+    for meta_path in sorted(glob.glob(os.path.join(directory, "shard-*.json"))):
+        meta = get_json(meta_path)
+        if "shard" in meta and os.path.exists(meta_path[:-5] + ".npy"):
+            shards.append((meta_path[:-5], meta))
+    if not shards:
+        raise ValueError(f"Tidak ada shard di {directory}")
+
+    problems = []
+    counts = {meta["shard"]["count"] for _, meta in shards}
+    if n_shards is None and len(counts) == 1:
+        n_shards = counts.pop()
+    if n_shards is None or counts - {n_shards}:
+        problems.append(f"jumlah shard berbeda: {sorted(counts | {n_shards} - {None})}")
+
+    keys = ["duration", "coef", "offset", "decode", "stats", "columns"]
+    params = {key: shards[0][1][key] for key in keys}
+    listing = _listing_fingerprint(df)
+
+    owners = {}
+    for path, meta in shards:
+        name = os.path.basename(path)
+        owners.setdefault(meta["shard"]["index"], []).append(name)
+        diff = [key for key in keys if meta[key] != params[key]]
+        if diff:
+            problems.append(f"{name}: parameter ekstraksi berbeda ({', '.join(diff)})")
+        if meta["shard"]["listing"] != listing:
+            problems.append(f"{name}: dibuat dari daftar musik yang berbeda")
+
+    if n_shards is not None:
+        missing = [i for i in range(n_shards) if i not in owners]
+        if missing:
+            problems.append(f"shard hilang: {', '.join(map(str, missing))}")
+    for index, names in sorted(owners.items()):
+        if len(names) > 1:
+            problems.append(f"shard {index} ganda: {', '.join(names)}")
+
+    frames, errors = [], {}
+    if not problems:
+        key_path = {
+            f"{genre}/{filename}": fp
+            for fp, filename, genre in df.iloc[:, :3].itertuples(index= False)
+        }
+        for path, meta in shards:
+            name, index = os.path.basename(path), meta["shard"]["index"]
+            features = np.load(f"{path}.npy")
+            if features.shape != (len(meta["labels"]), len(meta["columns"])):
+                problems.append(f"{name}: metadata tidak sesuai dengan matriks fitur")
+                continue
+
+            rows = [f"{g}/{f}" for f, g in zip(meta["filenames"], meta["labels"])]
+            recorded = rows + list(meta["errors"])
+            expected = {
+                f"{g}/{f}" for f, g in
+                shard_musik(df, n_shards, index).iloc[:, [1, -1]].itertuples(index= False)
+            }
+            dup = len(recorded) - len(set(recorded))
+            lost = expected - set(recorded)
+            foreign = set(recorded) - expected
+            if dup:
+                problems.append(f"{name}: {dup} file tercatat lebih dari sekali")
+            if lost:
+                problems.append(f"{name}: {len(lost)} file tidak tercatat, misal {min(lost)}")
+            if foreign:
+                problems.append(f"{name}: {len(foreign)} file bukan milik shard, misal {min(foreign)}")
+
+            frames.append(fitur_frame(features, meta))
+            errors.update({key_path[key]: err for key, err in meta["errors"].items()})
+
+    if problems:
+        raise ValueError(
+            "Gabung shard gagal:\n" + "\n".join(f"- {p}" for p in problems)
+        )
+
+    combined = pd.concat(frames).set_index(["filename", "genre"])
+    order = [
+        key for key in zip(df.iloc[:, 1], df.iloc[:, -1]) if key in combined.index
+    ]
+    res = combined.loc[order].reset_index()
+    res = res[["filename", *combined.columns, "genre"]]
+    res.attrs["errors"] = {fp: errors[fp] for fp in df.iloc[:, 0] if fp in errors}
+    params.pop("columns")
+    return res, params
+
+"""Indeks lagu mirip
+
+Tetangga terdekat fitur MFCC untuk pencarian "lagu yang mirip". Fitur
+dinormalisasi per kolom (z-score) lalu diindeks dengan KD-tree, atau
+ball-tree jika jumlah kolom besar (KD-tree melambat mendekati brute force
+pada dimensi tinggi). Indeks disimpan di samping feature store dan
+diperbarui secara inkremental: lagu baru atau berubah masuk ke buffer
+kecil yang dicari secara brute force dan lagu yang dihapus ditandai,
+sampai buffer cukup besar untuk membangun ulang tree.
+"""
+
+INDEX_VERSION = 1
+
+_INDEXES = {}
+_MIRIP_LOCK = threading.Lock()
+
+class IndexMirip():
+    """Indeks tetangga terdekat fitur MFCC
+
+    Gunakan `bangun` untuk membuat indeks dan `index_mirip` untuk indeks
+    feature store yang tersimpan.
+
+    Parameters
+    ----------
+    columns : list of string
+        Kolom fitur.
+
+    mean, std : ndarray of shape (n_features,)
+        Normalisasi per kolom.
+
+    leaf_size : int, default=40
+        Ukuran daun tree.
+
+    rebuild_fraction : float, default=0.1
+        Tree dibangun ulang jika buffer dan lagu yang dihapus melebihi
+        fraksi ini dari isi tree.
+
+    Attributes
+    ----------
+    names : list of string
+        Filename setiap baris indeks. Lagu dikenali dari pasangan
+        filename dan genre.
+
+    labels : ndarray of object
+        Genre setiap baris indeks.
+
+    algorithm : {"kd_tree", "ball_tree"}
+        Jenis tree.
+    """
+
+    def __init__(self, columns, mean, std, leaf_size= 40, rebuild_fraction= 0.1):
+        self.version = INDEX_VERSION
+        self.columns = list(columns)
+        self.mean = np.asarray(mean, dtype= np.float32)
+        self.std = np.asarray(std, dtype= np.float32)
+        self.leaf_size = leaf_size
+        self.rebuild_fraction = rebuild_fraction
+        self.algorithm = "kd_tree" if len(self.columns) <= 20 else "ball_tree"
+        self.names, self.labels = [], np.empty(0, dtype= object)
+        self.raw = np.empty((0, len(self.columns)), dtype= np.float32)
+        self.alive = np.empty(0, dtype= bool)
+        self.tree, self.n_tree = None, 0
+
+    @classmethod
+    def bangun(cls, features, names, labels, columns, **kwargs):
+        """Bangun indeks dari matriks fitur
+
+        Parameters
+        ----------
+        features : ndarray of shape (n_samples, n_features)
+            Fitur mentah (belum dinormalisasi).
+
+        names, labels : list
+            Filename dan genre setiap baris.
+
+        columns : list of string
+            Kolom fitur.
+
+        **kwargs
+            Argumen lain untuk `IndexMirip`.
+        """
+        d = len(columns)
+        index = cls(columns, np.zeros(d), np.ones(d), **kwargs)
+        index.names = list(names)
+        index.labels = np.asarray(labels, dtype= object)
+        index.raw = features.copy()
+        index.alive = np.ones(len(features), dtype= bool)
+        index._build()
+        return index
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    def _normalize(self, X):
+        return (np.asarray(X, dtype= np.float32) - self.mean) / self.std
+
+    def _build(self):
+        """Bangun ulang tree dari semua baris yang masih ada"""
+        keep = self.alive
+        self.names = [name for name, ok in zip(self.names, keep) if ok]
+        self.labels, self.raw = self.labels[keep], self.raw[keep]
+        self.alive = np.ones(len(self.raw), dtype= bool)
+        if len(self.raw): # normalisasi mengikuti isi indeks terkini
+            self.mean = self.raw.mean(axis= 0)
+            std = self.raw.std(axis= 0)
+            self.std = np.where(std > 0, std, 1.0).astype(np.float32)
+
+        self.n_tree = len(self.raw)
+        self.tree = None
+        if self.n_tree:
+            Tree = KDTree if self.algorithm == "kd_tree" else BallTree
+            self.tree = Tree(self._normalize(self.raw), leaf_size= self.leaf_size)
+
+    def sinkron(self, features, names, labels):
+        """Perbarui indeks agar sama dengan isi feature store
+
+        Lagu baru dan lagu yang fiturnya berubah ditambahkan ke buffer,
+        lagu yang tidak ada lagi ditandai terhapus. Tree dibangun ulang
+        jika perubahan melebihi `rebuild_fraction`.
+
+        Returns
+        -------
+        diff : dict
+            Jumlah lagu "added", "removed", "changed", dan "rebuilt"
+            (bool).
+        """
+        features = np.asarray(features, dtype= np.float32)
+        labels = np.asarray(labels, dtype= object)
+        current = {
+            key: i for i, (key, ok) in
+            enumerate(zip(zip(self.names, self.labels), self.alive)) if ok
+        }
+        store = {key: i for i, key in enumerate(zip(names, labels))}
+
+        removed = [current[key] for key in current if key not in store]
+        added = [key for key in store if key not in current]
+        common = [key for key in store if key in current]
+        differ = (
+            self.raw[[current[key] for key in common]] !=
+            features[[store[key] for key in common]]
+        ).any(axis= 1) if common else []
+        changed = [key for key, diff in zip(common, differ) if diff]
+
+        # array diganti (tidak diubah in-place) agar query yang sedang
+        # berjalan pada salinan indeks tetap konsisten
+        alive = self.alive.copy()
+        alive[removed + [current[key] for key in changed]] = False
+        new = [store[key] for key in added + changed]
+        if new:
+            self.names = self.names + [names[i] for i in new]
+            self.labels = np.concatenate([self.labels, labels[new]])
+            self.raw = np.concatenate([self.raw, features[new]])
+            alive = np.concatenate([alive, np.ones(len(new), dtype= bool)])
+        self.alive = alive
+
+        pending = (len(self.raw) - self.n_tree) + int((~self.alive[:self.n_tree]).sum())
+        rebuilt = pending > self.rebuild_fraction * max(self.n_tree, 1)
+        if rebuilt:
+            self._build()
+        return {
+            "added": len(added), "removed": len(removed),
+            "changed": len(changed), "rebuilt": rebuilt
+        }
+
+    def query(self, vector, k= 5, exclude= None):
+        """Tetangga terdekat satu vektor fitur
+
+        Parameters
+        ----------
+        vector : ndarray of shape (n_features,)
+            Fitur mentah dengan urutan `columns`.
+
+        k : int, default=5
+            Jumlah tetangga.
+
+        exclude : tuple of (string, string), default=None
+            Pasangan (filename, genre) lagu yang tidak diikutkan, misal
+            lagu query itu sendiri. Lagu lain dengan filename sama pada
+            genre berbeda tetap diikutkan.
+
+        Returns
+        -------
+        neighbors : object DataFrame
+            Filename, genre, dan jarak (euclidean ternormalisasi), urut
+            dari yang terdekat.
+        """
+        q = self._normalize(vector).reshape(1, -1)
+        candidates = []
+        if self.tree is not None:
+            dead = int((~self.alive[:self.n_tree]).sum())
+            n = min(self.n_tree, k + dead + (exclude is not None))
+            dist, ind = self.tree.query(q, k= n)
+            candidates += zip(dist[0], ind[0])
+        if len(self.raw) > self.n_tree: # buffer, brute force
+            delta = self._normalize(self.raw[self.n_tree:])
+            dist = np.sqrt(((delta - q) ** 2).sum(axis= 1))
+            candidates += zip(dist, range(self.n_tree, len(self.raw)))
+
+        rows = [
+            (d, i) for d, i in sorted(candidates)
+            if self.alive[i] and (self.names[i], self.labels[i]) != exclude
+        ][:k]
+        return pd.DataFrame({
+            "filename": [self.names[i] for _, i in rows],
+            "genre": [self.labels[i] for _, i in rows],
+            "jarak": [float(d) for d, _ in rows]
+        })
+
+    def simpan(self, path):
+        """Simpan indeks (atomik)"""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(self, tmp)
+        os.replace(tmp, path)
+
+def index_mirip(path= FEATURE_STORE):
+    """Indeks lagu mirip untuk feature store
+
+    Indeks dibaca dari `path`.index.joblib (sekali per proses),
+    disinkronkan dengan feature store jika feature store berubah, lalu
+    disimpan kembali. Indeks dibangun dari awal jika belum ada atau
+    kolom fitur berubah.
+
+    Parameters
+    ----------
+    path : string, default=FEATURE_STORE
+        Jalur feature store tanpa ekstensi.
+
+    Returns
+    -------
+    index : IndexMirip or None
+        None jika feature store belum ada.
+    """
+    features, meta = baca_fitur(path)
+    if features is None:
+        return None
+
+    index_path = f"{path}.index.joblib"
+    store = _FEATURES[path][0]
+    with _MIRIP_LOCK:
+        saved = os.stat(index_path).st_mtime_ns if os.path.exists(index_path) else None
+        cached = _INDEXES.get(path)
+        if cached is not None and cached[:2] == (store, saved):
+            return cached[2]
+
+        # indeks pada disk lebih baru (misal disinkronkan oleh job
+        # ekstraksi), jika tidak salin indeks di memori agar sesi lain
+        # tetap memakai indeks lama selama sinkronisasi
+        index = None
+        if cached is not None and cached[1] == saved:
+            index = copy.copy(cached[2])
+        elif saved is not None:
+            index = joblib.load(index_path)
+        if index is None or getattr(index, "version", None) != INDEX_VERSION \
+        or index.columns != meta["columns"]:
+            index = IndexMirip.bangun(
+                features, meta["filenames"], meta["labels"], meta["columns"]
+            )
+            index.simpan(index_path)
+        elif any(index.sinkron(features, meta["filenames"], meta["labels"]).values()):
+            index.simpan(index_path)
+        saved = os.stat(index_path).st_mtime_ns if os.path.exists(index_path) else None
+        _INDEXES[path] = (store, saved, index)
+    return index
+
+_FOLD_DATA = {}
+
+VALIDATION_MODES = ["kfold", "oob"]
+
+def _validation_folds(features, K, validation):
+    """Pasangan indeks (train, test) setiap fold
+
+    Untuk validasi "oob" hanya ada satu pasangan (None, None): forest
+    dilatih pada seluruh data dan dievaluasi dengan prediksi OOB.
+    """
+    if validation == "oob":
+        return [(None, None)]
+    if validation != "kfold":
+        raise ValueError(f"Jenis validasi tidak dikenal: {validation}")
+    return list(KFold(n_splits= K, shuffle= True, random_state= 42).split(features))
+
+def _init_fold(features, labels):
+    """Simpan data latih di proses worker (sekali per worker)"""
+    _FOLD_DATA["features"] = features
+    _FOLD_DATA["labels"] = labels
+
+def _fit_fold_warm(pair, n_estimators, tr_index, ts_index, n_jobs= 1):
+    """Latih dan evaluasi beberapa nilai n_estimators pada satu fold
+
+    Satu forest ditumbuhkan bertahap dengan `warm_start`: forest dengan
+    150 trees adalah forest 100 trees ditambah 50 trees baru. Dengan seed
+    tetap, trees yang dihasilkan sama dengan forest yang dilatih dari
+    awal, sehingga skor setiap checkpoint identik dengan pelatihan
+    terpisah.
+
+    Parameters
+    ----------
+    pair : tuple
+        Nilai (criterion, max_depth, n_estimators, max_features,
+        min_samples_split). Nilai n_estimators diabaikan.
+
+    n_estimators : list of int
+        Nilai n_estimators yang dievaluasi, urut naik dan unik.
+
+    tr_index, ts_index : ndarray or None
+        Indeks data train dan test dari KFold. Jika None, forest dilatih
+        pada seluruh data dan dievaluasi dengan prediksi out-of-bag
+        (lihat `_oob_predict`).
+
+    n_jobs : int, default=1
+        Jumlah thread Random Forest.
+
+    Returns
+    -------
+    metrics : list of dict
+        Nilai akurasi, presisi, recall, dan f1-score (macro) untuk
+        setiap nilai `n_estimators`, serta waktu fit (detik) trees yang
+        ditambahkan ("waktu_fit").
+    """
+    features, labels = _FOLD_DATA["features"], _FOLD_DATA["labels"]
+    params = str(pair[:2] + pair[3:])
+    oob = tr_index is None
+    with stage("fold_slice", params= params):
+        if oob:
+            X_train, y_train = features, labels
+        else:
+            X_train, X_test = features[tr_index], features[ts_index]
+            y_train, y_test = labels[tr_index], labels[ts_index]
+
+    model = RandomForestClassifier(
+        criterion= pair[0], max_depth= pair[1], max_features= pair[3],
+        min_samples_split= pair[4], random_state= 42, n_jobs= n_jobs,
+        warm_start= True, oob_score= oob
+    )
+
+    metrics = []
+    for n in n_estimators:
+        tags = {"params": params, "n_estimators": n}
+        model.set_params(n_estimators= n)
+        start = time.perf_counter()
+        with stage("fit", **tags):
+            model.fit(X_train, y_train)
+        fit_time = time.perf_counter() - start
+        with stage("predict", **tags):
+            if oob:
+                y_test, y_pred = _oob_predict(model, y_train)
+            else:
+                y_pred = model.predict(X_test)
+
+        with stage("metrics", **tags):
+            metrics.append({**_metrics(y_test, y_pred), "waktu_fit": fit_time})
+    return metrics
+
+def _oob_predict(model, labels):
+    """Prediksi out-of-bag forest yang dilatih dengan `oob_score= True`
+
+    Setiap sampel diprediksi hanya oleh trees yang tidak memakai sampel
+    tersebut saat bootstrap. Sampel yang dipakai oleh semua trees (tidak
+    punya prediksi OOB, mungkin terjadi jika trees sedikit) dilewati.
+
+    Returns
+    -------
+    y_true, y_pred : ndarray
+        Label sebenarnya dan prediksi OOB untuk sampel yang memiliki
+        prediksi OOB.
+    """
+    proba = model.oob_decision_function_
+    valid = np.isfinite(proba).all(axis= 1) & (proba.sum(axis= 1) > 0)
+    return labels[valid], model.classes_[proba[valid].argmax(axis= 1)]
+
+def _metrics(y_true, y_pred):
+    """Akurasi, presisi, recall, dan f1-score (macro)"""
+    return {
+        "akurasi": accuracy_score(y_true, y_pred),
+        "presisi": precision_score(
+            y_true, y_pred, average= "macro", zero_division= 0
+        ),
+        "recall": recall_score(
+            y_true, y_pred, average= "macro", zero_division= 0
+        ),
+        "f1-score": f1_score(
+            y_true, y_pred, average= "macro", zero_division= 0
+        )
+    }
+
+def _fit_fold(pair, tr_index, ts_index, n_jobs= 1):
+    """Latih dan evaluasi satu kombinasi parameter pada satu fold
+
+    Lihat `_fit_fold_warm`, dengan satu nilai n_estimators (`pair[2]`).
+
+    Returns
+    -------
+    metrics : dict
+        Nilai akurasi, presisi, recall, dan f1-score (macro).
+    """
+    metrics = _fit_fold_warm(pair, [pair[2]], tr_index, ts_index, n_jobs)[0]
+    metrics.pop("waktu_fit")
+    return metrics
+
+@cached_result(ignore= ("n_jobs", "warm_start"))
+def tuned_model(
+    features, labels, params, K= 5, n_jobs= 1, warm_start= True,
+    validation= "kfold"
+):
+    """Train model tuned
+
+    Pelatihan model menggunakan Random Forest dengan hypertuning parameter
+    dan validasi KFold.
+
+    Parameters
+    ----------
+    features : ndarray or shape (n_samples, n_features)
+        Sampel OOB (Out-of-Bag).
+
+    labels : ndarray or shape (n_samples, 1, n_outputs)
+        Label sampel OOB.
+
+    K : int
+        Jumlah subset Fold.
+
+    params : object Array
+        Nilai parameter yang digunakan untuk hypertuning
+        parameter model Random Forest.
+
+    n_jobs : int, default=1
+        Jumlah core CPU yang digunakan. Setiap pasangan (kombinasi
+        parameter, fold) dijalankan sebagai satu tugas di pool proses.
+        Jika core lebih banyak dari jumlah tugas, sisanya dipakai sebagai
+        thread Random Forest (`n_jobs` forest) sehingga jumlah thread
+        total tidak melebihi `n_jobs`. Hasil sama dengan pelatihan serial
+        karena seed tetap.
+
+    warm_start : bool, default=True
+        Jika True, kombinasi yang hanya berbeda n_estimators dilatih
+        sebagai satu forest per fold yang ditumbuhkan bertahap (lihat
+        `_fit_fold_warm`), dan setiap nilai n_estimators dievaluasi di
+        sepanjang jalan. Hasil sama dengan `warm_start= False`.
+
+    validation : {"kfold", "oob"}, default="kfold"
+        Validasi setiap kombinasi, lihat `basic_model`. Dengan "oob",
+        setiap kombinasi cukup dilatih sekali (bukan K kali).
+
+    Returns
+    -------
+    score : object DataFrame
+        Hasil pelatihan yang menyimpan nilai metrics evaluasi.
+        `score.attrs["validasi"]` berisi jenis validasi, jumlah fit,
+        waktu pelatihan, dan total waktu fit forest (detik).
+    
+    params : object DataFrame
+        Nilai parameter yang digunakan dalam pelatihan model.
+    """
+    start = time.perf_counter()
+    folds = _validation_folds(features, K, validation)
+    pairs = list(product(*params))
+
+    metrics_eval = {
+        "akurasi": 0, "presisi": 0, "recall": 0, "f1-score": 0
+    }
+    param_values = {}
+    temp_ = 0
+
+    # kelompokkan kombinasi yang hanya berbeda n_estimators
+    groups = {}
+    for pair in pairs:
+        key = pair if not warm_start else (*pair[:2], None, *pair[3:])
+        groups.setdefault(key, set()).add(pair[2])
+    groups = {key: sorted(values) for key, values in groups.items()}
+
+    budget = n_workers(n_jobs)
+    workers = max(1, min(budget, len(groups) * len(folds)))
+    results = imap_workers(
+        _fit_fold_warm,
+        (
+            (key, values, tr_index, ts_index, budget // workers)
+            for key, values in groups.items() for tr_index, ts_index in folds
+        ),
+        n_jobs= workers, initializer= _init_fold, initargs= (features, labels)
+    )
+
+    fold_metrics, fit_time = {}, 0.0
+    total = len(groups) * len(folds)
+    for task, ((key, values), (i, _)) in enumerate(
+        product(groups.items(), enumerate(folds))
+    ):
+        job_progress(task, total, "fold")
+        for n, metrics in zip(values, next(results)):
+            fit_time += metrics.pop("waktu_fit")
+            fold_metrics[(*key[:2], n, *key[3:]), i] = metrics
+
+    for pair, i in product(pairs, range(len(folds))):
+        metrics = fold_metrics[pair, i]
+        score_ = metrics["akurasi"]
+
+        if temp_ < score_:
+            temp_ = score_
+
+            metrics_eval.update(metrics)
+
+            param_values["criterion"] = pair[0]
+            param_values["max_depth"] = pair[1]
+            param_values["n_estimators"] = pair[2]
+            param_values["max_features"] = pair[3]
+            param_values["min_samples_split"] = pair[4]
+
+    score = pd.DataFrame(metrics_eval, index= [0])
+    score.attrs["validasi"] = {
+        "mode": validation, "fits": len(pairs) * len(folds),
+        "waktu": time.perf_counter() - start, "waktu_fit": fit_time
+    }
+    params = pd.DataFrame(param_values, index= [0])
+    return score, params
+
+@cached_result(ignore= ("n_jobs",))
+def halving_model(
+    features, labels, params, K= 5, factor= 3, min_fraction= None,
+    max_fits= None, time_budget= None, n_jobs= 1
+):
+    """Train model tuned dengan successive halving
+
+    Semua kombinasi parameter dievaluasi terlebih dahulu dengan KFold
+    secara murah: pada fraksi r dari data dan r dari jumlah trees
+    (minimal 10 trees). Di setiap tahap (rung) hanya 1/`factor`
+    kombinasi terbaik (rata-rata akurasi fold) yang lanjut, dan r
+    dikalikan `factor` hingga seluruh data dan trees dipakai pada tahap
+    terakhir.
+
+    Parameters
+    ----------
+    features, labels, params, K
+        Lihat `tuned_model`.
+
+    factor : int, default=3
+        Faktor eliminasi kandidat dan pertambahan ukuran data per tahap.
+
+    min_fraction : float, default=None
+        Fraksi data terkecil pada tahap pertama. Jika None, dipilih
+        sehingga subsampel berisi minimal 2 * K * jumlah kelas sampel.
+        Jumlah tahap dikurangi agar fraksi tahap pertama tidak di bawah
+        batas ini, sehingga tidak ada tahap dengan fraksi yang sama
+        (tahap terakhir bisa berisi lebih dari satu kandidat).
+
+    max_fits : int or float, default=None
+        Batas biaya pelatihan dalam satuan fit penuh (fit dengan fraksi
+        r dihitung r, perkiraan konservatif karena data juga dikurangi).
+        Tahap yang akan melewati batas tidak dijalankan. Tahap pertama
+        selalu dijalankan.
+
+    time_budget : int or float, default=None
+        Batas waktu (detik). Tahap berikutnya tidak dimulai jika waktu
+        sudah habis.
+
+    n_jobs : int, default=1
+        Jumlah core CPU, lihat `tuned_model`.
+
+    Returns
+    -------
+    score : object DataFrame
+        Rata-rata metrics evaluasi KFold kandidat terbaik pada tahap
+        terakhir yang dijalankan.
+
+    params : object DataFrame
+        Nilai parameter kandidat terbaik.
+
+    info : dict
+        Jumlah fit yang dijalankan ("fits"), biaya setara fit penuh
+        ("fits_setara"), jumlah fit grid lengkap ("fits_grid"), waktu
+        pelatihan ("waktu"), dan ringkasan setiap tahap ("rungs").
+        "fits" bisa lebih besar dari "fits_grid" karena tahap pertama
+        mengevaluasi semua kombinasi; penghematan ada pada "fits_setara".
+    """
+    start = time.perf_counter()
+    pairs = list(product(*params))
+    n_samples = len(labels)
+    if min_fraction is None:
+        min_fraction = min(1.0, 2 * K * len(np.unique(labels)) / n_samples)
+    # tahap yang dibutuhkan hingga satu kandidat, dibatasi jumlah tahap
+    # yang fraksinya tidak di bawah min_fraction
+    R = min(
+        ceil(log(len(pairs), factor)) if len(pairs) > 1 else 0,
+        floor(log(1 / min_fraction, factor) + 1e-9)
+    )
+
+    order = np.random.default_rng(42).permutation(n_samples)
+    budget = n_workers(n_jobs)
+    candidates, scores, rungs = pairs, {}, []
+    fits, cost = 0, 0.0
+
+    for i in range(R + 1):
+        job_progress(i, R + 1, "tahap")
+        m = int(round(factor ** (i - R) * n_samples))
+        todo = [pair for pair in candidates if (pair, m) not in scores]
+        needed = len(todo) * K
+        if rungs and (
+            (max_fits and cost + needed * m / n_samples > max_fits) or
+            (time_budget and time.perf_counter() - start > time_budget)
+        ):
+            break
+
+        sub = np.sort(order[:m])
+        kfold = KFold(n_splits= K, shuffle= True, random_state= 42)
+        folds = [(sub[tr], sub[ts]) for tr, ts in kfold.split(sub)]
+        workers = max(1, min(budget, needed))
+        ratio = m / n_samples
+        results = list(imap_workers(
+            _fit_fold,
+            (
+                (
+                    (
+                        *pair[:2],
+                        pair[2] if m == n_samples else max(10, round(pair[2] * ratio)),
+                        *pair[3:]
+                    ),
+                    tr_index, ts_index, budget // workers
+                )
+                for pair in todo for tr_index, ts_index in folds
+            ),
+            n_jobs= workers, initializer= _init_fold,
+            initargs= (features, labels)
+        ))
+        for j, pair in enumerate(todo):
+            fold_metrics = pd.DataFrame(results[j * K:(j + 1) * K])
+            scores[(pair, m)] = fold_metrics.mean().to_dict()
+
+        fits += needed
+        cost += needed * ratio
+        rungs.append({
+            "fraksi": ratio, "kandidat": len(candidates), "fit": needed
+        })
+
+        # urutan stabil: nilai sama mengikuti urutan grid
+        candidates = sorted(candidates, key= lambda pair: -scores[(pair, m)]["akurasi"])
+        best, best_metrics = candidates[0], scores[(candidates[0], m)]
+        candidates = candidates[:max(1, ceil(len(candidates) / factor))]
+
+    score = pd.DataFrame(best_metrics, index= [0])
+    params = pd.DataFrame({
+        "criterion": best[0], "max_depth": best[1],
+        "n_estimators": best[2], "max_features": best[3],
+        "min_samples_split": best[4]
+    }, index= [0])
+    info = {
+        "fits": fits, "fits_setara": cost, "fits_grid": len(pairs) * K,
+        "waktu": time.perf_counter() - start, "rungs": rungs
+    }
+    return score, params, info
+
+@cached_result()
+def basic_model(
+    features, labels, K= 5, criterion= "gini", max_depth= None,
+    n_estimators= 100, max_features= "sqrt", min_samples_split= 2,
+    validation= "kfold"
+):
+    """Train model basic
+
+    Pelatihan model menggunakan Random Forest dengan beberapa
+    persiapan seperti setting parameter dan validasi KFold atau
+    out-of-bag (OOB).
+
+    Parameters
+    ----------
+    features : ndarray or shape (n_samples, n_features)
+        Sampel OOB (Out-of-Bag).
+
+    labels : ndarray or shape (n_samples, 1, n_outputs)
+        Label sampel OOB.
+
+    K : int
+        Jumlah subset Fold.
+
+    criterion : {"gini", "entropy", "log_loss"}, default="gini"
+        Fungsi untuk mengatur kualitas dari pembagian. Kriteria
+        yang didukung adalah "gini" untuk Gini impurity dan
+        "log_loss" dan "entropy" keduanya untuk Shannon
+        information gain.
+
+    max_depth : int, default=None
+        Kedalaman maksimum pohon. Jika None, maka node
+        diperluas hingga semua daun murni (pure) atau hingga
+        semua daun berisi kurang dari min_samples_split sampel.
+
+    n_estimators : int, default=100
+        Jumlah trees dalam forest.
+
+    max_features : {"sqrt", "log2", None}, int or float, default="sqrt"
+        Jumlah fitur yang perlu dipertimbangkan saat mencari pemisahan terbaik:
+
+        - Jika int, mempertimbangkan fitur `max_features` di setiap pemisahan.
+        - Jika float, maka `max_features` adalah pecahan dan fitur
+          `max(1, int(max_features * n_features_in_))` dipertimbangkan di
+          setiap pemisahan.
+        - Jika "sqrt", maka `max_features=sqrt(n_features)`.
+        - Jika "log2", maka `max_features=log2(n_features)`.
+        - Jika None, maka `max_features=n_features`.
+
+    min_samples_split : int or float, default=2
+        Jumlah minimum sampel yang diperlukan untuk memisahkan node internal:
+
+        - Jika int, maka `min_samples_split` dianggap sebagai nilai minimum.
+        - Jika float, maka `min_samples_split` adalah pecahan dan
+          `ceil(min_samples_split * n_samples)` adalah minimumnya jumlah
+          sampel untuk setiap pemisahan.
+
+    validation : {"kfold", "oob"}, default="kfold"
+        Jenis validasi. "kfold" melatih K forest dan merata-ratakan
+        metrics setiap fold. "oob" melatih satu forest pada seluruh data
+        dan menghitung metrics dari prediksi out-of-bag, yaitu prediksi
+        setiap sampel oleh trees yang tidak memakai sampel tersebut saat
+        bootstrap. `K` diabaikan pada mode "oob".
+
+    Returns
+    -------
+    score : object DataFrame
+        Hasil pelatihan yang menyimpan nilai metrics evaluasi.
+        `score.attrs["validasi"]` berisi jenis validasi, jumlah fit,
+        waktu pelatihan, dan total waktu fit forest (detik).
+    
+    params : object DataFrame
+        Nilai parameter yang digunakan dalam pelatihan model.
+    """
+    start = time.perf_counter()
+    folds = _validation_folds(features, K, validation)
+
+    metrics_eval = {
+        "akurasi": 0, "presisi": 0, "recall": 0, "f1-score": 0
+    }
+    param_values = {}
+    fit_time = 0.0
+
+    for fold, (tr_index, ts_index) in enumerate(folds):
+        job_progress(fold, len(folds), "fold")
+        with stage("fold_slice", fold= fold):
+            if tr_index is None:
+                X_train, y_train = features, labels
+            else:
+                X_train, X_test = features[tr_index], features[ts_index]
+                y_train, y_test = labels[tr_index], labels[ts_index]
+
+        model = RandomForestClassifier(
+            criterion= criterion, max_depth= max_depth,
+            n_estimators= n_estimators, max_features= max_features,
+            min_samples_split= min_samples_split, random_state= 42,
+            oob_score= tr_index is None
+        )
+
+        fit_start = time.perf_counter()
+        with stage("fit", fold= fold):
+            model.fit(X_train, y_train)
+        fit_time += time.perf_counter() - fit_start
+        with stage("predict", fold= fold):
+            if tr_index is None:
+                y_test, y_pred = _oob_predict(model, y_train)
+            else:
+                y_pred = model.predict(X_test)
+
+        with stage("metrics", fold= fold):
+            for name, value in _metrics(y_test, y_pred).items():
+                metrics_eval[name] += value
+
+    metrics_eval["akurasi"] /= len(folds)
+    metrics_eval["presisi"] /= len(folds)
+    metrics_eval["recall"] /= len(folds)
+    metrics_eval["f1-score"] /= len(folds)
+    
+    param_values["criterion"] = criterion
+    param_values["max_depth"] = max_depth
+    param_values["n_estimators"] = n_estimators
+    param_values["max_features"] = max_features
+    param_values["min_samples_split"] = min_samples_split
+
+    score = pd.DataFrame(metrics_eval, index= [0])
+    score.attrs["validasi"] = {
+        "mode": validation, "fits": len(folds),
+        "waktu": time.perf_counter() - start, "waktu_fit": fit_time
+    }
+    params = pd.DataFrame(param_values, index= [0])
+    return score, params
+
+"""Artefak model
+
+Model Random Forest terbaik dilatih ulang pada seluruh data fitur dan
+disimpan bersama skema fitur (parameter ekstraksi dan urutan kolom) yang
+dipakai saat pelatihan, sehingga lagu baru dapat diklasifikasi tanpa
+pelatihan ulang.
+"""
+
+MODEL_PATH = "./data/model/model.joblib"
+MODEL_VERSION = 1
+
+_MODELS = {}
+
+def simpan_model(
+    features, labels, params, schema, metrics= None, path= MODEL_PATH
+):
+    """Latih model pada seluruh data dan simpan sebagai artefak
+
+    Parameters
+    ----------
+    features : ndarray of shape (n_samples, n_features)
+        Data fitur.
+
+    labels : ndarray of shape (n_samples,)
+        Label genre.
+
+    params : dict
+        Parameter Random Forest (criterion, max_depth, n_estimators,
+        max_features, min_samples_split).
+
+    schema : dict
+        Parameter ekstraksi (duration, coef, offset, decode, stats) dan
+        `columns`, nama kolom fitur sesuai urutan kolom `features`.
+
+    metrics : dict, default=None
+        Nilai evaluasi KFold dari konfigurasi yang sama.
+
+    path : string, default=MODEL_PATH
+        Jalur file artefak.
+
+    Returns
+    -------
+    artifact : dict
+        Artefak yang disimpan, berisi model, parameter, skema fitur,
+        daftar kelas, dan versi format artefak.
+    """
+    if len(schema["columns"]) != features.shape[1]:
+        raise ValueError(
+            f"Skema berisi {len(schema['columns'])} kolom, "
+            f"fitur berisi {features.shape[1]} kolom"
+        )
+
+    model = RandomForestClassifier(**params, random_state= 42, n_jobs= -1)
+    model.fit(features, labels)
+    model.set_params(n_jobs= 1) # prediksi satu lagu lebih cepat tanpa thread
+
+    artifact = {
+        "version": MODEL_VERSION,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "model": model,
+        "params": dict(params),
+        "schema": dict(schema),
+        "classes": list(model.classes_),
+        "metrics": dict(metrics or {}),
+        "n_samples": len(labels)
+    }
+    mk_dir(os.path.dirname(path))
+    tmp = f"{path}.{os.getpid()}.tmp"
+    joblib.dump(artifact, tmp)
+    os.replace(tmp, path) # tulis atomik
+    _MODELS.pop(path, None)
+    return artifact
+
+def muat_model(path= MODEL_PATH):
+    """Baca artefak model
+
+    Artefak dibaca sekali per proses dan dibaca ulang hanya jika file
+    artefak berubah.
+
+    Parameters
+    ----------
+    path : string, default=MODEL_PATH
+        Jalur file artefak.
+
+    Returns
+    -------
+    artifact : dict or None
+        Artefak model (lihat `simpan_model`), None jika belum ada.
+    """
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.stat(path).st_mtime_ns
+    cached = _MODELS.get(path)
+    if cached is None or cached[0] != mtime:
+        artifact = joblib.load(path)
+        if artifact.get("version") != MODEL_VERSION:
+            raise ValueError(
+                f"Versi artefak model {artifact.get('version')} tidak "
+                f"didukung (versi {MODEL_VERSION})"
+            )
+        cached = _MODELS[path] = (mtime, artifact)
+    return cached[1]
+
+def _schema_index(schema):
+    """Indeks kolom skema pada hasil `_ekstraksi_file`"""
+    columns = fitur_columns(schema["coef"], schema["stats"])
+    return [columns.index(col) for col in schema["columns"]]
+
+def fitur_file(filepath, schema):
+    """Fitur satu file musik sesuai skema fitur
+
+    Parameters
+    ----------
+    filepath : string
+        Jalur file musik.
+
+    schema : dict
+        Parameter ekstraksi (duration, coef, offset, decode, stats) dan
+        urutan kolom ("columns"), misal skema artefak model atau
+        metadata feature store.
+
+    Returns
+    -------
+    feature : ndarray of shape (n_features,)
+        Fitur dengan urutan `schema["columns"]`.
+    """
+    feature, error = _ekstraksi_file(
+        filepath, schema["duration"], schema["coef"],
+        offset= schema["offset"], decode= schema["decode"],
+        stats= schema["stats"]
+    )
+    if error is not None:
+        raise ValueError(f"Ekstraksi fitur gagal: {error}")
+    return feature[_schema_index(schema)]
+
+def prediksi_musik(filepath, artifact):
+    """Prediksi genre satu file musik
+
+    Fitur diekstrak dengan parameter ekstraksi yang sama seperti saat
+    pelatihan, lalu kolom diambil sesuai urutan skema artefak.
+
+    Parameters
+    ----------
+    filepath : string
+        Jalur file musik.
+
+    artifact : dict
+        Artefak model dari `muat_model`.
+
+    Returns
+    -------
+    genre : string
+        Genre hasil prediksi.
+
+    proba : object DataFrame
+        Probabilitas setiap genre, urut dari yang terbesar.
+    """
+    X = fitur_file(filepath, artifact["schema"])[np.newaxis]
+
+    proba = artifact["model"].predict_proba(X)[0]
+    proba = pd.DataFrame({
+        "genre": artifact["classes"], "probabilitas": proba
+    }).sort_values("probabilitas", ascending= False, ignore_index= True)
+    return proba["genre"][0], proba
+
+"""Prediksi progresif
+
+Untuk penggunaan interaktif, audio tidak selalu perlu di-decode sepanjang
+`duration`. Fitur dihitung dulu dari jendela awal yang pendek, dan
+prediksi langsung dikembalikan jika probabilitas kelas tertinggi sudah
+melewati ambang. Jika belum, jendela diperpanjang bertahap hingga
+`duration` penuh. Setiap tahap hanya men-decode potongan audio yang
+baru.
+"""
+
+PROGRESSIVE_WINDOWS = (5, 10, 20)
+
+def iter_jendela(filepath, schema, windows= PROGRESSIVE_WINDOWS):
+    """Fitur untuk jendela audio yang makin panjang
+
+    Parameters
+    ----------
+    filepath : string
+        Jalur file musik.
+
+    schema : dict
+        Skema fitur artefak model (duration, coef, offset, decode,
+        stats).
+
+    windows : tuple of float, default=PROGRESSIVE_WINDOWS
+        Panjang jendela (detik) sebelum `duration` penuh. Jendela yang
+        tidak lebih pendek dari `duration` diabaikan. Jika `duration`
+        None (full track), tahap terakhir adalah seluruh lagu yang
+        diekstrak per blok dengan `_ekstraksi_stream`.
+
+    Notes
+    -----
+    Jendela awal hanya mendecode potongan baru dengan sample rate asli
+    file, lalu seluruh jendela diresample (soxr_hq untuk mode
+    "default", soxr_qq untuk "fast"). Jendela terakhir (`duration`,
+    atau jendela tempat file berakhir) didecode sekaligus dengan
+    parameter yang sama seperti `_ekstraksi_file`, sehingga fiturnya
+    identik untuk semua mode dan format file (decode per potongan
+    dengan seek pada MP3 tidak tepat per sampel).
+
+    Yields
+    ------
+    window : float
+        Panjang jendela (detik).
+
+    feature : ndarray of shape (n_features,)
+        Fitur jendela, lihat `_ekstraksi_file`.
+    """
+    duration, offset = schema["duration"], schema["offset"]
+    steps = sorted(
+        {w for w in windows if 0 < w < (duration or np.inf)} | {duration}
+        - {None}
+    )
+    linear = any(EXTRA_STATS[name][1] for name in schema["stats"])
+
+    res_type = "soxr_hq" if schema["decode"] == "default" else "soxr_qq"
+    chunks, start, final = [], 0, None
+    for window in steps:
+        if window == duration:
+            final = window
+            break
+        y, native_sr = load_audio(
+            filepath, duration= window - start, offset= offset + start,
+            decode= "native"
+        )
+        if len(y) < (window - start) * native_sr: # file berakhir sebelum jendela
+            final = window
+            break
+        chunks.append(y)
+        y, sr = np.concatenate(chunks), native_sr
+        if schema["decode"] != "native" and native_sr != 22050:
+            with stage("resample", file= filepath):
+                y = librosa.resample(
+                    y, orig_sr= native_sr, target_sr= 22050, res_type= res_type
+                )
+            sr = 22050
+        S, D = _spektrum(y, sr, filepath)
+        yield window, _fitur_spektrum(
+            S, D if linear else None, sr, schema["coef"], schema["stats"],
+            filepath
+        )
+        start = window
+
+    # jendela terakhir didecode sekaligus seperti `_ekstraksi_file`
+    if duration is None:
+        feature, seconds = _ekstraksi_stream(
+            filepath, schema["coef"], offset= offset, decode= schema["decode"],
+            stats= schema["stats"]
+        )
+        yield seconds, feature
+        return
+    y, sr = load_audio(
+        filepath, duration= duration, offset= offset, decode= schema["decode"]
+    )
+    S, D = _spektrum(y, sr, filepath)
+    yield final, _fitur_spektrum(
+        S, D if linear else None, sr, schema["coef"], schema["stats"], filepath
+    )
+
+def prediksi_progresif(
+    filepath, artifact, windows= PROGRESSIVE_WINDOWS, threshold= 0.8
+):
+    """Prediksi genre satu file musik dengan jendela audio bertahap
+
+    Parameters
+    ----------
+    filepath : string
+        Jalur file musik.
+
+    artifact : dict
+        Artefak model dari `muat_model`.
+
+    windows : tuple of float, default=PROGRESSIVE_WINDOWS
+        Panjang jendela awal (detik), lihat `iter_jendela`.
+
+    threshold : float, default=0.8
+        Ambang probabilitas kelas tertinggi untuk berhenti lebih awal.
+        Nilai di atas 1 selalu memakai `duration` penuh.
+
+    Returns
+    -------
+    genre : string
+        Genre hasil prediksi.
+
+    proba : object DataFrame
+        Probabilitas setiap genre, urut dari yang terbesar.
+
+    window : float
+        Panjang audio (detik) yang dipakai untuk prediksi.
+    """
+    schema = artifact["schema"]
+    index = _schema_index(schema)
+    for window, feature in iter_jendela(filepath, schema, windows):
+        proba = artifact["model"].predict_proba(feature[index][np.newaxis])[0]
+        if proba.max() >= threshold:
+            break
+
+    proba = pd.DataFrame({
+        "genre": artifact["classes"], "probabilitas": proba
+    }).sort_values("probabilitas", ascending= False, ignore_index= True)
+    return proba["genre"][0], proba, window
+
+def evaluasi_progresif(
+    filepaths, labels, artifact, windows= PROGRESSIVE_WINDOWS,
+    thresholds= (0.5, 0.6, 0.7, 0.8, 0.9)
+):
+    """Trade-off latensi dan akurasi prediksi progresif
+
+    Setiap file diprediksi sekali dengan jalur tetap (`prediksi_musik`,
+    `duration` penuh) dan sekali pada setiap jendela `iter_jendela`
+    dengan waktu kumulatif per jendela, lalu berhenti-lebih-awal
+    disimulasikan untuk setiap ambang. Gunakan file yang tidak dipakai
+    saat pelatihan agar akurasi tidak bias.
+
+    Parameters
+    ----------
+    filepaths : list of string
+        Jalur file musik.
+
+    labels : list of string
+        Genre sebenarnya setiap file.
+
+    artifact : dict
+        Artefak model dari `muat_model`.
+
+    windows, thresholds
+        Jendela awal (detik) dan ambang probabilitas yang dibandingkan.
+
+    Returns
+    -------
+    report : object DataFrame
+        Satu baris jalur tetap ("penuh") dan satu baris per ambang:
+        akurasi, kesesuaian dengan jalur tetap, rata-rata panjang audio,
+        rata-rata dan p95 latensi, serta percepatan terhadap jalur
+        tetap. File yang gagal diekstrak dilewati.
+    """
+    schema = artifact["schema"]
+    index = _schema_index(schema)
+    classes = np.asarray(artifact["classes"], dtype= object)
+
+    rows = []
+    for filepath, label in zip(filepaths, labels):
+        try:
+            with open(filepath, "rb") as f: # page cache sama untuk kedua jalur
+                f.read()
+            start = time.perf_counter()
+            fixed, _ = prediksi_musik(filepath, artifact)
+            fixed_s = time.perf_counter() - start
+
+            steps, start = [], time.perf_counter()
+            for window, feature in iter_jendela(filepath, schema, windows):
+                proba = artifact["model"].predict_proba(feature[index][np.newaxis])[0]
+                steps.append((window, time.perf_counter() - start, proba))
+        except Exception:
+            continue
+        rows.append((label, fixed, fixed_s, steps))
+
+    if not rows:
+        return pd.DataFrame()
+    labels, fixed, fixed_s, steps = map(list, zip(*rows))
+
+    def summary(name, preds, windows, latency):
+        latency = np.asarray(latency)
+        return {
+            "ambang": name,
+            "akurasi": np.mean([p == y for p, y in zip(preds, labels)]),
+            "kesesuaian": np.mean([p == f for p, f in zip(preds, fixed)]),
+            "audio_rata_s": np.mean(windows),
+            "latensi_rata_s": latency.mean(),
+            "latensi_p95_s": np.percentile(latency, 95),
+            "percepatan": np.mean(fixed_s) / latency.mean()
+        }
+
+    report = [
+        summary(
+            "penuh", fixed,
+            [schema["duration"] or file_steps[-1][0] for file_steps in steps],
+            fixed_s
+        )
+    ]
+    for threshold in thresholds:
+        exits = []
+        for file_steps in steps:
+            for window, elapsed, proba in file_steps:
+                if proba.max() >= threshold:
+                    break
+            exits.append((classes[proba.argmax()], window, elapsed))
+        report.append(summary(threshold, *map(list, zip(*exits))))
+    return pd.DataFrame(report)
+
+"""Prediksi banyak file
+
+Prediksi genre untuk seluruh file musik dalam satu folder. Ekstraksi
+fitur dijalankan di proses worker dan prediksi dilakukan per batch pada
+proses utama, hasil ditulis ke file CSV secara bertahap.
+"""
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg", ".flac", ".au")
+
+def cari_musik(directory):
+    """Daftar file audio pada folder dan seluruh subfolder
+
+    Parameters
+    ----------
+    directory : string
+        Jalur folder musik.
+
+    Returns
+    -------
+    filepaths : list of string
+        Jalur file audio, diurutkan berdasarkan nama.
+    """
+    filepaths = []
+    with os.scandir(directory) as it:
+        entries = sorted(it, key= lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir():
+            filepaths += cari_musik(entry.path)
+        elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+            filepaths.append(entry.path)
+    return filepaths
+
+def iter_prediksi(
+    filepaths, artifact, output= None, root= None, n_jobs= 1, batch_size= 64
+):
+    """Prediksi genre banyak file secara streaming
+
+    Generator yang menghasilkan prediksi setiap file berurutan sesuai
+    `filepaths`. Hanya `batch_size` fitur yang ditampung sekaligus, dan
+    setiap batch diprediksi dengan satu pemanggilan `predict_proba`.
+
+    Parameters
+    ----------
+    filepaths : list of string
+        Jalur file musik, lihat `cari_musik`.
+
+    artifact : dict
+        Artefak model dari `muat_model`.
+
+    output : string, default=None
+        Jalur file CSV hasil (filename, predicted_genre, confidence).
+        Baris ditambahkan per batch, file yang gagal tidak ditulis.
+
+    root : string, default=None
+        Jika diberikan, kolom filename berisi jalur relatif terhadap
+        `root`, jika tidak berisi jalur file.
+
+    n_jobs : int, default=1
+        Jumlah proses worker untuk decode dan ekstraksi, lihat
+        `n_workers`.
+
+    batch_size : int, default=64
+        Jumlah file per batch prediksi.
+
+    Yields
+    ------
+    filepath : string
+        Jalur file musik.
+
+    genre : string or None
+        Genre hasil prediksi, None jika ekstraksi gagal.
+
+    confidence : float or None
+        Probabilitas genre hasil prediksi.
+
+    error : string or None
+        Pesan error jika ekstraksi gagal.
+    """
+    schema = artifact["schema"]
+    index = _schema_index(schema)
+    classes = np.asarray(artifact["classes"], dtype= object)
+    results = imap_workers(
+        _ekstraksi_file,
+        (
+            (
+                fp, schema["duration"], schema["coef"], None,
+                schema["offset"], schema["decode"], schema["stats"]
+            )
+            for fp in filepaths
+        ),
+        n_jobs= n_jobs
+    )
+
+    if output is not None:
+        mk_dir(os.path.dirname(output) or ".")
+        pd.DataFrame(
+            columns= ["filename", "predicted_genre", "confidence"]
+        ).to_csv(output, index= False)
+
+    batch = []
+    def flush():
+        valid = [i for i, (_, feature, _) in enumerate(batch) if feature is not None]
+        pred = [(None, None)] * len(batch)
+        if valid:
+            X = np.array([batch[i][1][index] for i in valid], dtype= np.float32)
+            proba = artifact["model"].predict_proba(X)
+            best = proba.argmax(axis= 1)
+            for i, k, p in zip(valid, best, proba[np.arange(len(valid)), best]):
+                pred[i] = (classes[k], float(p))
+
+        if output is not None and valid:
+            pd.DataFrame({
+                "filename": [
+                    os.path.relpath(batch[i][0], root) if root else batch[i][0]
+                    for i in valid
+                ],
+                "predicted_genre": [pred[i][0] for i in valid],
+                "confidence": [pred[i][1] for i in valid]
+            }).to_csv(output, mode= "a", header= False, index= False)
+
+        rows = [(fp, *p, err) for (fp, _, err), p in zip(batch, pred)]
+        batch.clear()
+        return rows
+
+    for fp, (feature, err) in zip(filepaths, results):
+        batch.append((fp, feature, err))
+        if len(batch) >= batch_size:
+            yield from flush()
+    yield from flush()
+
+"""Antrian job di background
+
+Ekstraksi fitur dan pelatihan model dijalankan sebagai job di proses
+terpisah, sehingga sesi Streamlit tidak membeku dan job tetap berjalan
+meskipun pengguna berpindah halaman. Job dengan kunci yang sama (jenis
+job, parameter, dan sidik jari data) tidak dijalankan dua kali: sesi lain
+yang menekan Submit dengan isian yang sama akan mengikuti job yang sudah
+ada.
+"""
+
+JOB_STATUS = ["queued", "running", "done", "failed", "cancelled"]
+
+_JOB_CONN = None
+
+def job_progress(done, total= None, text= "", resumed= None):
+    """Laporkan progress job yang sedang berjalan
+
+    Tidak melakukan apa pun jika dipanggil di luar job, sehingga aman
+    dipanggil dari fungsi pipeline.
+
+    Parameters
+    ----------
+    done : int
+        Jumlah langkah yang sudah selesai.
+
+    total : int, default=None
+        Jumlah seluruh langkah, None jika tidak diketahui.
+
+    text : string, default=""
+        Keterangan langkah.
+
+    resumed : int, default=None
+        Jumlah langkah yang sudah selesai sebelum job dimulai (misal
+        dari checkpoint), cukup dikirim pada panggilan pertama. Langkah
+        ini tidak dihitung dalam kecepatan dan ETA job.
+    """
+    if _JOB_CONN is not None:
+        _JOB_CONN.send(("progress", done, total, text, resumed))
+
+def _run_job(conn, func, args, kwargs):
+    """Jalankan job di proses anak dan kirim hasil melalui pipe"""
+    global _JOB_CONN
+    if hasattr(os, "setpgid"): # worker pool ikut dihentikan saat dibatalkan
+        os.setpgid(0, 0)
+    _JOB_CONN = conn
+    try:
+        conn.send(("done", func(*args, **kwargs)))
+    except Exception as e:
+        conn.send(("failed", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+class Job():
+    """Satu job dalam `JobQueue`
+
+    Attributes
+    ----------
+    id : string
+        Nomor job.
+
+    kind : string
+        Jenis job, misal "ekstraksi" atau "klasifikasi".
+
+    key : string
+        Kunci deduplikasi.
+
+    status : {"queued", "running", "done", "failed", "cancelled"}
+        Status job.
+
+    done, total, text
+        Progress terakhir, lihat `job_progress`.
+
+    resumed : int
+        Jumlah langkah yang dilanjutkan dari checkpoint, lihat
+        `job_progress`.
+
+    result : object
+        Hasil fungsi job jika status "done".
+
+    error : string
+        Pesan error jika status "failed".
+    """
+
+    def __init__(self, id, kind, key, func, args, kwargs):
+        self.id = id
+        self.kind = kind
+        self.key = key
+        self.status = "queued"
+        self.done, self.total, self.text = 0, None, ""
+        self.resumed = 0
+        self.result = None
+        self.error = None
+        self.submitted = time.time()
+        self.started = self.finished = None
+        self._task = (func, args, kwargs)
+        self._process = None
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    @property
+    def elapsed(self):
+        """Lama job berjalan (detik)"""
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+class JobQueue():
+    """Antrian job yang dijalankan di proses background
+
+    Setiap job berjalan di proses anaknya sendiri (maksimal
+    `max_workers` job bersamaan, sisanya mengantri). Progress dikirim
+    dari proses anak melalui pipe dan dibaca oleh thread pemantau,
+    sehingga `get` selalu mengembalikan status terkini tanpa menunggu.
+
+    Parameters
+    ----------
+    max_workers : int, default=1
+        Jumlah job yang berjalan bersamaan. Job ekstraksi dan tuning
+        sudah memakai pool proses sendiri, sehingga default 1.
+
+    history : int, default=20
+        Jumlah job selesai yang disimpan (beserta hasilnya) agar dapat
+        diikuti kembali oleh sesi lain.
+    """
+
+    def __init__(self, max_workers= 1, history= 20):
+        self.max_workers = max_workers
+        self.history = history
+        self._jobs = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def submit(self, kind, func, *args, key= None, **kwargs):
+        """Masukkan job ke antrian
+
+        Jika ada job dengan `key` yang sama yang masih mengantri,
+        sedang berjalan, atau sudah selesai, job tersebut yang
+        dikembalikan dan tidak ada job baru.
+
+        Parameters
+        ----------
+        kind : string
+            Jenis job.
+
+        func : callable
+            Fungsi job (harus dapat di-pickle jika start method bukan
+            fork). Progress dilaporkan dengan `job_progress`.
+
+        *args, **kwargs
+            Argumen untuk `func`.
+
+        key : string, default=None
+            Kunci deduplikasi. Jika None, dihitung dari `kind`, nama
+            fungsi, dan sidik jari argumen.
+
+        Returns
+        -------
+        job : Job
+        """
+        if key is None:
+            key = fingerprint([kind, func.__qualname__, args, kwargs])
+        with self._lock:
+            for job in self._jobs.values():
+                if job.key == key and job.status in ("queued", "running", "done"):
+                    return job
+            self._count += 1
+            job = Job(str(self._count), kind, key, func, args, kwargs)
+            self._jobs[job.id] = job
+            self._prune()
+        self._dispatch()
+        return job
+
+    def get(self, job_id):
+        """Job dengan nomor `job_id`, None jika tidak ada"""
+        return self._jobs.get(job_id)
+
+    def latest(self, kind):
+        """Job terakhir dengan jenis `kind`, None jika belum ada"""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if job.kind == kind]
+        return jobs[-1] if jobs else None
+
+    def jobs(self):
+        """Seluruh job dalam antrian dan riwayat"""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id):
+        """Batalkan job yang mengantri atau sedang berjalan
+
+        Proses job dan seluruh proses worker-nya dihentikan. Checkpoint
+        ekstraksi yang sudah ditulis tetap ada, sehingga job yang sama
+        dilanjutkan saat dijalankan lagi.
+
+        Returns
+        -------
+        cancelled : bool
+            True jika job dibatalkan.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.active:
+                return False
+            running = job.status == "running"
+            job.status = "cancelled"
+            job.finished = time.time()
+        if running:
+            _terminate(job._process)
+        return True
+
+    def shutdown(self):
+        """Batalkan semua job yang belum selesai"""
+        for job in self.jobs():
+            self.cancel(job.id)
+
+    def _prune(self):
+        done = [job.id for job in self._jobs.values() if not job.active]
+        for job_id in done[:max(0, len(done) - self.history)]:
+            del self._jobs[job_id]
+
+    def _dispatch(self):
+        import multiprocessing
+
+        with self._lock:
+            running = sum(job.status == "running" for job in self._jobs.values())
+            queued = [job for job in self._jobs.values() if job.status == "queued"]
+            started = []
+            for job in queued[:max(0, self.max_workers - running)]:
+                recv, send = multiprocessing.Pipe(duplex= False)
+                func, args, kwargs = job._task
+                job._process = multiprocessing.Process(
+                    target= _run_job, args= (send, func, args, kwargs),
+                    name= f"Job-{job.id}-{job.kind}"
+                )
+                job._process.start()
+                if hasattr(os, "setpgid"):
+                    try:
+                        os.setpgid(job._process.pid, job._process.pid)
+                    except OSError: # sudah diatur oleh proses anak
+                        pass
+                send.close()
+                job.status, job.started = "running", time.time()
+                started.append((job, recv))
+
+        for job, recv in started:
+            threading.Thread(
+                target= self._monitor, args= (job, recv),
+                name= f"JobMonitor-{job.id}", daemon= True
+            ).start()
+
+    def _monitor(self, job, conn):
+        status, value = "failed", "Proses job berhenti tanpa hasil"
+        try:
+            while True:
+                message = conn.recv()
+                if message[0] != "progress":
+                    status, value = message
+                    break
+                job.done, job.total, job.text, resumed = message[1:]
+                if resumed is not None:
+                    job.resumed = resumed
+        except (EOFError, OSError):
+            pass
+        finally:
+            conn.close()
+        job._process.join()
+
+        with self._lock:
+            if job.status == "running": # tidak dibatalkan
+                if status == "done":
+                    job.result = value
+                else:
+                    job.error = value
+                job.status, job.finished = status, time.time()
+            job._task = None
+            self._prune()
+        self._dispatch()
+
+def _terminate(process):
+    """Hentikan proses job beserta proses worker dalam grupnya"""
+    import signal
+
+    if process is None or process.pid is None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except (AttributeError, OSError):
+        process.terminate()
+
+_JOB_QUEUE = []
+_JOB_LOCK = threading.Lock()
+
+def job_queue(**kwargs):
+    """Antrian job bersama untuk semua sesi dalam satu proses
+
+    Parameters
+    ----------
+    **kwargs
+        Argumen untuk `JobQueue` saat antrian pertama kali dibuat.
+    """
+    with _JOB_LOCK:
+        if not _JOB_QUEUE:
+            _JOB_QUEUE.append(JobQueue(**kwargs))
+            atexit.register(_JOB_QUEUE[0].shutdown)
+    return _JOB_QUEUE[0]
+
+def tugas_ekstraksi(
+    params, n_jobs= 1, vectorized= False, diagnostics= False,
+    memory_limit= MEMORY_LIMIT, list_path= LIST_PATH,
+    manifest_path= MANIFEST_PATH, path= FEATURE_STORE
+):
+    """Job ekstraksi fitur MFCC ke feature store
+
+    Fitur lama dipakai ulang jika parameter ekstraksi sama, sehingga
+    hanya file yang ditambahkan atau berubah yang diekstrak. Progress
+    dilaporkan per file dan hasil disimpan per batch ke checkpoint,
+    sehingga job yang dibatalkan dilanjutkan saat dijalankan lagi.
+    Indeks lagu mirip (`index_mirip`) ikut diperbarui.
+
+    Parameters
+    ----------
+    params : dict
+        Parameter ekstraksi (duration, coef, offset, decode, stats).
+        `duration` None berarti full track.
+
+    n_jobs, vectorized, memory_limit
+        Lihat `iter_fitur_mfcc`.
+
+    diagnostics : bool, default=False
+        Ukur waktu dan memori per tahap, lihat `profiling`.
+
+    list_path, manifest_path, path
+        Jalur daftar musik, manifest, dan feature store.
+
+    Returns
+    -------
+    result : dict
+        Fitur (df), file yang gagal (errors), catatan instrumentasi
+        (records), dan jalur log diagnostik (log).
+    """
+    df_musik = get_csv(list_path)
+    store, meta = baca_fitur(path)
+    meta = meta or {}
+    hashes = {
+        fp: v["hash"] for fp, v in
+        get_json(manifest_path, {}).get("files", {}).items()
+    }
+
+    # fitur lama dipakai ulang jika parameter ekstraksi sama
+    reuse = hashes and all(
+        meta.get(key) == value for key, value in params.items()
+    ) and store is not None
+    diff = diff_manifest(meta.get("files", {}), {
+        fp: hashes.get(fp) for fp in df_musik.iloc[:, 0]
+    })
+
+    errors, records, log = {}, [], None
+    if reuse and not any(diff.values()):
+        df = fitur_frame(store, meta)
+    else:
+        features = fitur_frame(store, meta) if reuse else None
+        todo = fitur_todo(df_musik, features, diff) if reuse else df_musik
+        checkpoint = (
+            "./data/dataframe/checkpoint/"
+            "mfcc_{duration}_{coef}_{offset}_{decode}_{stats}.csv"
+            .format(**{**params, "stats": "-".join(params["stats"])})
+        )
+        columns = fitur_columns(params["coef"], params["stats"])
+        total = len(todo)
+        done = len(baca_checkpoint(todo, checkpoint, columns))
+        job_progress(done, total, "file", resumed= done)
+
+        with profiling() if diagnostics else nullcontext([]) as records:
+            for filepath, _, err in iter_fitur_mfcc(
+                todo, n_jobs= n_jobs, cache_dir= LOGMEL_CACHE_DIR,
+                vectorized= vectorized, checkpoint= checkpoint,
+                memory_limit= memory_limit, **params
+            ):
+                done += 1
+                if err:
+                    errors[filepath] = err
+                job_progress(done, total, "file")
+
+        df = baca_checkpoint(todo, checkpoint, columns)
+        if reuse:
+            df = merge_fitur(df_musik, features, df)
+
+        simpan_fitur(df, {
+            **params,
+            "files": {fp: hashes.get(fp) for fp in df_musik.iloc[:, 0]}
+        }, path= path)
+        index_mirip(path)
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        if records:
+            log = simpan_profil(
+                records, "ekstraksi", n_jobs= n_jobs, vectorized= vectorized,
+                **params
+            )
+
+    df.attrs["errors"] = errors
+    return {"df": df, "errors": errors, "records": records, "log": log}
+
+def tugas_klasifikasi(
+    mode, K= 5, params= None, search= "Grid", factor= 3, max_fits= None,
+    time_budget= None, n_jobs= 1, save_model= True, diagnostics= False,
+    validation= "kfold", path= FEATURE_STORE, model_path= MODEL_PATH
+):
+    """Job pelatihan model dengan validasi KFold atau out-of-bag
+
+    Parameters
+    ----------
+    mode : {"Set", "Tune", "Default"}
+        "Set" melatih satu set parameter (`basic_model`), "Tune" mencari
+        parameter terbaik dari grid (`tuned_model` atau
+        `halving_model`), dan "Default" memakai parameter default.
+
+    K : int, default=5
+        Jumlah subset Fold.
+
+    params : dict or list, default=None
+        Parameter `basic_model` (dict) untuk "Set", atau grid nilai
+        parameter (list) untuk "Tune".
+
+    search : {"Grid", "Successive Halving"}, default="Grid"
+        Metode tuning.
+
+    factor, max_fits, time_budget
+        Lihat `halving_model`.
+
+    n_jobs : int, default=1
+        Jumlah core CPU untuk tuning.
+
+    save_model : bool, default=True
+        Latih ulang parameter terbaik pada seluruh data dan simpan
+        artefak model (`simpan_model`).
+
+    diagnostics : bool, default=False
+        Ukur waktu dan memori per tahap, lihat `profiling`.
+
+    validation : {"kfold", "oob"}, default="kfold"
+        Jenis validasi, lihat `basic_model`. Successive halving hanya
+        mendukung "kfold".
+
+    path, model_path
+        Jalur feature store dan artefak model.
+
+    Returns
+    -------
+    result : dict
+        Jenis parameter (mode), nilai metrics (score), parameter
+        (params), info successive halving (info), jenis validasi, jumlah
+        fit, dan waktu pelatihan (validasi), waktu artefak model
+        (created), catatan instrumentasi (records), dan jalur log
+        diagnostik (log).
+    """
+    features, meta = baca_fitur(path)
+    if features is None:
+        raise FileNotFoundError(f"Feature store tidak ditemukan: {path}")
+    labels = meta["labels"]
+
+    if mode == "Tune" and search == "Successive Halving" and validation != "kfold":
+        raise ValueError("Successive halving hanya mendukung validasi KFold")
+
+    info = created = log = None
+    job_progress(0, None, "fold")
+    with profiling() if diagnostics else nullcontext([]) as records:
+        if mode == "Set":
+            score, params = basic_model(
+                features, labels, K= K, validation= validation, **params
+            )
+        elif mode == "Tune" and search == "Successive Halving":
+            score, params, info = halving_model(
+                features, labels, params, K= K, factor= factor,
+                max_fits= max_fits, time_budget= time_budget, n_jobs= n_jobs
+            )
+        elif mode == "Tune":
+            score, params = tuned_model(
+                features, labels, params, K= K, n_jobs= n_jobs,
+                validation= validation
+            )
+        else:
+            score, params = basic_model(
+                features, labels, K= K, validation= validation
+            )
+
+        if save_model:
+            job_progress(0, None, "simpan model")
+            schema = {
+                key: meta[key] for key in
+                ["duration", "coef", "offset", "decode", "stats", "columns"]
+            }
+            created = simpan_model(
+                features, labels, params.iloc[0].to_dict(), schema,
+                metrics= score.iloc[0].to_dict(), path= model_path
+            )["created"]
+
+    if records:
+        log = simpan_profil(
+            records, "klasifikasi", K= K, mode= mode, validation= validation
+        )
+    return {
+        "mode": mode, "score": score, "params": params, "info": info,
+        "validasi": {**score.attrs.get("validasi", {}), "K": K},
+        "created": created,
+        "records": records, "log": log
+    }